@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from typing import Callable, Dict
+
+import pygame
+
+from model import bullet
+from model.bullet import EnemyBullet, PlayerBullet, Projectile
+from model.projectile_system import ProjectileSystem
+import settings
+
+SPREAD_SHOTS = 8
+ARCHERS = 10
+ARCHER_DELAY_FRAMES = 120
+
+
+def _legacy(
+    cls: type[Projectile], x: float, y: float, dx: float, dy: float
+) -> Projectile:
+    shot = object.__new__(cls)
+    Projectile.reset(shot, x, y, dx, dy)
+    if cls is PlayerBullet:
+        size = int(bullet.PROJECTILE_SIZE * shot.scale_sprite)
+        base = bullet.PROJECTILE_BASE.convert_alpha()
+        shot.image = pygame.transform.scale(base, (size, size))
+        bullet.ALLOCATIONS["sprites"] += 2
+    else:
+        base = bullet.ARROW_BASE.convert_alpha()
+        w = int(base.get_width() * shot.scale_sprite)
+        h = int(base.get_height() * shot.scale_sprite)
+        angle = -math.degrees(math.atan2(dy, dx)) - bullet.ARROW_ROT_OFFSET
+        scaled = pygame.transform.scale(base, (w, h))
+        shot.image = pygame.transform.rotate(scaled, angle)
+        bullet.ALLOCATIONS["sprites"] += 3
+    bullet.ALLOCATIONS["bullets"] += 1
+    return shot
+
+
+def _pooled(
+    cls: type[Projectile], x: float, y: float, dx: float, dy: float
+) -> Projectile:
+    return cls.acquire(x, y, dx, dy)
+
+
+def _run(
+    make: Callable[[type[Projectile], float, float, float, float], Projectile],
+    frames: int,
+) -> Dict[str, float]:
+    for key in bullet.ALLOCATIONS:
+        bullet.ALLOCATIONS[key] = 0
+    shots = ProjectileSystem()
+    cx, cy = settings.WORLD_W // 2, settings.WORLD_H // 2
+    fire_every = max(1, settings.PLAYER_FIRE_DELAY * settings.FPS // 1_000)
+    spawn_time = 0.0
+    for frame in range(frames):
+        start = time.perf_counter()
+        if frame % fire_every == 0:
+            speed = settings.BULLET_SPEED
+            for i in range(SPREAD_SHOTS):
+                a = 2 * math.pi * i / SPREAD_SHOTS
+                shot = make(PlayerBullet, cx, cy, speed * math.cos(a), speed * math.sin(a))
+                shots.append(shot)
+        if frame % ARCHER_DELAY_FRAMES == 0:
+            speed = settings.ENEMY_BULLET_SPEED
+            for i in range(ARCHERS):
+                a = 2 * math.pi * i / ARCHERS + frame
+                shot = make(EnemyBullet, cx, cy, speed * math.cos(a), speed * math.sin(a))
+                shots.append(shot)
+        spawn_time += time.perf_counter() - start
+        shots.clear()
+    return {
+        "bullets/frame": bullet.ALLOCATIONS["bullets"] / frames,
+        "sprites/frame": bullet.ALLOCATIONS["sprites"] / frames,
+        "spawn ms/frame": spawn_time / frames * 1_000,
+    }
+
+
+def run(frames: int) -> None:
+    pygame.display.set_mode((1, 1))
+    legacy = _run(_legacy, frames)
+    pooled = _run(_pooled, frames)
+    print(f"{frames} frames: {SPREAD_SHOTS}-way spread, {ARCHERS} archer volleys")
+    print(f"{'':>16} {'legacy':>10} {'pooled':>10}")
+    for key in legacy:
+        print(f"{key:>16} {legacy[key]:>10.3f} {pooled[key]:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-frame projectile allocations")
+    parser.add_argument("--frames", type=int, default=3_600)
+    args = parser.parse_args()
+    run(args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict
+
+import pygame
+
+from controller.game import GameController
+from model.effects import DeathEffect
+from model.enemy import Enemy
+from model.wave_manager import WaveManager
+from model.zombie_archer import ZombieArcher
+from view.camera import calc_cam
+import settings
+
+EFFECT_SHARE = 0.1
+
+
+def _populate(game: GameController, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    kinds = WaveManager.KINDS
+    for i in range(count):
+        x = rng.uniform(0, settings.WORLD_W)
+        y = rng.uniform(0, settings.WORLD_H)
+        kind = kinds[i % len(kinds)]
+        if kind is ZombieArcher:
+            enemy: Enemy = ZombieArcher(
+                x, y, game.player, game.projectiles, clock=game.game_clock
+            )
+        else:
+            enemy = kind(x, y, game.player, clock=game.game_clock)
+        game.wave_mgr.enemies.append(enemy)
+        game.enemy_tree.insert(enemy, enemy.collision_rect())
+        if rng.random() < EFFECT_SHARE:
+            effect = DeathEffect(x, y, enemy.death_frames(), game.game_clock)
+            game.effects.append(effect)
+            game.effect_tree.insert(effect, effect.bounds())
+
+
+def _time(game: GameController, culling: bool, frames: int) -> Dict[str, float]:
+    renderer = game.renderer
+    renderer.culling = culling
+    start = time.perf_counter()
+    for _ in range(frames):
+        renderer.draw_battle(game)
+    spent = time.perf_counter() - start
+    return {"ms/frame": spent / frames * 1_000, **renderer.cull_counts}
+
+
+def run(counts: list[int], frames: int, seed: int) -> None:
+    surf = pygame.display.set_mode((settings.SCREEN_W, settings.SCREEN_H))
+    print(f"{settings.SCREEN_W}x{settings.SCREEN_H}, enemies spread over the arena")
+    print(f"{'enemies':>8} {'mode':>6} {'ms/frame':>9} {'drawn':>7} {'culled':>7}")
+    for count in counts:
+        game = GameController(surf)
+        game.cam = calc_cam(game.player.rect)
+        _populate(game, count, seed)
+        for culling in (False, True):
+            res = _time(game, culling, frames)
+            mode = "cull" if culling else "all"
+            drawn = res.get("drawn", 0)
+            culled = res.get("culled", 0)
+            print(f"{count:>8} {mode:>6} {res['ms/frame']:>9.3f} {drawn:>7} {culled:>7}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render-pass camera culling")
+    parser.add_argument("counts", type=int, nargs="*", default=[100, 500, 2_000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.counts, args.frames, args.seed)
+
+
+if __name__ == "__main__":
+    main()
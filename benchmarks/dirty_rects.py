@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+import pygame
+
+from controller.shop import ShopController
+from model.clock import GameClock
+from model.game_map import GameMap
+from model.player import Player
+from view.camera import calc_cam
+from view.dirty import DirtyRects
+from view.renderer import Renderer
+import settings
+from . import ROOT_DIR
+
+SHOP = Path("assets/maps/shop.tmx")
+
+
+def _time(frame: Callable[[int], None], dirty: DirtyRects, frames: int) -> Dict[str, float]:
+    for key in dirty.stats:
+        dirty.stats[key] = 0
+    dirty.invalidate()
+    start = time.perf_counter()
+    for i in range(frames):
+        frame(i)
+    spent = time.perf_counter() - start
+    return {"ms/frame": spent / frames * 1_000, **dirty.stats}
+
+
+def _pause(renderer: Renderer) -> Callable[[int], None]:
+    def frame(i: int) -> None:
+        renderer.draw_pause(i % 180 < 20, False)
+    return frame
+
+
+def _shop(shop: ShopController) -> Callable[[int], None]:
+    def frame(i: int) -> None:
+        shop.player.orbital_phase += settings.ORBITAL_SPEED
+        shop.cam = calc_cam(shop.player.rect)
+        shop._draw()
+    return frame
+
+
+def run(frames: int) -> None:
+    surf = pygame.display.set_mode((settings.SCREEN_W, settings.SCREEN_H))
+    renderer = Renderer(surf)
+    game_map = GameMap(ROOT_DIR / SHOP)
+    settings.WORLD_W, settings.WORLD_H = game_map.width, game_map.height
+    player = Player(0, 0, clock=GameClock())
+    player.add_orbital()
+    shop = ShopController(surf, player, game_map, 1)
+    scenes = {
+        "pause": (_pause(renderer), renderer.dirty),
+        "shop idle": (_shop(shop), shop.dirty),
+    }
+    print(f"{settings.SCREEN_W}x{settings.SCREEN_H}, {frames} frames per scene")
+    print(f"{'scene':>10} {'mode':>6} {'ms/frame':>9} {'full':>6} {'partial':>8} {'skipped':>8}")
+    for name, (frame, dirty) in scenes.items():
+        for enabled in (False, True):
+            dirty.enabled = enabled
+            res = _time(frame, dirty, frames)
+            mode = "dirty" if enabled else "flip"
+            print(
+                f"{name:>10} {mode:>6} {res['ms/frame']:>9.3f} {res['full']:>6}"
+                f" {res['partial']:>8} {res['skipped']:>8}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Full flips vs dirty-rect presents")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+    run(args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict
+
+import pygame
+
+from controller.arena import _update_enemies
+from controller.game import GameController
+from controller.input_handler import InputHandler
+from model.enemy import Enemy
+from model.wave_manager import WaveManager
+from model.zombie_archer import ZombieArcher
+from view.camera import calc_cam
+import settings
+
+LIVES = 1_000_000
+MODES = {
+    "frozen": {"ENEMY_LOD": False},
+    "lod": {"ENEMY_LOD": True},
+    "full": {"ENEMY_LOD": False, "ENEMY_UPDATE_MARGIN": None},
+}
+
+
+def _populate(game: GameController, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    kinds = WaveManager.KINDS
+    for i in range(count):
+        x = rng.uniform(0, settings.WORLD_W)
+        y = rng.uniform(0, settings.WORLD_H)
+        kind = kinds[i % len(kinds)]
+        if kind is ZombieArcher:
+            enemy: Enemy = ZombieArcher(
+                x, y, game.player, game.projectiles, clock=game.game_clock
+            )
+        else:
+            enemy = kind(x, y, game.player, clock=game.game_clock)
+        game.wave_mgr.enemies.append(enemy)
+        game.enemy_tree.insert(enemy, enemy.collision_rect())
+
+
+def _time(surf: pygame.Surface, count: int, frames: int, seed: int) -> float:
+    game = GameController(surf, headless=True, seed=seed)
+    game.input = InputHandler(game.game_clock)
+    game.wave_mgr._pending = []
+    game.cam = calc_cam(game.player.rect)
+    if settings.ENEMY_UPDATE_MARGIN is None:
+        settings.ENEMY_UPDATE_MARGIN = max(settings.WORLD_W, settings.WORLD_H)
+    _populate(game, count, seed)
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.player.lives = LIVES
+        game.game_clock.step(game.timestep.step_ms)
+        _update_enemies(game)
+    return (time.perf_counter() - start) / frames * 1_000
+
+
+def run(counts: list[int], frames: int, seed: int) -> Dict[int, Dict[str, float]]:
+    surf = pygame.display.set_mode((1, 1))
+    saved = {key: getattr(settings, key) for mode in MODES.values() for key in mode}
+    res: Dict[int, Dict[str, float]] = {}
+    try:
+        for count in counts:
+            res[count] = {}
+            for mode, values in MODES.items():
+                for key, value in values.items():
+                    setattr(settings, key, value)
+                res[count][mode] = _time(surf, count, frames, seed)
+                for key, value in saved.items():
+                    setattr(settings, key, value)
+    finally:
+        for key, value in saved.items():
+            setattr(settings, key, value)
+    return res
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Enemy update cost by level of detail")
+    parser.add_argument("counts", type=int, nargs="*", default=[100, 500, 2_000])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    res = run(args.counts, args.frames, args.seed)
+    print(f"{settings.SCREEN_W}x{settings.SCREEN_H}, enemies spread over the arena, ms/step")
+    print(f"{'enemies':>8}" + "".join(f" {mode:>8}" for mode in MODES))
+    for count, row in res.items():
+        print(f"{count:>8}" + "".join(f" {row[mode]:>8.3f}" for mode in MODES))
+
+
+if __name__ == "__main__":
+    main()
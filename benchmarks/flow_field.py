@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from typing import Dict
+
+import numpy as np
+import pygame
+
+from controller.arena import _update_enemies
+from controller.game import GameController
+from controller.input_handler import InputHandler
+from model.enemy import Enemy
+from model.flow_field import FlowField
+from model.wave_manager import WaveManager
+from model.zombie_archer import ZombieArcher
+from view.camera import calc_cam
+import settings
+
+LIVES = 1_000_000
+
+
+def _populate(game: GameController, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    cells = np.argwhere(~game.map.occupancy[game.door_open]).tolist()
+    kinds = WaveManager.KINDS
+    for i in range(count):
+        kind = kinds[i % len(kinds)]
+        while True:
+            ty, tx = rng.choice(cells)
+            x = (tx + 0.5) * game.map.tile_w
+            y = (ty + 0.5) * game.map.tile_h
+            if kind is ZombieArcher:
+                enemy: Enemy = ZombieArcher(
+                    x, y, game.player, game.projectiles, clock=game.game_clock
+                )
+            else:
+                enemy = kind(x, y, game.player, clock=game.game_clock)
+            if not game.map.rect_in_wall(enemy.collision_rect(), game.door_open):
+                break
+        enemy.flow = game.flow
+        game.wave_mgr.enemies.append(enemy)
+        game.enemy_tree.insert(enemy, enemy.collision_rect())
+
+
+def _run(surf: pygame.Surface, flow: bool, count: int, steps: int, seed: int) -> Dict[str, float]:
+    game = GameController(surf, headless=True, seed=seed)
+    game.input = InputHandler(game.game_clock)
+    game.wave_mgr._pending = []
+    game.cam = calc_cam(game.player.rect)
+    if flow:
+        game.flow = FlowField(game.map, rings_per_step=1 << 16)
+        game.flow.update(*game.player.rect.center, game.door_open)
+    else:
+        game.flow = None
+    _populate(game, count, seed)
+    start = time.perf_counter()
+    for _ in range(steps):
+        game.player.lives = LIVES
+        game.game_clock.step(game.timestep.step_ms)
+        _update_enemies(game)
+        game.wave_mgr.enemies[:] = [z for z in game.wave_mgr.enemies if z.alive]
+    spent = time.perf_counter() - start
+    left = game.wave_mgr.enemies
+    px, py = game.player.rect.center
+    gap = [math.hypot(z.x - px, z.y - py) for z in left]
+    return {
+        "ms/step": spent / steps * 1_000,
+        "reached": count - len(left),
+        "gap": float(np.mean(gap)) if gap else 0.0,
+    }
+
+
+def _rebuild(surf: pygame.Surface, seed: int, builds: int) -> Dict[str, float]:
+    game = GameController(surf, headless=True, seed=seed)
+    field = FlowField(game.map)
+    rng = random.Random(seed)
+    cells = np.argwhere(~game.map.occupancy[False]).tolist()
+    total = worst = 0.0
+    steps = 0
+    for _ in range(builds):
+        ty, tx = rng.choice(cells)
+        x, y = (tx + 0.5) * field.tile_w, (ty + 0.5) * field.tile_h
+        while True:
+            start = time.perf_counter()
+            done = field.update(x, y, False)
+            spent = time.perf_counter() - start
+            total += spent
+            worst = max(worst, spent)
+            steps += 1
+            if done:
+                break
+    return {
+        "build ms": total / builds * 1_000,
+        "steps": steps / builds,
+        "worst step ms": worst * 1_000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Flow-field pathing against straight chase")
+    parser.add_argument("counts", type=int, nargs="*", default=[50, 200])
+    parser.add_argument("--steps", type=int, default=600)
+    parser.add_argument("--builds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    surf = pygame.display.set_mode((1, 1))
+    res = _rebuild(surf, args.seed, args.builds)
+    print(
+        f"rebuild: {res['build ms']:.2f} ms over {res['steps']:.1f} steps,"
+        f" worst step {res['worst step ms']:.2f} ms ({settings.FLOW_RINGS_PER_STEP} rings/step)"
+    )
+    print(f"{'enemies':>8} {'mode':>8} {'ms/step':>8} {'reached':>8} {'gap px':>7}")
+    for count in args.counts:
+        for flow in (False, True):
+            row = _run(surf, flow, count, args.steps, args.seed)
+            mode = "flow" if flow else "straight"
+            print(
+                f"{count:>8} {mode:>8} {row['ms/step']:>8.3f}"
+                f" {row['reached']:>8} {row['gap']:>7.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
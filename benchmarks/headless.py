@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import pygame
+
+from controller.game import GameController
+from controller.headless import run
+from controller.state_digest import DigestTrace
+import settings
+import tracing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Arena simulation without a renderer")
+    parser.add_argument("--frames", type=int, default=36_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--lives", type=int, default=None)
+    parser.add_argument("--trace", type=Path, default=None)
+    parser.add_argument("--record", type=Path, default=None)
+    parser.add_argument("--digest", type=Path, default=None)
+    args = parser.parse_args()
+    if args.trace:
+        tracing.start(args.trace)
+    surf = pygame.display.set_mode((1, 1))
+    game = GameController(surf, headless=True, seed=args.seed)
+    if args.lives is not None:
+        game.player.lives = args.lives
+    if args.record:
+        game.record(args.record)
+    trace = DigestTrace(args.digest) if args.digest else None
+    res = run(game, args.frames, trace)
+    speed = res["game_seconds"] / res["seconds"]
+    print(f"{res['frames']} frames ({res['game_seconds']:.0f} s of play) in {res['seconds']:.2f} s")
+    print(f"{res['fps']:.0f} frames/s, {speed:.1f}x real time")
+    print(
+        f"wave {res['wave']}/{settings.TOTAL_WAVES}, lives {res['lives']},"
+        f" kills {res['kills']}, enemies left {res['enemies']}"
+    )
+    if trace is not None:
+        trace.close()
+        print(f"wrote {args.digest} ({trace.frames} frames)")
+    if args.record:
+        game.stop_recording()
+        print(f"wrote {args.record} (seed {game.seed})")
+    if args.trace:
+        tracing.stop()
+        print(f"wrote {args.trace}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict
+
+import pygame
+
+from controller import debug
+from view.pause import pause_menu
+from view.renderer import Renderer
+from view.rooms import Rooms
+import settings
+
+
+def _measure(screen: Callable[[], object], seconds: float, key: int) -> Dict[str, float]:
+    ms = int(seconds * 1_000)
+    pygame.time.set_timer(pygame.event.Event(pygame.KEYDOWN, key=key), ms, 1)
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    screen()
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    return {"cpu %": cpu / wall * 100, "exit lag ms": wall * 1_000 - ms}
+
+
+def run(seconds: float) -> None:
+    surf = pygame.display.set_mode((settings.SCREEN_W, settings.SCREEN_H))
+    clock = pygame.time.Clock()
+    debug.SHOW_HITBOXES = False
+    screens = {
+        "pause": (lambda: pause_menu(Renderer(surf), clock), pygame.K_ESCAPE),
+        "game over": (lambda: Rooms.game_over_screen(surf), pygame.K_RETURN),
+    }
+    idle_wait, dirty = settings.IDLE_WAIT_MS, settings.DIRTY_RECTS
+    print(f"{settings.SCREEN_W}x{settings.SCREEN_H}, {seconds:.1f} s idle per screen")
+    print(f"{'screen':>10} {'loop':>8} {'cpu %':>7} {'exit lag ms':>12}")
+    for name, (screen, key) in screens.items():
+        for label, wait, rects in (("tick", 0, False), ("event", idle_wait, dirty)):
+            settings.IDLE_WAIT_MS, settings.DIRTY_RECTS = wait, rects
+            res = _measure(screen, seconds, key)
+            print(f"{name:>10} {label:>8} {res['cpu %']:>7.1f} {res['exit lag ms']:>12.1f}")
+    settings.IDLE_WAIT_MS, settings.DIRTY_RECTS = idle_wait, dirty
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CPU use of idle UI screens")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    run(args.seconds)
+
+
+if __name__ == "__main__":
+    main()
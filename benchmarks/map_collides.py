@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import pygame
+
+from model.game_map import GameMap
+import settings
+from . import ROOT_DIR
+
+MAPS = (Path("assets/maps/arena.tmx"), Path("assets/maps/shop.tmx"))
+
+
+def run(maps: tuple[Path, ...], scale: float) -> None:
+    pygame.display.set_mode((1, 1))
+    print(f"{'map':>10} {'set':>14} {'tiles':>7} {'rects':>7} {'reduction':>10}")
+    for path in maps:
+        game_map = GameMap(ROOT_DIR / path, scale)
+        for name, (tiles, rects) in game_map.rect_stats.items():
+            cut = 1 - rects / tiles if tiles else 0.0
+            print(f"{path.stem:>10} {name:>14} {tiles:>7} {rects:>7} {cut:>9.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Collision rect merging per map")
+    parser.add_argument("maps", type=Path, nargs="*", default=list(MAPS))
+    parser.add_argument("--scale", type=float, default=settings.MAP_SCALE)
+    args = parser.parse_args()
+    run(tuple(args.maps), args.scale)
+
+
+if __name__ == "__main__":
+    main()
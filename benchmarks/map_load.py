@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+import shutil
+import time
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+from model.game_map import GameMap
+import settings
+from . import ROOT_DIR
+
+MAPS = (Path("assets/maps/arena.tmx"), Path("assets/maps/shop.tmx"))
+
+
+def _startup(maps: tuple[Path, ...], baked: bool) -> float:
+    start = time.perf_counter()
+    for path in maps:
+        GameMap(ROOT_DIR / path, settings.MAP_SCALE, baked=baked)
+    return (time.perf_counter() - start) * 1_000
+
+
+def _best(fn: Callable[[], float], repeat: int) -> float:
+    return min(fn() for _ in range(repeat))
+
+
+def run(maps: tuple[Path, ...], repeat: int) -> None:
+    pygame.display.set_mode((settings.SCREEN_W, settings.SCREEN_H))
+    cache = settings.MAP_CACHE_DIR
+    shutil.rmtree(cache, ignore_errors=True)
+    cold = _best(lambda: _startup(maps, baked=False), repeat)
+    first = _startup(maps, baked=True)
+    warm = _best(lambda: _startup(maps, baked=True), repeat)
+    size = sum(f.stat().st_size for f in cache.rglob("*") if f.is_file())
+    names = ", ".join(p.stem for p in maps)
+    print(f"startup for {names} (best of {repeat})")
+    print(f"{'cold TMX':>16} {cold:>9.1f} ms")
+    print(f"{'TMX + bake':>16} {first:>9.1f} ms")
+    print(f"{'baked':>16} {warm:>9.1f} ms  {cold / warm:.1f}x faster")
+    print(f"{'cache on disk':>16} {size / 2**20:>9.2f} MB  {cache}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold TMX vs baked map startup")
+    parser.add_argument("maps", type=Path, nargs="*", default=list(MAPS))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(tuple(args.maps), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pygame
+from pytmx import load_pygame
+
+from model.game_map import DOOR_LAYERS, GameMap
+import settings
+from . import ROOT_DIR
+
+MAPS = (Path("assets/maps/arena.tmx"), Path("assets/maps/shop.tmx"))
+
+
+def _bake(game_map: GameMap, layers: List) -> pygame.Surface:
+    tw, th = game_map.tile_w, game_map.tile_h
+    surf = pygame.Surface((game_map.width, game_map.height), pygame.SRCALPHA)
+    for layer in layers:
+        for x, y, tile in layer.tiles():
+            surf.blit(pygame.transform.scale(tile, (tw, th)), (x * tw, y * th))
+    return surf
+
+
+def _world_surfaces(game_map: GameMap, path: Path) -> Dict[str, pygame.Surface]:
+    tmx = load_pygame(path)
+    doors = {name for names in DOOR_LAYERS.values() for name in names}
+    base = [l for l in tmx.visible_layers if hasattr(l, "tiles") and l.name not in doors]
+    surfaces = {"base": _bake(game_map, base)}
+    for door_open, names in DOOR_LAYERS.items():
+        layers = [tmx.get_layer_by_name(n) for n in names if n in tmx.layernames]
+        surfaces[f"doors {door_open}"] = _bake(game_map, layers)
+    return surfaces
+
+
+def _path(game_map: GameMap, frames: int, size: tuple[int, int]) -> List[tuple[int, int]]:
+    span_x = max(0, game_map.width - size[0])
+    span_y = max(0, game_map.height - size[1])
+    return [
+        (
+            int(span_x * (0.5 + 0.5 * math.sin(f / 97))),
+            int(span_y * (0.5 + 0.5 * math.cos(f / 61))),
+        )
+        for f in range(frames)
+    ]
+
+
+def run(maps: tuple[Path, ...], frames: int) -> None:
+    screen = pygame.display.set_mode((settings.SCREEN_W, settings.SCREEN_H))
+    print(f"{settings.SCREEN_W}x{settings.SCREEN_H}, {frames} panning frames")
+    print(f"{'map':>8} {'mode':>8} {'MB':>8} {'draw ms':>9} {'first ms':>9}")
+    for path in maps:
+        game_map = GameMap(ROOT_DIR / path)
+        cams = _path(game_map, frames, screen.get_size())
+        start = time.perf_counter()
+        world = _world_surfaces(game_map, ROOT_DIR / path)
+        baked = time.perf_counter() - start
+        start = time.perf_counter()
+        for i, cam in enumerate(cams):
+            screen.blit(world["base"], (-cam[0], -cam[1]))
+            screen.blit(world[f"doors {i % 120 < 60}"], (-cam[0], -cam[1]))
+        full = (time.perf_counter() - start) / frames * 1_000
+        full_mb = sum(s.get_bytesize() * s.get_width() * s.get_height() for s in world.values())
+        print(f"{path.stem:>8} {'world':>8} {full_mb / 2**20:>8.1f} {full:>9.3f} {baked * 1_000:>9.1f}")
+        start = time.perf_counter()
+        game_map.draw(screen, cams[0], False)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for i, cam in enumerate(cams):
+            game_map.draw(screen, cam, i % 120 < 60)
+        chunked = (time.perf_counter() - start) / frames * 1_000
+        chunk_mb = game_map.chunks.nbytes() / 2**20
+        print(f"{path.stem:>8} {'chunked':>8} {chunk_mb:>8.1f} {chunked:>9.3f} {first * 1_000:>9.1f}")
+        cache = game_map.chunks
+        print(f"{'':>8} chunks {len(cache)}/{cache.capacity}, hits {cache.hits}, misses {cache.misses}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="World-surface vs chunked map drawing")
+    parser.add_argument("maps", type=Path, nargs="*", default=list(MAPS))
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+    run(tuple(args.maps), args.frames)
+
+
+if __name__ == "__main__":
+    main()
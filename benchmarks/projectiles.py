@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import time
+from typing import Callable, List
+
+import pygame
+
+from model.bullet import OWNER_ENEMY, OWNER_PLAYER, EnemyBullet, PlayerBullet, Projectile
+from model.game_map import GameMap
+from model.projectile_system import ProjectileSystem
+from model.spatial_hash import SpatialHash
+import settings
+from . import ROOT_DIR
+
+FRAME_BUDGET_MS = 1_000 / settings.FPS
+ENEMIES = 300
+ENEMY_SIZE = 60
+
+
+def _spawn(rng: random.Random, cam: tuple[int, int]) -> Projectile:
+    cls = PlayerBullet if rng.random() < 0.8 else EnemyBullet
+    x = cam[0] + rng.uniform(0, settings.SCREEN_W)
+    y = cam[1] + rng.uniform(0, settings.SCREEN_H)
+    ang = rng.uniform(0, 2 * math.pi)
+    speed = settings.BULLET_SPEED
+    return cls(x, y, speed * math.cos(ang), speed * math.sin(ang))
+
+
+def _enemy_index(rng: random.Random, cam: tuple[int, int]) -> SpatialHash:
+    index = SpatialHash(settings.SPATIAL_CELL)
+    for i in range(ENEMIES):
+        x = cam[0] + rng.uniform(0, settings.SCREEN_W)
+        y = cam[1] + rng.uniform(0, settings.SCREEN_H)
+        index.insert(i, pygame.Rect(x, y, ENEMY_SIZE, ENEMY_SIZE))
+    return index
+
+
+def _frame_objects(
+    bullets: List[Projectile],
+    game_map: GameMap,
+    index: SpatialHash,
+    player: pygame.Rect,
+    cam: tuple[int, int],
+    surf: pygame.Surface,
+) -> float:
+    screen_rect = pygame.Rect(0, 0, settings.SCREEN_W, settings.SCREEN_H)
+    for b in bullets[:]:
+        b.update()
+        hit_wall = game_map.rect_in_wall(b.rect(), False)
+        off = not screen_rect.colliderect(b.rect().move(-cam[0], -cam[1]))
+        if hit_wall or b.off_world() or off:
+            bullets.remove(b)
+    for b in bullets[:]:
+        if b.OWNER == OWNER_PLAYER:
+            if index.query_point(b.x, b.y):
+                bullets.remove(b)
+        elif player.collidepoint(b.x, b.y):
+            bullets.remove(b)
+    mark = time.perf_counter()
+    surf.blits(
+        [(b.image, b.rect().move(-cam[0], -cam[1])) for b in bullets]
+    )
+    return mark
+
+
+def _frame_system(
+    shots: ProjectileSystem,
+    game_map: GameMap,
+    index: SpatialHash,
+    player: pygame.Rect,
+    cam: tuple[int, int],
+    surf: pygame.Surface,
+) -> float:
+    shots.step(game_map, False, cam)
+    for i in shots.near(index, OWNER_PLAYER):
+        if index.query_point(*shots.position(i)):
+            shots.kill(i)
+    for i in shots.inside(player, OWNER_ENEMY):
+        shots.kill(i)
+    shots.compact()
+    mark = time.perf_counter()
+    surf.blits(shots.blit_pairs(cam))
+    return mark
+
+
+def _run(
+    frame: Callable[[], float], refill: Callable[[], None], frames: int
+) -> List[tuple[float, float]]:
+    times: List[tuple[float, float]] = []
+    for _ in range(frames):
+        refill()
+        start = time.perf_counter()
+        mark = frame()
+        end = time.perf_counter()
+        times.append(((mark - start) * 1_000, (end - mark) * 1_000))
+    return times
+
+
+def run(count: int, frames: int, seed: int) -> None:
+    surf = pygame.display.set_mode((settings.SCREEN_W, settings.SCREEN_H))
+    game_map = GameMap(ROOT_DIR / "assets" / "maps" / "arena.tmx", settings.MAP_SCALE)
+    settings.WORLD_W, settings.WORLD_H = game_map.width, game_map.height
+    cam = (
+        (settings.WORLD_W - settings.SCREEN_W) // 2,
+        (settings.WORLD_H - settings.SCREEN_H) // 2,
+    )
+    player = pygame.Rect(0, 0, 60, 80)
+    player.center = (cam[0] + settings.SCREEN_W // 2, cam[1] + settings.SCREEN_H // 2)
+
+    rng = random.Random(seed)
+    index = _enemy_index(rng, cam)
+    bullets: List[Projectile] = []
+
+    def refill_objects() -> None:
+        while len(bullets) < count:
+            bullets.append(_spawn(rng, cam))
+
+    objects = _run(
+        lambda: _frame_objects(bullets, game_map, index, player, cam, surf),
+        refill_objects,
+        frames,
+    )
+
+    rng = random.Random(seed)
+    index = _enemy_index(rng, cam)
+    shots = ProjectileSystem()
+
+    def refill_system() -> None:
+        while len(shots) < count:
+            shots.append(_spawn(rng, cam))
+
+    system = _run(
+        lambda: _frame_system(shots, game_map, index, player, cam, surf),
+        refill_system,
+        frames,
+    )
+
+    print(f"{count} live projectiles, {frames} frames, budget {FRAME_BUDGET_MS:.1f} ms")
+    for name, times in (("objects", objects), ("ProjectileSystem", system)):
+        sim = sum(t[0] for t in times) / len(times)
+        draw = sum(t[1] for t in times) / len(times)
+        worst = max(t[0] + t[1] for t in times)
+        print(
+            f"{name:>18}: simulate {sim:7.2f} ms  draw {draw:7.2f} ms  "
+            f"worst frame {worst:7.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Projectile update/cull/draw cost")
+    parser.add_argument("--count", type=int, default=5_000)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.count, args.frames, args.seed)
+
+
+if __name__ == "__main__":
+    main()
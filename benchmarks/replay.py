@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pygame
+
+from controller.game import GameController
+from controller.replay import ReplayInput, load
+from controller.state_digest import DigestTrace
+import settings
+
+
+def _stats(samples: list[int]) -> Dict[str, float]:
+    arr = np.array(samples or [0]) / 1e6
+    return {
+        "mean": float(arr.mean()),
+        "p95": float(np.percentile(arr, 95)),
+        "p99": float(np.percentile(arr, 99)),
+        "max": float(arr.max()),
+    }
+
+
+def run(path: Path, window: bool, digest: Path | None = None) -> Dict[str, object]:
+    replay = load(path)
+    if replay.sim_hz != settings.SIM_HZ:
+        raise ValueError(f"{path} was recorded at {replay.sim_hz} Hz, SIM_HZ is {settings.SIM_HZ}")
+    size = (settings.SCREEN_W, settings.SCREEN_H) if window else (1, 1)
+    surf = pygame.display.set_mode(size)
+    game = GameController(surf, headless=not window, seed=replay.seed)
+    game.scripted = True
+    game.shopping = replay.shop
+    game.player.lives = replay.lives
+    game.input = ReplayInput(replay, game.game_clock)
+    trace = DigestTrace(digest) if digest else None
+    clock = time.perf_counter_ns
+    samples: list[int] = []
+    start = time.perf_counter()
+    while game.running:
+        frame = clock()
+        game.input.poll()
+        if game.input.done or game.input.request_exit:
+            break
+        game.step()
+        if window:
+            game.renderer.draw_battle(game)
+        samples.append(clock() - frame)
+        if trace is not None:
+            trace.write(game)
+    spent = time.perf_counter() - start
+    if trace is not None:
+        trace.close()
+    return {
+        "recording": str(path),
+        "seed": replay.seed,
+        "mode": "window" if window else "headless",
+        "steps": len(samples),
+        "game_seconds": game.game_clock.now() / 1_000,
+        "seconds": spent,
+        "frame_ms": _stats(samples),
+        "wave": game.wave_mgr.wave,
+        "lives": game.player.lives,
+        "kills": game.kills,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded input session")
+    parser.add_argument("recording", type=Path)
+    parser.add_argument("--window", action="store_true")
+    parser.add_argument("--out", type=Path, default=None)
+    parser.add_argument("--digest", type=Path, default=None)
+    args = parser.parse_args()
+    res = run(args.recording, args.window, args.digest)
+    st = res["frame_ms"]
+    print(
+        f"{res['steps']} steps ({res['game_seconds']:.0f} s of play), {res['mode']},"
+        f" seed {res['seed']}, {res['seconds']:.2f} s"
+    )
+    print(f"frame ms: mean {st['mean']:.3f}, p95 {st['p95']:.3f}, p99 {st['p99']:.3f}")
+    print(f"wave {res['wave']}/{settings.TOTAL_WAVES}, lives {res['lives']}, kills {res['kills']}")
+    if args.out:
+        args.out.write_text(json.dumps(res, indent=2))
+        print(f"wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
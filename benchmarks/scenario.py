@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pygame
+
+from controller.arena import PHASES
+from controller.game import GameController
+from controller.input_handler import InputHandler
+from model.bullet import EnemyBullet, PlayerBullet
+from model.enemy import Enemy
+from model.slime import Slime
+from model.wasp import Wasp
+from model.zombie_archer import ZombieArcher
+from view.camera import calc_cam
+from view.renderer import Renderer
+import settings
+from . import ROOT_DIR
+
+LIVES = 1_000_000
+
+
+def _place(rng: random.Random, game: GameController) -> tuple[float, float]:
+    cx, cy = game.player.rect.center
+    ang = rng.uniform(0, 2 * math.pi)
+    dist = rng.uniform(settings.ORBITAL_RADIUS, settings.SCREEN_W / 2)
+    x = min(max(cx + math.cos(ang) * dist, 0), settings.WORLD_W)
+    y = min(max(cy + math.sin(ang) * dist, 0), settings.WORLD_H)
+    return x, y
+
+
+def _enemy(rng: random.Random, game: GameController, kind: type) -> Enemy:
+    x, y = _place(rng, game)
+    if kind is ZombieArcher:
+        return ZombieArcher(x, y, game.player, game.projectiles, clock=game.game_clock)
+    return kind(x, y, game.player, clock=game.game_clock)
+
+
+def _top_up(rng: random.Random, game: GameController, counts: Dict[type, int], bullets: int) -> None:
+    enemies = game.wave_mgr.enemies
+    have = {kind: 0 for kind in counts}
+    for z in enemies:
+        have[type(z)] = have.get(type(z), 0) + 1
+    for kind, want in counts.items():
+        for _ in range(want - have[kind]):
+            enemies.append(_enemy(rng, game, kind))
+    shots = game.projectiles
+    for _ in range(bullets - shots.count):
+        x, y = _place(rng, game)
+        ang = rng.uniform(0, 2 * math.pi)
+        cls = PlayerBullet if rng.random() < 0.5 else EnemyBullet
+        speed = settings.BULLET_SPEED
+        shots.append(cls.acquire(x, y, speed * math.cos(ang), speed * math.sin(ang)))
+
+
+def _world(args: argparse.Namespace, surf: pygame.Surface) -> GameController:
+    game = GameController(surf, headless=True, seed=args.seed)
+    game.input = InputHandler(game.game_clock)
+    game.wave_mgr._pending = []
+    game.player.lives = LIVES
+    for _ in range(args.orbitals):
+        game.player.add_orbital()
+    game.cam = calc_cam(game.player.rect)
+    return game
+
+
+def _stats(samples: List[float]) -> Dict[str, float]:
+    arr = np.array(samples) / 1e6
+    return {
+        "mean": float(arr.mean()),
+        "p95": float(np.percentile(arr, 95)),
+        "p99": float(np.percentile(arr, 99)),
+        "max": float(arr.max()),
+    }
+
+
+def _revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run(args: argparse.Namespace) -> Dict[str, object]:
+    rng = random.Random(args.seed)
+    surf = pygame.display.set_mode((settings.SCREEN_W, settings.SCREEN_H))
+    game = _world(args, surf)
+    renderer = Renderer(surf)
+    counts = {Slime: args.slimes, Wasp: args.wasps, ZombieArcher: args.archers}
+    names = [name for name, _ in PHASES] + ["render"]
+    samples: Dict[str, List[float]] = {name: [] for name in names + ["frame"]}
+    clock = time.perf_counter_ns
+    for frame in range(args.warmup + args.frames):
+        _top_up(rng, game, counts, args.bullets)
+        game.player.lives = LIVES
+        game.input.poll()
+        game.game_clock.step(game.timestep.step_ms)
+        times = []
+        for _, phase in PHASES:
+            start = clock()
+            phase(game)
+            times.append(clock() - start)
+        game.cam = calc_cam(game.player.rect)
+        start = clock()
+        renderer.draw_battle(game)
+        times.append(clock() - start)
+        if frame < args.warmup:
+            continue
+        for name, spent in zip(names, times):
+            samples[name].append(spent)
+        samples["frame"].append(sum(times))
+    return {
+        "revision": _revision(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "screen": [settings.SCREEN_W, settings.SCREEN_H],
+        "params": {
+            "slimes": args.slimes,
+            "wasps": args.wasps,
+            "archers": args.archers,
+            "bullets": args.bullets,
+            "orbitals": args.orbitals,
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "phases": {name: _stats(s) for name, s in samples.items()},
+    }
+
+
+def _report(res: Dict[str, object], base: Dict[str, object] | None) -> None:
+    params = res["params"]
+    print(
+        f"{params['slimes']} slimes, {params['wasps']} wasps, {params['archers']} archers,"
+        f" {params['bullets']} bullets, {params['orbitals']} orbitals, {params['frames']} frames"
+    )
+    head = f"{'phase':>12} {'mean ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    print(head + (f" {'vs base':>8}" if base else ""))
+    for name, st in res["phases"].items():
+        line = f"{name:>12} {st['mean']:>8.3f} {st['p95']:>8.3f} {st['p99']:>8.3f}"
+        old = base["phases"].get(name) if base else None
+        if old and old["mean"]:
+            line += f" {st['mean'] / old['mean'] - 1:>+8.1%}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-phase frame times of a populated arena")
+    parser.add_argument("--slimes", type=int, default=100)
+    parser.add_argument("--wasps", type=int, default=60)
+    parser.add_argument("--archers", type=int, default=40)
+    parser.add_argument("--bullets", type=int, default=300)
+    parser.add_argument("--orbitals", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", type=Path, default=None)
+    parser.add_argument("--base", type=Path, default=None)
+    args = parser.parse_args()
+    res = run(args)
+    base = json.loads(args.base.read_text()) if args.base else None
+    _report(res, base)
+    if args.out:
+        args.out.write_text(json.dumps(res, indent=2))
+        print(f"wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
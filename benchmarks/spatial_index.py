@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+import pygame
+
+from model.quadtree import QuadTree
+from model.spatial_hash import SpatialHash
+import settings
+
+SIZES = (100, 1_000, 10_000)
+ENTITY_SIZE = 40
+STEP = 3
+
+
+class _Body:
+
+    __slots__ = ("x", "y", "vx", "vy")
+
+    def __init__(self, rng: random.Random) -> None:
+        self.x = rng.uniform(0, settings.WORLD_W)
+        self.y = rng.uniform(0, settings.WORLD_H)
+        self.vx = rng.uniform(-STEP, STEP)
+        self.vy = rng.uniform(-STEP, STEP)
+
+    def move(self) -> None:
+        self.x = (self.x + self.vx) % settings.WORLD_W
+        self.y = (self.y + self.vy) % settings.WORLD_H
+
+    def rect(self) -> pygame.Rect:
+        h = ENTITY_SIZE // 2
+        return pygame.Rect(self.x - h, self.y - h, ENTITY_SIZE, ENTITY_SIZE)
+
+
+def _rebuild_quadtree(tree: QuadTree, bodies: List[_Body]) -> None:
+    tree.clear()
+    for b in bodies:
+        b.move()
+        tree.insert(b, b.rect())
+
+
+def _update_spatial_hash(grid: SpatialHash, bodies: List[_Body]) -> None:
+    for b in bodies:
+        b.move()
+        grid.update(b, b.rect())
+
+
+def _query_all(index: QuadTree | SpatialHash, bodies: List[_Body]) -> int:
+    hits = 0
+    for b in bodies:
+        hits += len(index.query(b.rect().inflate(ENTITY_SIZE, ENTITY_SIZE)))
+    return hits
+
+
+def _time(
+    maintain: Callable[[], None], query: Callable[[], int], frames: int
+) -> tuple[float, float]:
+    maintain()
+    build = search = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        maintain()
+        mid = time.perf_counter()
+        query()
+        search += time.perf_counter() - mid
+        build += mid - start
+    return build / frames * 1_000, search / frames * 1_000
+
+
+def run(sizes: tuple[int, ...], frames: int, seed: int) -> None:
+    world = pygame.Rect(0, 0, settings.WORLD_W, settings.WORLD_H)
+    print(
+        f"{'entities':>10} {'index':>12} {'maintain ms':>12} "
+        f"{'query ms':>10} {'frame ms':>10}"
+    )
+    for n in sizes:
+        rng = random.Random(seed)
+        bodies = [_Body(rng) for _ in range(n)]
+        tree = QuadTree(world)
+        qt = _time(
+            lambda: _rebuild_quadtree(tree, bodies),
+            lambda: _query_all(tree, bodies),
+            frames,
+        )
+        rng = random.Random(seed)
+        bodies = [_Body(rng) for _ in range(n)]
+        grid = SpatialHash(settings.SPATIAL_CELL)
+        sh = _time(
+            lambda: _update_spatial_hash(grid, bodies),
+            lambda: _query_all(grid, bodies),
+            frames,
+        )
+        for name, (build, search) in (("QuadTree", qt), ("SpatialHash", sh)):
+            print(
+                f"{n:>10} {name:>12} {build:>12.2f} "
+                f"{search:>10.2f} {build + search:>10.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="QuadTree vs SpatialHash per-frame cost")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(tuple(args.sizes), args.frames, args.seed)
+
+
+if __name__ == "__main__":
+    main()
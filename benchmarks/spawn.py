@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from typing import Dict, Tuple
+
+import pygame
+
+from controller.game import GameController
+from model.enemy import Enemy
+from model.wave_manager import WaveManager
+from settings import SPAWN_MIN_DIST, SPAWN_RANGE, clamp
+import settings
+
+KINDS = ("slime", "wasp", "zombie_archer")
+
+
+def _retry(wave: WaveManager, kind: str) -> Tuple[Enemy | None, int]:
+    player = wave.player
+    for tries in range(1, settings.SPAWN_TRIES + 1):
+        ang = wave.rng.uniform(0, 2 * math.pi)
+        dist = wave.rng.uniform(SPAWN_MIN_DIST, SPAWN_MIN_DIST + SPAWN_RANGE)
+        x = clamp(player.rect.centerx + math.cos(ang) * dist, 0, settings.WORLD_W)
+        y = clamp(player.rect.centery + math.sin(ang) * dist, 0, settings.WORLD_H)
+        if player.collision_rect().collidepoint(x, y):
+            continue
+        enemy = wave._create_enemy(kind, x, y)
+        if not wave.map.rect_in_wall(enemy.collision_rect(), False):
+            return enemy, tries
+    return None, settings.SPAWN_TRIES
+
+
+def _spots(game: GameController) -> Dict[str, Tuple[int, int]]:
+    w, h = settings.WORLD_W, settings.WORLD_H
+    edge = 3 * game.map.tile_w
+    return {
+        "center": (w // 2, h // 2),
+        "edge": (w // 2, edge),
+        "corner": (edge, edge),
+    }
+
+
+def run(spawns: int, seed: int) -> None:
+    surf = pygame.display.set_mode((1, 1))
+    game = GameController(surf, headless=True, seed=seed)
+    wave = game.wave_mgr
+    print(f"{spawns} spawns per spot, annulus {SPAWN_MIN_DIST:.0f}..{SPAWN_MIN_DIST + SPAWN_RANGE:.0f} px")
+    print(f"{'spot':>8} {'mode':>6} {'ms/spawn':>9} {'tries':>6} {'failed':>7}")
+    for name, spot in _spots(game).items():
+        game.player.rect.center = spot
+        start = time.perf_counter()
+        tries = failed = 0
+        for i in range(spawns):
+            enemy, n = _retry(wave, KINDS[i % len(KINDS)])
+            tries += n
+            failed += enemy is None
+        spent = time.perf_counter() - start
+        print(f"{name:>8} {'retry':>6} {spent / spawns * 1_000:>9.3f} {tries / spawns:>6.1f} {failed:>7}")
+        start = time.perf_counter()
+        failed = 0
+        for i in range(spawns):
+            enemy = wave._spawn(KINDS[i % len(KINDS)])
+            failed += wave.map.rect_in_wall(enemy.collision_rect(), False)
+        spent = time.perf_counter() - start
+        print(f"{name:>8} {'index':>6} {spent / spawns * 1_000:>9.3f} {'':>6} {failed:>7}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Enemy spawn placement cost")
+    parser.add_argument("--spawns", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.spawns, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Dict, List
+
+import pygame
+
+from model.clock import GameClock
+from model.death_animation import DeathAnimationBase
+from model.enemy import Enemy
+from model.player import Player
+from model.projectile_system import ProjectileSystem
+from model.wave_manager import WaveManager
+from model.zombie_archer import ZombieArcher
+import settings
+
+
+def _spawn(kind: type[Enemy], player: Player, shots: ProjectileSystem) -> Enemy:
+    if kind is ZombieArcher:
+        return ZombieArcher(0, 0, player, shots, clock=player.clock)
+    return kind(0, 0, player, clock=player.clock)
+
+
+def _instance_sprites(enemy: Enemy) -> List[object]:
+    if isinstance(enemy, ZombieArcher):
+        return [enemy.walk_body, enemy.walk_head, enemy.bow_frames, enemy.death]
+    return [enemy.walk, enemy.death]
+
+
+def _run(count: int, shared: bool) -> Dict[str, float]:
+    Enemy._banks.clear()
+    DeathAnimationBase._effects.clear()
+    player = Player(settings.WORLD_W // 2, settings.WORLD_H // 2, clock=GameClock())
+    shots = ProjectileSystem()
+    before = Enemy.bank_bytes()
+    preload = time.perf_counter()
+    if shared:
+        WaveManager.preload_sprites()
+    preload = time.perf_counter() - preload
+    enemies: List[Enemy] = []
+    worst = total = 0.0
+    batch = settings.WAVE_SPAWN_BATCH
+    for i in range(0, count, batch):
+        start = time.perf_counter()
+        for j in range(i, min(i + batch, count)):
+            if not shared:
+                Enemy._banks.clear()
+                DeathAnimationBase._effects.clear()
+            kind = WaveManager.KINDS[j % len(WaveManager.KINDS)]
+            enemies.append(_spawn(kind, player, shots))
+        spent = time.perf_counter() - start
+        total += spent
+        worst = max(worst, spent)
+    after = Enemy.bank_bytes(*(_instance_sprites(e) for e in enemies))
+    return {
+        "sprite MB before": before / 2**20,
+        "sprite MB after": after / 2**20,
+        "preload ms": preload * 1_000,
+        "spawn ms/enemy": total / count * 1_000,
+        "worst batch ms": worst * 1_000,
+    }
+
+
+def run(count: int) -> None:
+    pygame.display.set_mode((1, 1))
+    legacy = _run(count, shared=False)
+    shared = _run(count, shared=True)
+    print(f"{count} enemies, spawned {settings.WAVE_SPAWN_BATCH} per tick")
+    print(f"{'':>18} {'per-instance':>13} {'shared bank':>13}")
+    for key in legacy:
+        print(f"{key:>18} {legacy[key]:>13.3f} {shared[key]:>13.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Enemy sprite memory and spawn cost")
+    parser.add_argument("--count", type=int, default=150)
+    args = parser.parse_args()
+    run(args.count)
+
+
+if __name__ == "__main__":
+    main()
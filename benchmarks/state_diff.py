@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from controller.state_digest import first_divergence, load
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two per-frame state digest traces")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("other", type=Path)
+    args = parser.parse_args()
+    base, other = load(args.base), load(args.other)
+    found = first_divergence(base, other)
+    if found is None:
+        print(f"identical: {len(base)} frames")
+        return
+    frame, field = found
+    if field == "length":
+        print(f"same state for {frame} frames, then lengths differ: {len(base)} vs {len(other)}")
+    else:
+        print(f"diverged at frame {frame}: {field}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+import pygame
+
+import settings
+from settings import WHITE, blit_glyphs, txt
+
+HUD_FONT = 28
+LABELS = (("The mythical arena", 60), ("START", 38), ("EXIT", 38), ("PAUSED", 60))
+
+
+def _render(text: str, size: int) -> pygame.Surface:
+    return settings._font(size).render(text, True, WHITE)
+
+
+def _legacy(surf: pygame.Surface, frame: int) -> None:
+    for text, size in LABELS:
+        surf.blit(_render(text, size), (0, 0))
+    wave = f"Wave: {frame // 600 + 1}/{settings.TOTAL_WAVES}"
+    surf.blit(_render(wave, HUD_FONT), (20, 20))
+    surf.blit(_render(f"x{frame // 90 % 12}", HUD_FONT), (80, 70))
+    surf.blit(_render(f"{frame * 16}", HUD_FONT), (20, 120))
+
+
+def _cached(surf: pygame.Surface, frame: int) -> None:
+    for text, size in LABELS:
+        surf.blit(txt(text, size), (0, 0))
+    label = txt("Wave: ", HUD_FONT)
+    surf.blit(label, (20, 20))
+    wave = f"{frame // 600 + 1}/{settings.TOTAL_WAVES}"
+    blit_glyphs(surf, wave, (20 + label.get_width(), 20), HUD_FONT)
+    blit_glyphs(surf, f"x{frame // 90 % 12}", (80, 70), HUD_FONT)
+    blit_glyphs(surf, f"{frame * 16}", (20, 120), HUD_FONT)
+
+
+def _time(draw: Callable[[pygame.Surface, int], None], frames: int) -> float:
+    surf = pygame.Surface((settings.SCREEN_W, settings.SCREEN_H))
+    start = time.perf_counter()
+    for frame in range(frames):
+        draw(surf, frame)
+    return (time.perf_counter() - start) / frames * 1_000
+
+
+def run(frames: int) -> None:
+    pygame.display.set_mode((1, 1))
+    for key in settings.TEXT_STATS:
+        settings.TEXT_STATS[key] = 0
+    legacy = _time(_legacy, frames)
+    cached = _time(_cached, frames)
+    stats = settings.TEXT_STATS
+    print(f"{frames} frames: 4 static labels, wave, lives and a ticking timer")
+    print(f"{'render per call':>16} {legacy:>8.3f} ms/frame")
+    print(f"{'cache + glyphs':>16} {cached:>8.3f} ms/frame")
+    print(
+        f"{'text cache':>16} hits {stats['hits']}, misses {stats['misses']}"
+        f" ({settings.text_hit_rate():.2%}), glyph blits {stats['glyphs']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Text surface cache and glyph atlas")
+    parser.add_argument("--frames", type=int, default=3_600)
+    args = parser.parse_args()
+    run(args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+
+from controller.timestep import FixedStep
+import settings
+
+
+def _coupled(frame_ms: float) -> float:
+    return 1_000 / max(frame_ms, 1_000 / settings.FPS) / settings.FPS
+
+
+def _fixed(frame_ms: float, seconds: float) -> float:
+    timestep = FixedStep()
+    frame_ms = max(frame_ms, 1_000 / settings.RENDER_FPS)
+    frames = int(seconds * 1_000 / frame_ms)
+    steps = sum(timestep.advance(frame_ms) for _ in range(frames))
+    return steps / (seconds * settings.SIM_HZ)
+
+
+def run(costs: list[float], seconds: float) -> None:
+    print(f"sim {settings.SIM_HZ} Hz, render cap {settings.RENDER_FPS} fps, {seconds:.0f} s")
+    print(f"{'frame ms':>9} {'render fps':>11} {'coupled':>8} {'fixed':>8}")
+    for cost in costs:
+        fps = 1_000 / max(cost, 1_000 / settings.RENDER_FPS)
+        print(f"{cost:>9.1f} {fps:>11.1f} {_coupled(cost):>7.0%} {_fixed(cost, seconds):>7.0%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Game speed under slow render frames")
+    parser.add_argument("costs", type=float, nargs="*", default=[4, 7, 16.7, 25, 40, 70, 120])
+    parser.add_argument("--seconds", type=float, default=60)
+    args = parser.parse_args()
+    run(args.costs, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
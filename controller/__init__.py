@@ -12,5 +12,6 @@ if str(ROOT_DIR) not in sys.path:
 from .input_handler import InputHandler
 from .game import GameController
 from .shop import ShopController
+from .headless import Autopilot
 
-__all__ = ["InputHandler", "GameController", "ShopController"]
+__all__ = ["InputHandler", "GameController", "ShopController", "Autopilot"]
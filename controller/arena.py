@@ -1,45 +1,49 @@
 from __future__ import annotations
 import math
+from time import perf_counter_ns
+from typing import Callable, Tuple
 import pygame
 import audio
+import tracing
+from . import debug
 from model.enemy import Enemy
-from model.effects import DeathEffect
 import settings
 
 
-def _update_player(game: "GameController") -> list[pygame.Rect]:
+def _update_player(game: "GameController") -> None:
     old_pos = game.player.rect.topleft
     game.player.update(game.input.keys or pygame.key.get_pressed())
-    blocks = game.map.collides + ([] if game.door_open else game.map.door_collides)
-    if any(game.player.collision_rect().colliderect(r) for r in blocks):
+    if game.map.rect_in_wall(game.player.collision_rect(), game.door_open):
         game.player.rect.topleft = old_pos
     for dx, dy in game.input.shoot_dirs:
-        game.pbul += game.player.shoot(dx, dy)
-    return blocks
+        game.projectiles.extend(game.player.shoot(dx, dy))
 
 
-def _update_bullets(game: "GameController", blocks: list[pygame.Rect]) -> None:
-    screen_rect = pygame.Rect(0, 0, settings.SCREEN_W, settings.SCREEN_H)
-    for lst in (game.pbul, game.ebul):
-        for b in lst[:]:
-            b.update()
-            hit_wall = any(b.rect().colliderect(r) for r in blocks)
-            off = not screen_rect.colliderect(b.rect().move(-game.cam[0], -game.cam[1]))
-            if hit_wall or b.off_world() or off:
-                lst.remove(b)
+def _compact(items: list) -> None:
+    items[:] = [o for o in items if o.alive]
+
+
+def _update_bullets(game: "GameController") -> None:
+    game.projectiles.step(game.map, game.door_open, game.cam)
 
 
 def _update_effects(game: "GameController") -> None:
-    for eff in game.effects[:]:
+    done = False
+    for eff in game.effects:
         eff.update()
-        if eff.done():
-            game.effects.remove(eff)
+        done = done or eff.done()
+    if done:
+        for e in game.effects:
+            if e.done():
+                game.effect_tree.remove(e)
+        game.effects[:] = [e for e in game.effects if not e.done()]
 
 
 def _enemy_tree(game: "GameController") -> None:
-    game.enemy_tree.clear()
+    tree = game.enemy_tree
     for z in game.wave_mgr.enemies:
-        game.enemy_tree.insert(z, z.collision_rect())
+        if z not in tree:
+            tree.insert(z, z.collision_rect())
 
 
 def _check_orbitals(game: "GameController") -> None:
@@ -55,26 +59,53 @@ def _check_orbitals(game: "GameController") -> None:
         for z in game.enemy_tree.query(rect):
             z_rad = getattr(z, "radius", getattr(z, "RADIUS", 0))
             if math.hypot(z.x - cx, z.y - cy) < z_rad + settings.ORBITAL_HITBOX:
-                if isinstance(z, Enemy):
-                    audio.KILL_ENEMY.play()
-                    game.effects.append(DeathEffect(z.x, z.y, z.death_frames()))
-                if z in game.wave_mgr.enemies:
-                    game.wave_mgr.enemies.remove(z)
-
-
-def _update_enemies(game: "GameController", blocks: list[pygame.Rect]) -> None:
-    margin = settings.ENEMY_UPDATE_MARGIN
-    for z in game.wave_mgr.enemies[:]:
-        r = z.rect().move(-game.cam[0], -game.cam[1])
-        off = (
-            r.right < -margin
-            or r.left > settings.SCREEN_W + margin
-            or r.bottom < -margin
-            or r.top > settings.SCREEN_H + margin
-        )
-        if off:
+                game._kill(z)
+
+
+def _rings(game: "GameController") -> tuple[set, set | None]:
+    view = pygame.Rect(game.cam, (settings.SCREEN_W, settings.SCREEN_H))
+    near = settings.ENEMY_UPDATE_MARGIN
+    inner = set(game.enemy_tree.query(view.inflate(near * 2, near * 2)))
+    if not settings.ENEMY_LOD:
+        return inner, None
+    mid = settings.LOD_MID_MARGIN
+    return inner, set(game.enemy_tree.query(view.inflate(mid * 2, mid * 2)))
+
+
+def _update_enemies(game: "GameController") -> None:
+    if game.flow is not None:
+        game.flow.update(*game.player.rect.center, game.door_open)
+    inner, outer = _rings(game)
+    tick = round(game.game_clock.ms / game.timestep.step_ms)
+    mid_every = settings.LOD_MID_INTERVAL
+    far_every = settings.LOD_FAR_INTERVAL
+    batches: dict[type, list[Enemy]] = {}
+    for z in game.wave_mgr.enemies:
+        if not z.alive:
+            continue
+        if z in inner:
+            game._enemy_step(z)
+        elif outer is None:
             continue
-        game._enemy_step(z, blocks)
+        elif z in outer:
+            if (tick + z.order) % mid_every:
+                continue
+            game._enemy_coarse(z, mid_every, True)
+        else:
+            if (tick + z.order) % far_every == 0:
+                game._enemy_coarse(z, far_every, False)
+            continue
+        if z.alive and z.collider.BATCH:
+            batches.setdefault(type(z), []).append(z)
+    for group in batches.values():
+        game._separate(group)
+
+
+def _compact_dead(game: "GameController") -> None:
+    if game.dead_enemies:
+        _compact(game.wave_mgr.enemies)
+        game.dead_enemies = 0
+    game.projectiles.compact()
 
 
 def _check_transitions(game: "GameController") -> None:
@@ -88,24 +119,51 @@ def _check_transitions(game: "GameController") -> None:
         game.player.collision_rect().colliderect(r) for r in game.map.door_collides
     ):
         if game.wave_mgr.wave == settings.TOTAL_WAVES:
-            from view.rooms import Rooms
-            Rooms.victory_screen(game.surf)
+            if not game.scripted:
+                from view.rooms import Rooms
+                Rooms.victory_screen(game.surf)
             game.running = False
             return
         game._teleport_shop()
     if game.player.lives <= 0:
-        from view.rooms import Rooms
-        Rooms.game_over_screen(game.surf)
+        if not game.scripted:
+            from view.rooms import Rooms
+            Rooms.game_over_screen(game.surf)
         game.running = False
 
 
-def process_arena(game: "GameController") -> None:
-    blocks = _update_player(game)
-    _update_bullets(game, blocks)
-    _update_effects(game)
+def _update_waves(game: "GameController") -> None:
     game.wave_mgr.update()
-    _enemy_tree(game)
-    _check_orbitals(game)
-    _update_enemies(game, blocks)
+
+
+def _collisions(game: "GameController") -> None:
     game._bullet_collisions()
-    _check_transitions(game)
+    _compact_dead(game)
+
+
+PHASES: Tuple[Tuple[str, Callable[["GameController"], None]], ...] = (
+    ("player", _update_player),
+    ("bullets", _update_bullets),
+    ("effects", _update_effects),
+    ("waves", _update_waves),
+    ("tree", _enemy_tree),
+    ("orbitals", _check_orbitals),
+    ("enemies", _update_enemies),
+    ("collisions", _collisions),
+    ("transitions", _check_transitions),
+)
+
+
+def process_arena(game: "GameController") -> None:
+    profiler = game.profiler if debug.SHOW_PROFILER else None
+    if profiler is None and not tracing.ENABLED:
+        for _, phase in PHASES:
+            phase(game)
+        return
+    for name, phase in PHASES:
+        start = perf_counter_ns()
+        phase(game)
+        end = perf_counter_ns()
+        if profiler is not None:
+            profiler.add(name, end - start)
+        tracing.complete(name, start, end)
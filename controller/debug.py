@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from model.player import Player
 
 SHOW_HITBOXES = False
+SHOW_PROFILER = False
 
 
 def toggle_hitboxes() -> None:
@@ -17,6 +18,11 @@ def toggle_hitboxes() -> None:
     SHOW_HITBOXES = not SHOW_HITBOXES
 
 
+def toggle_profiler() -> None:
+    global SHOW_PROFILER
+    SHOW_PROFILER = not SHOW_PROFILER
+
+
 def draw_hitbox(
     surf: pygame.Surface,
     obj: object,
@@ -1,57 +1,98 @@
 from __future__ import annotations
 
 import math
+import random
 import sys
+from time import perf_counter_ns
 from pathlib import Path
 import pygame
 import audio
 import music
+import tracing
 
 from model.player import Player
-from model.bullet import Projectile
+from model.bullet import OWNER_ENEMY, OWNER_PLAYER
 from model.wave_manager import WaveManager
 from model.game_map import GameMap
 from model.enemy import Enemy
+from model.clock import GameClock
+from model.flow_field import FlowField
 from model.effects import DeathEffect
-from model.quadtree import QuadTree
+from model.spatial_hash import SpatialHash
+from model.projectile_system import ProjectileSystem
 import settings
-from settings import FPS, ORBITAL_RADIUS, ORBITAL_HITBOX, TOTAL_WAVES, clamp
+from settings import RENDER_FPS, ORBITAL_RADIUS, ORBITAL_HITBOX, TOTAL_WAVES, clamp
 from view.camera import calc_cam
 
 from view.renderer import Renderer
 from view.rooms import Rooms
 from view.pause import pause_menu
-from .arena import process_arena
+from .arena import PHASES, process_arena
+from . import debug
+from .headless import Autopilot
+from .timestep import FixedStep, Interpolator
+from .profiler import FrameProfiler
+from .replay import InputRecorder
 from .input_handler import InputHandler
 from .shop import ShopController
 
 
 class GameController:
 
-    def __init__(self, surf: pygame.Surface):
+    def __init__(
+        self, surf: pygame.Surface, headless: bool = False, seed: int | None = None
+    ):
         self.surf = surf
+        self.headless = headless
+        self.scripted = headless
+        self.shopping = not headless
+        self.seed = random.randrange(1 << 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.recorder: InputRecorder | None = None
+        self.game_clock = GameClock(settings.TIME_SCALE)
         self.map = GameMap(Path("assets/maps/arena.tmx"), settings.MAP_SCALE)
         self._set_world(self.map)
         spawn = self.map.point("Player_spawn") or (
             settings.WORLD_W // 2,
             settings.WORLD_H // 2 - settings.SPAWN_Y_OFF,
         )
-        self.player = Player(spawn[0], spawn[1])
-        self.pbul: list[Projectile] = []
-        self.ebul: list[Projectile] = []
+        self.player = Player(spawn[0], spawn[1], clock=self.game_clock)
+        self.projectiles = ProjectileSystem()
         self.effects: list[DeathEffect] = []
+        self.dead_enemies = 0
+        self.kills = 0
         self.shop_map = GameMap(Path("assets/maps/shop.tmx"), settings.MAP_SCALE)
-        self.wave_mgr = WaveManager(self.player, self.ebul, self.map)
-        self.renderer = Renderer(surf)
-        self.enemy_tree = QuadTree(
-            pygame.Rect(0, 0, settings.WORLD_W, settings.WORLD_H)
+        self.flow = FlowField(self.map) if settings.ENEMY_FLOW_FIELD else None
+        self.wave_mgr = WaveManager(
+            self.player, self.projectiles, self.map, self.game_clock, self.rng, self.flow
         )
+        self.renderer = None if headless else Renderer(surf)
+        self.enemy_tree = SpatialHash(settings.SPATIAL_CELL)
+        self.effect_tree = SpatialHash(settings.SPATIAL_CELL)
         self.door_open = False
         self.cam = (0, 0)
         self.clock = pygame.time.Clock()
+        self.timestep = FixedStep()
+        self.interp = Interpolator()
+        self.profiler = FrameProfiler([name for name, _ in PHASES] + ["render"])
         self.running = True
-        self.input = InputHandler()
+        self.input = Autopilot(self) if headless else InputHandler(self.game_clock)
         self.paused = False
+        if settings.RECORD_PATH and not headless:
+            self.record(settings.RECORD_PATH)
+
+
+    def record(self, path: Path | str) -> None:
+        self.stop_recording()
+        self.recorder = InputRecorder(
+            Path(path), self.seed, settings.SIM_HZ, self.shopping, self.player.lives
+        )
+
+
+    def stop_recording(self) -> None:
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
 
 
     @staticmethod
@@ -62,87 +103,162 @@ class GameController:
 
     def loop(self) -> None:
         music.play(music.BATTLE_1_2, music.BATTLE_1_2_VOLUME)
-        while self.running:
-            self.clock.tick(FPS)
+        self._resync()
+        to_menu = False
+        with tracing.span("GameController.loop"):
+            while self.running and not to_menu:
+                with tracing.span("frame"):
+                    to_menu = self._frame()
+        self.stop_recording()
+        if to_menu:
+            from view.menu import Menu
+            Menu(self.surf).loop()
+
+
+    def _frame(self) -> bool:
+        real = self.clock.tick(RENDER_FPS)
+        steps = self.timestep.advance(self.game_clock.scaled(real))
+        for _ in range(steps):
             self.input.poll()
             if self.input.request_exit:
+                self.stop_recording()
                 pygame.quit()
                 sys.exit()
             if self.input.toggle_pause:
                 self.paused = not self.paused
+            if self.paused or not self.running:
+                break
+            self.interp.capture(self)
+            self.step()
 
-            if self.paused:
-                if pause_menu(self.renderer, self.clock):
-                    self.running = False
-                    from view.menu import Menu
-                    Menu(self.surf).loop()
-                    return
-                self.paused = False
-                continue
+        if self.paused:
+            self.game_clock.pause()
+            if pause_menu(self.renderer, self.clock):
+                self.running = False
+                return True
+            self.paused = False
+            self.game_clock.resume()
+            self._resync()
+            return False
 
-            process_arena(self)
-            self.cam = calc_cam(self.player.rect)
-            self.renderer.draw_battle(self)
+        with self.interp.apply(self, self.timestep.alpha):
+            self._render()
+        return False
+
+
+    def _render(self) -> None:
+        start = perf_counter_ns()
+        self.renderer.draw_battle(self)
+        end = perf_counter_ns()
+        tracing.complete("Renderer.draw_battle", start, end)
+        if debug.SHOW_PROFILER:
+            self.profiler.add("render", end - start)
+            self.profiler.end_frame()
+
+
+    def step(self) -> None:
+        if self.recorder is not None:
+            self.recorder.record(self.input)
+        self.game_clock.step(self.timestep.step_ms)
+        process_arena(self)
+        self.cam = calc_cam(self.player.rect)
 
 
     def _teleport_shop(self) -> None:
-        ShopController(
-            self.surf,
-            self.player,
-            self.shop_map,
-            self.wave_mgr.wave,
-        ).loop()
+        if self.shopping:
+            with tracing.span("ShopController.loop", wave=self.wave_mgr.wave):
+                ShopController(
+                    self.surf,
+                    self.player,
+                    self.shop_map,
+                    self.wave_mgr.wave,
+                    self.input,
+                    self.recorder,
+                    self.scripted,
+                ).loop()
         self._set_world(self.map)
-        self.enemy_tree = QuadTree(
-            pygame.Rect(0, 0, settings.WORLD_W, settings.WORLD_H)
-        )
+        self.enemy_tree.clear()
         spawn = self.map.point("Player_spawn") or (
             settings.WORLD_W // 2,
             settings.WORLD_H // 2,
         )
         self.player.rect.center = spawn
-        self.pbul.clear()
-        self.ebul.clear()
+        self.projectiles.clear()
         self.wave_mgr.enemies.clear()
         self.wave_mgr.next_wave()
+        self.door_open = False
+        self._resync()
+        if self.scripted:
+            return
         if self.wave_mgr.wave >= 3:
             music.play(music.BATTLE_3_10, music.BATTLE_3_10_VOLUME)
         else:
             music.play(music.BATTLE_1_2, music.BATTLE_1_2_VOLUME)
-        self.door_open = False
+
+
+    def _resync(self) -> None:
+        self.clock.tick()
+        self.timestep.reset()
+        self.interp.settle(self)
+
+
+    def _kill(self, enemy: Enemy) -> None:
+        if not enemy.alive:
+            return
+        enemy.alive = False
+        audio.KILL_ENEMY.play()
+        effect = DeathEffect(enemy.x, enemy.y, enemy.death_frames(), self.game_clock)
+        self.effects.append(effect)
+        self.effect_tree.insert(effect, effect.bounds())
+        self.enemy_tree.remove(enemy)
+        self.dead_enemies += 1
+        self.kills += 1
 
 
     def _bullet_collisions(self) -> None:
-        for b in self.pbul[:]:
-            rect = b.rect()
-            for z in self.enemy_tree.query(rect):
-                if z not in self.wave_mgr.enemies:
-                    continue
-                if z.collision_rect().collidepoint(b.x, b.y):
-                    self.pbul.remove(b)
-                    if isinstance(z, Enemy):
-                        audio.KILL_ENEMY.play()
-                        self.effects.append(
-                            DeathEffect(z.x, z.y, z.death_frames())
-                        )
-                    self.wave_mgr.enemies.remove(z)
-                    break
-        for b in self.ebul[:]:
-            if self.player.collision_rect().collidepoint(b.x, b.y):
-                self.player.damage()
-                self.ebul.remove(b)
-
-
-    def _enemy_step(self, enemy: Enemy, blocks: list[pygame.Rect]) -> None:
-        old_pos = (enemy.x, enemy.y)
+        shots = self.projectiles
+        for i in shots.near(self.enemy_tree, OWNER_PLAYER):
+            for z in self.enemy_tree.query_point(*shots.position(i)):
+                shots.kill(i)
+                self._kill(z)
+                break
+        for i in shots.inside(self.player.collision_rect(), OWNER_ENEMY):
+            self.player.damage()
+            shots.kill(i)
+
+
+    def _separate(self, group: list[Enemy]) -> None:
+        collider = group[0].collider
+        disp = collider.separate(group)
+        for z, (ox, oy) in zip(group, disp.tolist()):
+            if not ox and not oy:
+                continue
+            z.x += ox
+            z.y += oy
+            if collider.walls(z, self.map, self.door_open):
+                z.x -= ox
+                z.y -= oy
+                continue
+            self.enemy_tree.update(z, z.collision_rect())
+
+
+    def _enemy_coarse(self, enemy: Enemy, steps: int, swarm: bool) -> None:
+        old_pos = enemy.prev_x, enemy.prev_y = enemy.x, enemy.y
+        enemy.advance(self.player, steps)
+        if swarm:
+            enemy.collider.swarm(enemy, self.enemy_tree)
+        if enemy.collider.walls(enemy, self.map, self.door_open):
+            enemy.x, enemy.y = old_pos
+        self.enemy_tree.update(enemy, enemy.collision_rect())
+
+
+    def _enemy_step(self, enemy: Enemy) -> None:
+        old_pos = enemy.prev_x, enemy.prev_y = enemy.x, enemy.y
         enemy.update(self.wave_mgr.enemies, self.cam, self.enemy_tree)
-        if enemy.collider.walls(enemy, blocks):
+        if enemy.collider.walls(enemy, self.map, self.door_open):
             enemy.x, enemy.y = old_pos
+        self.enemy_tree.update(enemy, enemy.collision_rect())
         if enemy.collider.player(enemy, self.player):
             self.player.damage()
-            if isinstance(enemy, Enemy):
-                audio.KILL_ENEMY.play()
-                self.effects.append(DeathEffect(enemy.x, enemy.y, enemy.death_frames()))
-            self.wave_mgr.enemies.remove(enemy)
-
+            self._kill(enemy)
 
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Dict, Tuple
+import pygame
+
+import settings
+from .input_handler import InputHandler
+from .state_digest import DigestTrace
+
+if TYPE_CHECKING:
+    from controller.game import GameController
+
+
+class Autopilot(InputHandler):
+
+    _MOVE_KEYS = (pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s)
+
+    def __init__(self, game: "GameController"):
+        super().__init__(game.game_clock)
+        self.game = game
+        self._last: Tuple[int, int] | None = None
+        self._axis = 0
+        self._stuck = 0
+        self._side = 1
+        self._detour = 0
+        self._detour_dir = (0, 0)
+
+    def _target(self) -> Tuple[Tuple[float, float] | None, float]:
+        px, py = self.game.player.rect.center
+        best, best_d = None, math.inf
+        for z in self.game.wave_mgr.enemies:
+            if not z.alive:
+                continue
+            d = math.hypot(z.x - px, z.y - py)
+            if d < best_d:
+                best, best_d = (z.x, z.y), d
+        if best is not None:
+            return best, settings.AUTOPILOT_RANGE
+        if self.game.door_open and self.game.map.door_collides:
+            door = min(
+                self.game.map.door_collides,
+                key=lambda r: math.hypot(r.centerx - px, r.centery - py),
+            )
+            return door.center, 0
+        return None, 0
+
+    def poll(self) -> None:
+        self.teleport = False
+        self.request_exit = False
+        self.toggle_pause = False
+        self.shoot_dirs.clear()
+        pygame.event.clear()
+        self._keys = dict.fromkeys(self._MOVE_KEYS, False)
+
+        target, reach = self._target()
+        if target is None:
+            return
+        pos = self.game.player.rect.topleft
+        px, py = self.game.player.rect.center
+        dx, dy = int(target[0] - px), int(target[1] - py)
+        if pos == self._last:
+            self._axis = (self._axis + 1) % 3
+            self._stuck += 1
+            if self._stuck >= 3:
+                self._side = -self._side
+                self._detour = settings.AUTOPILOT_DETOUR
+                self._detour_dir = (-dy * self._side, dx * self._side)
+                self._stuck = 0
+        else:
+            self._stuck = 0
+        if self._detour:
+            self._detour -= 1
+            self._last = pos
+            self._press(*self._detour_dir, 3)
+        elif math.hypot(dx, dy) > reach:
+            self._last = pos
+            self._press(dx, dy, self._axis)
+        else:
+            self._last = None
+            if reach and (dx or dy):
+                self.shoot_dirs.append((dx, dy))
+
+
+    def _press(self, dx: int, dy: int, axis: int) -> None:
+        step = settings.PLAYER_SPEED
+        if axis != 2:
+            self._keys[pygame.K_a] = dx < -step
+            self._keys[pygame.K_d] = dx > step
+        if axis != 1:
+            self._keys[pygame.K_w] = dy < -step
+            self._keys[pygame.K_s] = dy > step
+
+
+def run(
+    game: "GameController", frames: int, trace: DigestTrace | None = None
+) -> Dict[str, float]:
+    start = time.perf_counter()
+    frame = 0
+    while game.running and frame < frames:
+        game.input.poll()
+        game.step()
+        if trace is not None:
+            trace.write(game)
+        frame += 1
+    spent = time.perf_counter() - start
+    return {
+        "frames": frame,
+        "seconds": spent,
+        "game_seconds": game.game_clock.now() / 1_000,
+        "fps": frame / spent if spent else 0.0,
+        "wave": game.wave_mgr.wave,
+        "lives": game.player.lives,
+        "kills": game.kills,
+        "enemies": len(game.wave_mgr.enemies),
+    }
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import pygame
 
+from model.clock import GameClock
 from settings import PLAYER_FIRE_DELAY
+from view.dirty import DirtyRects
 from . import debug
 
 class InputHandler:
@@ -21,13 +23,15 @@ class InputHandler:
         pygame.K_DOWN: (0, 1),
     }
 
-    def __init__(self):
+    def __init__(self, clock: GameClock):
+        self.clock = clock
         self._keys = None
         self.teleport = False
         self.request_exit = False
         self.toggle_pause = False
         self.shoot_dirs: list[tuple[int, int]] = []
         self._last_shot = 0
+        self.done = False
 
     def poll(self) -> None:
         self.teleport = False
@@ -36,6 +40,7 @@ class InputHandler:
         self.shoot_dirs.clear()
 
         for event in pygame.event.get():
+            DirtyRects.notice(event)
             if event.type == pygame.QUIT:
                 self.request_exit = True
             elif event.type == pygame.KEYDOWN:
@@ -47,9 +52,11 @@ class InputHandler:
                     self.teleport = True
                 elif event.key == pygame.K_h:
                     debug.toggle_hitboxes()
+                elif event.key == pygame.K_p:
+                    debug.toggle_profiler()
         self._keys = pygame.key.get_pressed()
 
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         if self._keys and now - self._last_shot >= PLAYER_FIRE_DELAY:
             for key, vec in self._ARROW_KEYS.items():
                 if self._keys[key]:
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+import settings
+
+
+class FrameProfiler:
+
+    def __init__(self, names: Sequence[str], window: int | None = None) -> None:
+        self.names = tuple(names)
+        self.slot = {name: i for i, name in enumerate(self.names)}
+        self.window = window or settings.PROFILE_WINDOW
+        self.samples = np.zeros((self.window, len(self.names)), dtype=np.int64)
+        self.frames = 0
+        self._row = np.zeros(len(self.names), dtype=np.int64)
+
+    def add(self, name: str, ns: int) -> None:
+        self._row[self.slot[name]] += ns
+
+    def end_frame(self) -> None:
+        self.samples[self.frames % self.window] = self._row
+        self._row[:] = 0
+        self.frames += 1
+
+    def reset(self) -> None:
+        self.samples[:] = 0
+        self._row[:] = 0
+        self.frames = 0
+
+    def history(self) -> np.ndarray:
+        n = min(self.frames, self.window)
+        if self.frames <= self.window:
+            rows = self.samples[:n]
+        else:
+            rows = np.roll(self.samples, -(self.frames % self.window), axis=0)
+        return rows / 1e6
+
+    def means(self) -> Dict[str, float]:
+        rows = self.history()
+        if not len(rows):
+            return dict.fromkeys(self.names, 0.0)
+        return dict(zip(self.names, rows.mean(axis=0).tolist()))
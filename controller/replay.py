@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import BinaryIO, List, Tuple
+
+import pygame
+
+from model.clock import GameClock
+from view.dirty import DirtyRects
+from . import debug
+from .input_handler import InputHandler
+
+MAGIC = b"ARNR"
+VERSION = 3
+MOVE_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d)
+TELEPORT = 1 << 4
+SHOOT = 1 << 5
+SHOP_PLAYED = 1
+MAX_RUN = 0xFFFF
+SHOT_LIMIT = 0x7FFF
+
+_HEADER = struct.Struct("<4sHHQBi")
+_MASK = struct.Struct("<B")
+_RUN = struct.Struct("<H")
+_SHOT = struct.Struct("<hh")
+
+
+def _clamp_shot(v: int) -> int:
+    return max(-SHOT_LIMIT, min(SHOT_LIMIT, int(v)))
+
+
+def encode(handler: InputHandler) -> Tuple[int, Tuple[int, int] | None]:
+    keys = handler.keys
+    mask = 0
+    if keys:
+        for bit, key in enumerate(MOVE_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+    if handler.teleport:
+        mask |= TELEPORT
+    shot = None
+    if handler.shoot_dirs:
+        dx, dy = handler.shoot_dirs[0]
+        shot = _clamp_shot(dx), _clamp_shot(dy)
+        mask |= SHOOT
+    return mask, shot
+
+
+class Replay:
+
+    def __init__(self, seed: int, sim_hz: int, shop: bool, lives: int) -> None:
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.shop = shop
+        self.lives = lives
+        self.steps: List[Tuple[int, Tuple[int, int] | None]] = []
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+def load(path: Path) -> Replay:
+    data = Path(path).read_bytes()
+    magic, version, sim_hz, seed, flags, lives = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} input recording")
+    replay = Replay(seed, sim_hz, bool(flags & SHOP_PLAYED), lives)
+    pos = _HEADER.size
+    while pos < len(data):
+        (mask,) = _MASK.unpack_from(data, pos)
+        pos += _MASK.size
+        if mask & SHOOT:
+            replay.steps.append((mask, _SHOT.unpack_from(data, pos)))
+            pos += _SHOT.size
+        else:
+            (count,) = _RUN.unpack_from(data, pos)
+            pos += _RUN.size
+            replay.steps.extend([(mask, None)] * count)
+    return replay
+
+
+class InputRecorder:
+
+    def __init__(self, path: Path, seed: int, sim_hz: int, shop: bool, lives: int) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._out: BinaryIO | None = self.path.open("wb")
+        self._out.write(_HEADER.pack(MAGIC, VERSION, sim_hz, seed, SHOP_PLAYED if shop else 0, lives))
+        self._mask = -1
+        self._count = 0
+        self.steps = 0
+
+    def _flush(self) -> None:
+        if self._count:
+            self._out.write(_MASK.pack(self._mask) + _RUN.pack(self._count))
+        self._count = 0
+
+    def record(self, handler: InputHandler) -> None:
+        if self._out is None:
+            return
+        mask, shot = encode(handler)
+        self.steps += 1
+        if shot is not None:
+            self._flush()
+            self._out.write(_MASK.pack(mask) + _SHOT.pack(*shot))
+            return
+        if mask != self._mask or self._count == MAX_RUN:
+            self._flush()
+            self._mask = mask
+        self._count += 1
+
+    def close(self) -> None:
+        if self._out is None:
+            return
+        self._flush()
+        self._out.close()
+        self._out = None
+
+
+class ReplayInput(InputHandler):
+
+    def __init__(self, replay: Replay, clock: GameClock):
+        super().__init__(clock)
+        self.replay = replay
+        self.step = 0
+        self.done = not replay.steps
+
+    def poll(self) -> None:
+        self.teleport = False
+        self.request_exit = False
+        self.toggle_pause = False
+        self.shoot_dirs.clear()
+
+        for event in pygame.event.get():
+            DirtyRects.notice(event)
+            if event.type == pygame.QUIT:
+                self.request_exit = True
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_BACKSPACE:
+                    self.request_exit = True
+                elif event.key == pygame.K_h:
+                    debug.toggle_hitboxes()
+                elif event.key == pygame.K_p:
+                    debug.toggle_profiler()
+
+        if self.step >= len(self.replay.steps):
+            self.done = True
+            self._keys = dict.fromkeys(MOVE_KEYS, False)
+            return
+        mask, shot = self.replay.steps[self.step]
+        self.step += 1
+        self._keys = {key: bool(mask & 1 << bit) for bit, key in enumerate(MOVE_KEYS)}
+        self.teleport = bool(mask & TELEPORT)
+        if shot is not None:
+            self.shoot_dirs.append(shot)
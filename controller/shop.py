@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 import pygame
 import audio
 import music
@@ -9,26 +10,42 @@ import music
 import settings
 from settings import FPS, BG_COLOR, clamp, img
 from view.camera import calc_cam
+from view.dirty import DirtyRects
 from view.renderer import _draw_hud, HEART_PATH
 from .input_handler import InputHandler
+from .timestep import FixedStep
 from model.player import Player
 from model.game_map import GameMap
 from controller import debug
 
+if TYPE_CHECKING:
+    from .replay import InputRecorder
+
 
 class ShopController:
 
     def __init__(
-        self, surf: pygame.Surface, player: Player, game_map: GameMap, wave: int
+        self,
+        surf: pygame.Surface,
+        player: Player,
+        game_map: GameMap,
+        wave: int,
+        handler: InputHandler | None = None,
+        recorder: InputRecorder | None = None,
+        scripted: bool = False,
     ) -> None:
         self.surf = surf
         self.player = player
         self.map = game_map
-        self.input = InputHandler()
+        self.input = handler or InputHandler(player.clock)
+        self.recorder = recorder
+        self.scripted = scripted
         self.clock = pygame.time.Clock()
+        self.timestep = FixedStep()
         self.running = True
         self.wave = wave
         self.cam = (0, 0)
+        self.dirty = DirtyRects()
         self.reward_taken = False
         settings.WORLD_W, settings.WORLD_H = self.map.width, self.map.height
         triggers = sorted(self.map.upgrade_triggers, key=lambda r: r.x)
@@ -64,43 +81,69 @@ class ShopController:
 
 
     def loop(self) -> None:
-        music.play(music.SHOP, music.SHOP_VOLUME)
+        if not self.scripted:
+            music.play(music.SHOP, music.SHOP_VOLUME)
         while self.running:
-            self.clock.tick(FPS)
-            self.input.poll()
-            if self.input.request_exit:
-                pygame.quit(); sys.exit()
-            if self.input.teleport:
-                break
-            keys = self.input.keys or pygame.key.get_pressed()
-            old_pos = self.player.rect.topleft
-            self.player.update(keys)
-            if any(self.player.collision_rect().colliderect(r) for r in self.map.collides):
-                self.player.rect.topleft = old_pos
-            if not self.reward_taken:
-                if self.player.collision_rect().colliderect(self.bullet_rect):
-                    self.player.bullet_upg += 1
-                    audio.PICKUP.play()
-                    self.reward_taken = True
-                elif self.player.collision_rect().colliderect(self.life_rect):
-                    self.player.lives += 2
-                    audio.PICKUP.play()
-                    self.reward_taken = True
-                elif self.player.collision_rect().colliderect(self.orb_rect):
-                    self.player.add_orbital()
-                    audio.PICKUP.play()
-                    self.reward_taken = True
-            if (
-                self.reward_taken
-                and self.player.rect.bottom >= settings.WORLD_H
-            ):
-                break
-            self.cam = calc_cam(self.player.rect)
-            self._draw()
+            if self.scripted:
+                steps = 1
+            else:
+                steps = self.timestep.advance(self.player.clock.scaled(self.clock.tick(FPS)))
+            for _ in range(steps):
+                self.step()
+                if not self.running:
+                    return
+            if not self.scripted:
+                self.cam = calc_cam(self.player.rect)
+                self._draw()
+
+
+    def step(self) -> None:
+        self.input.poll()
+        if self.input.request_exit:
+            if self.recorder is not None:
+                self.recorder.close()
+            pygame.quit(); sys.exit()
+        if self.recorder is not None:
+            self.recorder.record(self.input)
+        self.player.clock.step(self.timestep.step_ms)
+        if self.input.teleport or self.input.done:
+            self.running = False
+            return
+        keys = self.input.keys or pygame.key.get_pressed()
+        old_pos = self.player.rect.topleft
+        self.player.update(keys)
+        if self.map.rect_in_wall(self.player.collision_rect(), True):
+            self.player.rect.topleft = old_pos
+        if not self.reward_taken:
+            if self.player.collision_rect().colliderect(self.bullet_rect):
+                self.player.bullet_upg += 1
+                audio.PICKUP.play()
+                self.reward_taken = True
+            elif self.player.collision_rect().colliderect(self.life_rect):
+                self.player.lives += 2
+                audio.PICKUP.play()
+                self.reward_taken = True
+            elif self.player.collision_rect().colliderect(self.orb_rect):
+                self.player.add_orbital()
+                audio.PICKUP.play()
+                self.reward_taken = True
+        if (
+            self.reward_taken
+            and self.player.rect.bottom >= settings.WORLD_H
+        ):
+            self.running = False
 
 
     def _draw(self) -> None:
         cam = self.cam
+        self.dirty.camera(cam)
+        self.dirty.state(
+            (self.reward_taken, debug.SHOW_HITBOXES, self.wave, self.player.lives)
+        )
+        for rect in self.player.draw_rects(cam):
+            self.dirty.touch(rect)
+        if not self.dirty.begin(self.surf):
+            return
         self.surf.fill(BG_COLOR)
         self.map.draw(self.surf, cam, True)
 
@@ -135,4 +178,4 @@ class ShopController:
                     ),
                 )
         _draw_hud(self.surf, self.wave, self.player.lives, self.heart_img)
-        pygame.display.flip()
+        self.dirty.present(self.surf)
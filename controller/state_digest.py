@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import struct
+from hashlib import blake2b
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, List, Tuple
+
+if TYPE_CHECKING:
+    from controller.game import GameController
+
+MAGIC = b"ARDG"
+VERSION = 1
+FIELDS = ("player", "enemies", "bullets", "wave")
+
+_HEADER = struct.Struct("<4sHH")
+_ROW = struct.Struct(f"<{len(FIELDS)}Q")
+
+Row = Tuple[int, ...]
+
+
+def _hash(*parts: bytes) -> int:
+    h = blake2b(digest_size=8)
+    for part in parts:
+        h.update(part)
+    return int.from_bytes(h.digest(), "little")
+
+
+def digest(game: "GameController") -> Row:
+    player = game.player
+    px, py = player.rect.topleft
+    shots = game.projectiles
+    n = shots.count
+    wave = game.wave_mgr
+    return (
+        _hash(struct.pack("<iii", px, py, player.lives)),
+        _hash(
+            *(
+                type(z).__name__.encode() + struct.pack("<dd?", z.x, z.y, z.alive)
+                for z in wave.enemies
+            )
+        ),
+        _hash(shots.x[:n].tobytes(), shots.y[:n].tobytes(), shots.owner[:n].tobytes()),
+        _hash(struct.pack("<ii?", wave.wave, len(wave._pending), game.door_open)),
+    )
+
+
+class DigestTrace:
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._out: BinaryIO | None = self.path.open("wb")
+        self._out.write(_HEADER.pack(MAGIC, VERSION, len(FIELDS)))
+        self.frames = 0
+
+    def write(self, game: "GameController") -> None:
+        if self._out is None:
+            return
+        self._out.write(_ROW.pack(*digest(game)))
+        self.frames += 1
+
+    def close(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+
+def load(path: Path) -> List[Row]:
+    data = Path(path).read_bytes()
+    magic, version, fields = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or fields != len(FIELDS):
+        raise ValueError(f"{path} is not a version {VERSION} state digest trace")
+    body = memoryview(data)[_HEADER.size:]
+    usable = len(body) - len(body) % _ROW.size
+    return [row for row in _ROW.iter_unpack(body[:usable])]
+
+
+def first_divergence(a: List[Row], b: List[Row]) -> Tuple[int, str] | None:
+    for frame, (ra, rb) in enumerate(zip(a, b)):
+        if ra != rb:
+            field = next(name for name, x, y in zip(FIELDS, ra, rb) if x != y)
+            return frame, field
+    if len(a) != len(b):
+        return min(len(a), len(b)), "length"
+    return None
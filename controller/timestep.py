@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Tuple
+from contextlib import contextmanager
+import math
+
+import numpy as np
+
+import settings
+from view.camera import calc_cam
+
+if TYPE_CHECKING:
+    from controller.game import GameController
+
+
+class FixedStep:
+
+    def __init__(self, hz: int | None = None, max_steps: int | None = None) -> None:
+        self.step_ms = 1_000 / (hz or settings.SIM_HZ)
+        self.max_steps = max_steps or settings.MAX_SIM_STEPS
+        self.acc = 0.0
+        self.dropped = 0.0
+
+    def reset(self) -> None:
+        self.acc = 0.0
+
+    def advance(self, dt: float) -> int:
+        self.acc += dt
+        steps = int(self.acc // self.step_ms)
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.step_ms
+            steps = self.max_steps
+            self.acc %= self.step_ms
+        else:
+            self.acc -= steps * self.step_ms
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        return min(1.0, self.acc / self.step_ms)
+
+
+def _lerp_angle(a: float, b: float, t: float) -> float:
+    d = (b - a + math.pi) % (2 * math.pi) - math.pi
+    return (a + d * t) % (2 * math.pi)
+
+
+class Interpolator:
+
+    def __init__(self) -> None:
+        self.player: Tuple[int, int] = (0, 0)
+        self.phase = 0.0
+
+    def capture(self, game: "GameController") -> None:
+        self.player = game.player.rect.topleft
+        self.phase = game.player.orbital_phase
+
+    def settle(self, game: "GameController") -> None:
+        self.capture(game)
+        for z in game.wave_mgr.enemies:
+            z.prev_x, z.prev_y = z.x, z.y
+
+    @contextmanager
+    def apply(self, game: "GameController", alpha: float) -> Iterator[None]:
+        player = game.player
+        enemies = game.wave_mgr.enemies
+        shots = game.projectiles
+        n = shots.count
+        saved_player = player.rect.topleft
+        saved_phase = player.orbital_phase
+        saved_enemies = [(z.x, z.y) for z in enemies]
+        saved_shots = shots.x[:n].copy(), shots.y[:n].copy()
+        saved_cam = game.cam
+        back = 1.0 - alpha
+        px, py = self.player
+        player.rect.topleft = (
+            round(px + (saved_player[0] - px) * alpha),
+            round(py + (saved_player[1] - py) * alpha),
+        )
+        player.orbital_phase = _lerp_angle(self.phase, saved_phase, alpha)
+        for z, (x, y) in zip(enemies, saved_enemies):
+            z.x = z.prev_x + (x - z.prev_x) * alpha
+            z.y = z.prev_y + (y - z.prev_y) * alpha
+        np.subtract(shots.x[:n], shots.dx[:n] * back, out=shots.x[:n])
+        np.subtract(shots.y[:n], shots.dy[:n] * back, out=shots.y[:n])
+        game.cam = calc_cam(player.rect)
+        try:
+            yield
+        finally:
+            player.rect.topleft = saved_player
+            player.orbital_phase = saved_phase
+            for z, (x, y) in zip(enemies, saved_enemies):
+                z.x, z.y = x, y
+            shots.x[:n], shots.y[:n] = saved_shots
+            game.cam = saved_cam
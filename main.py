@@ -1,10 +1,14 @@
 import pygame
 
+import settings
+import tracing
 from settings import CAPTION, set_fullscreen
 from view.menu import Menu
 
 
 def main() -> None:
+    if settings.TRACE_PATH:
+        tracing.start(settings.TRACE_PATH)
     surf = set_fullscreen()
     pygame.display.set_caption(CAPTION)
     Menu(surf).loop()
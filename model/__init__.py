@@ -10,6 +10,7 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from .bullet import Projectile, PlayerBullet, EnemyBullet
+from .projectile_system import ProjectileSystem
 from .player import Player
 from .enemy import Enemy
 from .zombie_archer import ZombieArcher
@@ -18,14 +19,20 @@ from .wasp import Wasp
 from .effects import DeathEffect
 from .wave_manager import WaveManager
 from .game_map import GameMap
-from .interfaces import MapProtocol
-from .collisions import CollisionBase, SameTypeCollision
+from .interfaces import MapProtocol, SpatialIndex
+from .collisions import CollisionBase, SameTypeCollision, BatchSameTypeCollision
 from .quadtree import QuadTree
+from .spatial_hash import SpatialHash
+from .chunk_cache import ChunkCache
+from .clock import GameClock
+from .flow_field import FlowField
+from .spawn_index import SpawnIndex
 
 __all__ = [
     "Projectile",
     "PlayerBullet",
     "EnemyBullet",
+    "ProjectileSystem",
     "Player",
     "Enemy",
     "ZombieArcher",
@@ -35,7 +42,14 @@ __all__ = [
     "WaveManager",
     "GameMap",
     "MapProtocol",
+    "SpatialIndex",
     "CollisionBase",
     "SameTypeCollision",
+    "BatchSameTypeCollision",
     "QuadTree",
+    "SpatialHash",
+    "ChunkCache",
+    "GameClock",
+    "FlowField",
+    "SpawnIndex",
 ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import ClassVar, Dict, List, Tuple, TypeVar, TYPE_CHECKING
 
 import pygame
 import settings
@@ -20,16 +20,59 @@ ARROW_BASE = img(
 
 PROJECTILE_SIZE = 40
 ARROW_ROT_OFFSET = 90
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+ALLOCATIONS: Dict[str, int] = {"bullets": 0, "sprites": 0}
+
+_projectile_images: Dict[int, pygame.Surface] = {}
+_arrow_images: Dict[Tuple[int, int, int], pygame.Surface] = {}
 
 if TYPE_CHECKING:
     from model.player import Player
 
+P = TypeVar("P", bound="Projectile")
+
+
+def _display_ready(base: pygame.Surface) -> pygame.Surface:
+    return base.convert_alpha() if pygame.display.get_surface() else base
+
+
+def projectile_image(scale: float) -> pygame.Surface:
+    size = int(PROJECTILE_SIZE * scale)
+    image = _projectile_images.get(size)
+    if image is None:
+        ALLOCATIONS["sprites"] += 1
+        image = pygame.transform.scale(_display_ready(PROJECTILE_BASE), (size, size))
+        _projectile_images[size] = image
+    return image
+
+
+def arrow_image(scale: float, dx: float, dy: float) -> pygame.Surface:
+    w = int(ARROW_BASE.get_width() * scale)
+    h = int(ARROW_BASE.get_height() * scale)
+    angle = -math.degrees(math.atan2(dy, dx)) - ARROW_ROT_OFFSET
+    step = (
+        int(round(angle / settings.ARROW_ANGLE_STEP)) * settings.ARROW_ANGLE_STEP
+    ) % 360
+    key = (w, h, step)
+    image = _arrow_images.get(key)
+    if image is None:
+        ALLOCATIONS["sprites"] += 1
+        scaled = pygame.transform.scale(_display_ready(ARROW_BASE), (w, h))
+        for ang in range(0, 360, settings.ARROW_ANGLE_STEP):
+            _arrow_images[(w, h, ang)] = pygame.transform.rotate(scaled, ang)
+        image = _arrow_images[key]
+    return image
+
 
 class Projectile(ABC):
 
     RADIUS = 20
     SCALE_SPRITE = 1.0
     SCALE_HITBOX = 1.0
+    OWNER = OWNER_PLAYER
+    _free: ClassVar[Dict[type, List["Projectile"]]] = {}
 
     def __init__(
         self,
@@ -39,6 +82,18 @@ class Projectile(ABC):
         dy: float,
         scale_sprite: float | None = None,
         scale_hitbox: float | None = None,
+    ) -> None:
+        ALLOCATIONS["bullets"] += 1
+        self.reset(x, y, dx, dy, scale_sprite, scale_hitbox)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        dx: float,
+        dy: float,
+        scale_sprite: float | None = None,
+        scale_hitbox: float | None = None,
     ) -> None:
         self.x, self.y, self.dx, self.dy = x, y, dx, dy
         self.scale_sprite = (
@@ -49,6 +104,19 @@ class Projectile(ABC):
         )
         self.radius = int(self.RADIUS * self.scale_hitbox)
 
+    @classmethod
+    def acquire(cls: type[P], *args: float | None) -> P:
+        free = Projectile._free.get(cls)
+        if free:
+            bullet = free.pop()
+            bullet.reset(*args)
+            return bullet
+        return cls(*args)
+
+    @staticmethod
+    def release(bullet: "Projectile") -> None:
+        Projectile._free.setdefault(type(bullet), []).append(bullet)
+
     def update(self) -> None:
         self.x += self.dx
         self.y += self.dy
@@ -71,13 +139,18 @@ class PlayerBullet(Projectile):
 
     def __init__(self, x: float, y: float, dx: float, dy: float, scale: float = 1.0) -> None:
         super().__init__(x, y, dx, dy, scale, scale)
-        size = int(PROJECTILE_SIZE * self.scale_sprite)
-        base_img = (
-            PROJECTILE_BASE.convert_alpha()
-            if pygame.display.get_surface()
-            else PROJECTILE_BASE
-        )
-        self.image = pygame.transform.scale(base_img, (size, size))
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        dx: float,
+        dy: float,
+        scale: float | None = 1.0,
+        scale_hitbox: float | None = None,
+    ) -> None:
+        super().reset(x, y, dx, dy, scale, scale)
+        self.image = projectile_image(self.scale_sprite)
 
     def draw(self, surf: pygame.Surface, cam: tuple[int, int]) -> None:
         surf.blit(
@@ -94,8 +167,9 @@ class EnemyBullet(Projectile):
 
     RADIUS = 20
     SCALE_SPRITE = 2.0
+    OWNER = OWNER_ENEMY
 
-    def __init__(
+    def reset(
         self,
         x: float,
         y: float,
@@ -104,18 +178,8 @@ class EnemyBullet(Projectile):
         scale_sprite: float | None = None,
         scale_hitbox: float | None = None,
     ) -> None:
-        super().__init__(x, y, dx, dy, scale_sprite, scale_hitbox)
-        base_img = (
-            ARROW_BASE.convert_alpha()
-            if pygame.display.get_surface()
-            else ARROW_BASE
-        )
-        w = int(base_img.get_width() * self.scale_sprite)
-        h = int(base_img.get_height() * self.scale_sprite)
-        scaled = pygame.transform.scale(base_img, (w, h))
-
-        angle = -math.degrees(math.atan2(dy, dx)) - ARROW_ROT_OFFSET
-        self.image = pygame.transform.rotate(scaled, angle)
+        super().reset(x, y, dx, dy, scale_sprite, scale_hitbox)
+        self.image = arrow_image(self.scale_sprite, dx, dy)
 
     def draw(self, surf: pygame.Surface, cam: tuple[int, int]) -> None:
         surf.blit(
@@ -125,5 +189,3 @@ class EnemyBullet(Projectile):
                 int(self.y - cam[1] - self.image.get_height() / 2),
             ),
         )
-
-
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+Render = Callable[[Hashable], "pygame.Surface | None"]
+
+
+class ChunkCache:
+
+    def __init__(self, render: Render, capacity: int = 64) -> None:
+        self.render = render
+        self.capacity = capacity
+        self.chunks: OrderedDict[Hashable, pygame.Surface | None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def clear(self) -> None:
+        self.chunks.clear()
+
+    def reserve(self, count: int) -> None:
+        if count > self.capacity:
+            self.capacity = count
+
+    def get(self, key: Hashable) -> pygame.Surface | None:
+        chunks = self.chunks
+        if key in chunks:
+            self.hits += 1
+            chunks.move_to_end(key)
+            return chunks[key]
+        self.misses += 1
+        surf = chunks[key] = self.render(key)
+        while len(chunks) > self.capacity:
+            chunks.popitem(last=False)
+        return surf
+
+    def nbytes(self) -> int:
+        return sum(
+            s.get_bytesize() * s.get_width() * s.get_height()
+            for s in self.chunks.values()
+            if s is not None
+        )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+
+class GameClock:
+
+    def __init__(self, scale: float = 1.0, start: float = 0.0) -> None:
+        self.scale = scale
+        self.paused = False
+        self.ms = start
+
+    def now(self) -> int:
+        return int(self.ms)
+
+    def pause(self) -> None:
+        self.paused = True
+
+    def resume(self) -> None:
+        self.paused = False
+
+    def scaled(self, real_ms: float) -> float:
+        return 0.0 if self.paused else real_ms * self.scale
+
+    def step(self, ms: float) -> None:
+        self.ms += ms
+
+    def tick(self, real_ms: float) -> None:
+        self.step(self.scaled(real_ms))
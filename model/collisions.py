@@ -1,32 +1,40 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, TYPE_CHECKING
+from typing import Sequence, TYPE_CHECKING
 import math
-import pygame
+
+import numpy as np
+
+from .spatial_hash import cell_keys
 
 if TYPE_CHECKING:
     from .enemy import Enemy
     from .player import Player
-    from .quadtree import QuadTree
+    from .interfaces import MapProtocol, SpatialIndex
+
+
+HALF_NEIGHBOURHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
 
 
 class CollisionBase(ABC):
 
-    def walls(self, enemy: Enemy, walls: List[pygame.Rect]) -> bool:
-        return any(enemy.collision_rect().colliderect(r) for r in walls)
+    BATCH = False
+
+    def walls(self, enemy: Enemy, game_map: "MapProtocol", door_open: bool) -> bool:
+        return game_map.rect_in_wall(enemy.collision_rect(), door_open)
 
     def player(self, enemy: Enemy, player: Player) -> bool:
         return enemy.collision_rect().colliderect(player.collision_rect())
 
     @abstractmethod
-    def swarm(self, enemy: Enemy, tree: "QuadTree") -> None:
+    def swarm(self, enemy: Enemy, tree: "SpatialIndex") -> None:
         raise NotImplementedError
 
 
 class SameTypeCollision(CollisionBase):
 
-    def swarm(self, enemy: Enemy, tree: "QuadTree") -> None:
+    def swarm(self, enemy: Enemy, tree: "SpatialIndex") -> None:
         rect = enemy.collision_rect().inflate(enemy.radius * 2, enemy.radius * 2)
         for other in tree.query(rect):
             if other is enemy or type(other) is not type(enemy):
@@ -44,3 +52,53 @@ class SameTypeCollision(CollisionBase):
                 enemy.y += (enemy.y - other.y) / d * push
 
 
+class BatchSameTypeCollision(CollisionBase):
+
+    BATCH = True
+
+    def swarm(self, enemy: Enemy, tree: "SpatialIndex") -> None:
+        return None
+
+    def separate(self, enemies: Sequence[Enemy]) -> np.ndarray:
+        n = len(enemies)
+        disp = np.zeros((n, 2), dtype=np.float64)
+        if n < 2:
+            return disp
+        pos = np.array([(z.x, z.y) for z in enemies], dtype=np.float64)
+        rad = np.array([z.radius for z in enemies], dtype=np.float64)
+        cell = max(2 * float(rad.max()), 1.0)
+        cx = np.floor(pos[:, 0] / cell).astype(np.int64)
+        cy = np.floor(pos[:, 1] / cell).astype(np.int64)
+        keys = cell_keys(cx, cy)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        own = np.arange(n)
+        left: list[np.ndarray] = []
+        right: list[np.ndarray] = []
+        for ox, oy in HALF_NEIGHBOURHOOD:
+            near = cell_keys(cx + ox, cy + oy)
+            first = np.searchsorted(keys, near, side="left")
+            last = np.searchsorted(keys, near, side="right")
+            for k in range(int((last - first).max())):
+                j = first + k
+                live = j < last
+                other = order[np.minimum(j, n - 1)]
+                if (ox, oy) == (0, 0):
+                    live &= own < other
+                left.append(own[live])
+                right.append(other[live])
+        if not left:
+            return disp
+        i = np.concatenate(left)
+        j = np.concatenate(right)
+        delta = pos[i] - pos[j]
+        d = np.hypot(delta[:, 0], delta[:, 1])
+        min_d = rad[i] + rad[j]
+        hit = (d > 0) & (d < min_d)
+        i, j, delta, d, min_d = i[hit], j[hit], delta[hit], d[hit], min_d[hit]
+        push = delta * ((min_d - d) / 2 / d)[:, None]
+        for axis in (0, 1):
+            disp[:, axis] = (
+                np.bincount(i, push[:, axis], n) - np.bincount(j, push[:, axis], n)
+            )
+        return disp
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import ClassVar, Dict, List
 
 import pygame
 from settings import img
@@ -9,6 +9,8 @@ from settings import img
 
 class DeathAnimationBase:
 
+    _effects: ClassVar[Dict[float, List[pygame.Surface]]] = {}
+
     def __init__(self, scale: float) -> None:
         self.scale = scale
         self.frames: List[pygame.Surface] = []
@@ -20,6 +22,9 @@ class DeathAnimationBase:
         return pygame.transform.scale(base, (w, h))
 
     def _load_effect_frames(self) -> List[pygame.Surface]:
+        cached = DeathAnimationBase._effects.get(self.scale)
+        if cached is not None:
+            return list(cached)
         root = (
             Path(__file__).resolve().parents[1]
             / "assets"
@@ -31,7 +36,8 @@ class DeathAnimationBase:
             path = root / f"death_{i:04}.png"
             if path.exists():
                 frames.append(self._scale_img(path))
-        return frames
+        DeathAnimationBase._effects[self.scale] = frames
+        return list(frames)
 
 
 class SlimeDeathAnimation(DeathAnimationBase):
@@ -1,26 +1,43 @@
 from __future__ import annotations
 
-from typing import List
+from itertools import count
+from typing import ClassVar, Iterator, List
 import pygame
 
+from .clock import GameClock
+
 
 class DeathEffect:
 
     FRAME_DELAY = 80
-
-    def __init__(self, x: float, y: float, frames: List[pygame.Surface]):
+    _serial: ClassVar[Iterator[int]] = count()
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        frames: List[pygame.Surface],
+        clock: GameClock,
+    ):
+        self.order = next(DeathEffect._serial)
         self.x = x
         self.y = y
         self.frames = frames
         self.index = 0
-        self._last = pygame.time.get_ticks()
+        self.clock = clock
+        self._last = self.clock.now()
 
     def update(self) -> None:
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         if now - self._last >= self.FRAME_DELAY:
             self.index += 1
             self._last = now
 
+    def bounds(self) -> pygame.Rect:
+        w = max((f.get_width() for f in self.frames), default=0)
+        h = max((f.get_height() for f in self.frames), default=0)
+        return pygame.Rect(int(self.x) - w // 2, int(self.y) - h // 2, w, h)
+
     def draw(self, surf: pygame.Surface, cam: tuple[int, int]) -> None:
         if self.index < len(self.frames):
             img = self.frames[self.index]
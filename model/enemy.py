@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from itertools import count
+from typing import Any, ClassVar, Dict, Iterator, List, Tuple, TYPE_CHECKING
 import math
 import pygame
 
+from .clock import GameClock
 from .collisions import CollisionBase, SameTypeCollision
-from .quadtree import QuadTree
+from .interfaces import SpatialIndex
+
+if TYPE_CHECKING:
+    from .flow_field import FlowField
 
 
 class Enemy(ABC):
@@ -15,6 +20,9 @@ class Enemy(ABC):
     RADIUS = 20
     SCALE_SPRITE = 1.0
     SCALE_HITBOX = 1.0
+    COLLIDER: type[CollisionBase] = SameTypeCollision
+    _banks: ClassVar[Dict[Tuple[type, float], Dict[str, Any]]] = {}
+    _serial: ClassVar[Iterator[int]] = count()
 
     def __init__(
         self,
@@ -24,19 +32,44 @@ class Enemy(ABC):
         scale_sprite: float | None = None,
         scale_hitbox: float | None = None,
         collider: CollisionBase | None = None,
+        *,
+        clock: GameClock,
     ) -> None:
+        self.order = next(Enemy._serial)
         self.x, self.y = x, y
+        self.prev_x, self.prev_y = x, y
+        self.clock = clock
         self.speed = speed if speed is not None else self.SPEED
         self.scale_sprite = scale_sprite if scale_sprite is not None else self.SCALE_SPRITE
         self.scale_hitbox = (
             scale_hitbox if scale_hitbox is not None else self.SCALE_HITBOX
         )
         self.radius = int(self.RADIUS * self.scale_hitbox)
-        self.collider = collider or SameTypeCollision()
+        self.collider = collider or self.COLLIDER()
+        self.flow: FlowField | None = None
+        self.alive = True
         self.direction = "right"
         self.walk_idx = 0
         self.last_step = 0
 
+    @classmethod
+    def sprite_bank(cls, scale: float | None = None) -> Dict[str, Any]:
+        scale = cls.SCALE_SPRITE if scale is None else scale
+        key = (cls, scale)
+        bank = Enemy._banks.get(key)
+        if bank is None:
+            bank = Enemy._banks[key] = cls._build_bank(scale)
+        return bank
+
+    @classmethod
+    def _build_bank(cls, scale: float) -> Dict[str, Any]:
+        return {}
+
+    @staticmethod
+    def bank_bytes(*objs: Any) -> int:
+        seen = {id(s): s for s in _surfaces(objs or list(Enemy._banks.values()))}
+        return sum(s.get_bytesize() * s.get_width() * s.get_height() for s in seen.values())
+
     def rect(self) -> pygame.Rect:
         img = getattr(self, "image", None)
         if img is not None:
@@ -64,7 +97,7 @@ class Enemy(ABC):
         self,
         swarm: List["Enemy"],
         cam: tuple[int, int],
-        tree: "QuadTree",
+        tree: "SpatialIndex",
     ) -> None:
         raise NotImplementedError
 
@@ -76,28 +109,56 @@ class Enemy(ABC):
         return []
 
 
+    def heading(self, player: "Player") -> tuple[float, float]:
+        target = self.flow.target(self.x, self.y) if self.flow is not None else None
+        tx, ty = target or player.rect.center
+        return tx - self.x, ty - self.y
+
     def chase_player(self, player: "Player") -> tuple[float, float, float]:
         dx = player.rect.centerx - self.x
         dy = player.rect.centery - self.y
         dist = math.hypot(dx, dy) or 1
         self.direction = "right" if dx > 0 else "left"
-        self.x += self.speed * dx / dist
-        self.y += self.speed * dy / dist
+        hx, hy = self.heading(player)
+        span = math.hypot(hx, hy) or 1
+        self.x += self.speed * hx / span
+        self.y += self.speed * hy / span
         return dist, dx, dy
 
+    def advance(self, player: "Player", steps: int) -> None:
+        dx, dy = self.heading(player)
+        dist = math.hypot(dx, dy)
+        if not dist:
+            return
+        step = min(self.speed * steps, dist)
+        self.direction = "right" if dx > 0 else "left"
+        self.x += step * dx / dist
+        self.y += step * dy / dist
+
     def animate_walk(
         self, frames: dict[str, list[pygame.Surface]], step_ms: int = 200
     ) -> pygame.Surface:
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         if now - self.last_step > step_ms:
             self.walk_idx = (self.walk_idx + 1) % len(frames[self.direction])
             self.last_step = now
         return frames[self.direction][self.walk_idx]
 
     def chase_and_collide(
-        self, player: "Player", tree: "QuadTree"
+        self, player: "Player", tree: "SpatialIndex"
     ) -> tuple[float, float, float]:
         dist, dx, dy = self.chase_player(player)
         self.collider.swarm(self, tree)
         return dist, dx, dy
 
+
+
+def _surfaces(obj: Any) -> Iterator[pygame.Surface]:
+    if isinstance(obj, pygame.Surface):
+        yield obj
+    elif isinstance(obj, dict):
+        for v in obj.values():
+            yield from _surfaces(v)
+    elif isinstance(obj, (list, tuple)):
+        for v in obj:
+            yield from _surfaces(v)
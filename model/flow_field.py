@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import Dict, Generator, Iterator, List, Tuple
+
+import numpy as np
+
+import settings
+from .interfaces import MapProtocol
+
+Cell = Tuple[int, int]
+Slices = Tuple[slice, slice]
+Sweep = Tuple[Slices, Slices, np.ndarray]
+
+MOVES = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+UNREACHED = np.iinfo(np.int32).max
+
+
+def _window(ox: int, oy: int, rows: int, cols: int) -> Tuple[Slices, Slices]:
+    here = (slice(max(-oy, 0), rows - max(oy, 0)), slice(max(-ox, 0), cols - max(ox, 0)))
+    there = (slice(max(oy, 0), rows - max(-oy, 0)), slice(max(ox, 0), cols - max(-ox, 0)))
+    return here, there
+
+
+def _shift(grid: np.ndarray, ox: int, oy: int, fill: object) -> np.ndarray:
+    here, there = _window(ox, oy, *grid.shape)
+    out = np.full_like(grid, fill)
+    out[here] = grid[there]
+    return out
+
+
+class FlowField:
+
+    def __init__(
+        self,
+        game_map: MapProtocol,
+        rings_per_step: int = settings.FLOW_RINGS_PER_STEP,
+        wall_cost: int = settings.FLOW_WALL_COST,
+    ) -> None:
+        self.map = game_map
+        self.rings_per_step = rings_per_step
+        self.wall_cost = wall_cost
+        self.tile_w = game_map.tile_w
+        self.tile_h = game_map.tile_h
+        self.rows, self.cols = game_map.occupancy[False].shape
+        windows = [_window(ox, oy, self.rows, self.cols) for ox, oy in MOVES]
+        self._allowed: Dict[bool, List[np.ndarray]] = {}
+        self._sweeps: Dict[bool, List[Sweep]] = {}
+        self._tight: Dict[bool, np.ndarray] = {}
+        for door_open, grid in game_map.occupancy.items():
+            walkable = ~grid
+            allowed = self._allowed[door_open] = self._allowed_moves(walkable)
+            self._sweeps[door_open] = [
+                (here, there, ok[here]) for (here, there), ok in zip(windows, allowed)
+            ]
+            self._tight[door_open] = walkable & ~self._clear(walkable)
+        self.cell: Cell | None = None
+        self.door_open: bool | None = None
+        self._ys, self._xs = (axis.ravel() for axis in np.indices((self.rows, self.cols)))
+        self.dist = np.full((self.rows, self.cols), UNREACHED, dtype=np.int32)
+        self._next: List[List[int]] = [[-1] * self.cols for _ in range(self.rows)]
+        self._pending: Iterator[bool] | None = None
+        self.builds = 0
+
+    @staticmethod
+    def _allowed_moves(walkable: np.ndarray) -> List[np.ndarray]:
+        allowed = []
+        for ox, oy in MOVES:
+            ok = walkable & _shift(walkable, ox, oy, False)
+            if ox and oy:
+                ok &= _shift(walkable, ox, 0, False) & _shift(walkable, 0, oy, False)
+            allowed.append(ok)
+        return allowed
+
+    @staticmethod
+    def _clear(walkable: np.ndarray) -> np.ndarray:
+        clear = walkable.copy()
+        for ox, oy in MOVES:
+            clear &= _shift(walkable, ox, oy, False)
+        return clear
+
+    def cell_at(self, x: float, y: float) -> Cell:
+        return int(x) // self.tile_w, int(y) // self.tile_h
+
+    def update(self, x: float, y: float, door_open: bool) -> bool:
+        cell = self.cell_at(x, y)
+        if cell != self.cell or door_open != self.door_open:
+            self.cell, self.door_open = cell, door_open
+            self._pending = self._build(cell, door_open)
+        if self._pending is None:
+            return False
+        for _ in range(self.rings_per_step):
+            if next(self._pending, True):
+                self._pending = None
+                return True
+        return False
+
+    def _build(self, cell: Cell, door_open: bool) -> Iterator[bool]:
+        shape = (self.rows, self.cols)
+        dist = np.full(shape, UNREACHED, dtype=np.int32)
+        nxt = np.full(shape, -1, dtype=np.intp)
+        tx, ty = cell
+        if 0 <= tx < self.cols and 0 <= ty < self.rows:
+            visible = yield from self._sight(cell, door_open)
+            if not (visible | self.map.occupancy[door_open]).all():
+                yield from self._spread(cell, door_open, dist)
+                hops = np.stack([
+                    np.where(ok, _shift(dist, ox, oy, UNREACHED), UNREACHED)
+                    for (ox, oy), ok in zip(MOVES, self._allowed[door_open])
+                ])
+                best = hops.argmin(axis=0)
+                nearest = np.take_along_axis(hops, best[None], axis=0)[0]
+                down = (nearest < dist) & (nearest > 0) & ~visible
+                nxt[down] = best[down]
+        self.dist = dist
+        self._next = nxt.tolist()
+        self.builds += 1
+        yield True
+
+    def _sight(self, cell: Cell, door_open: bool) -> Generator[bool, None, np.ndarray]:
+        tx, ty = cell
+        walls = self.map.occupancy[door_open].ravel()
+        span = max(tx, self.cols - 1 - tx, ty, self.rows - 1 - ty, 1)
+        dx, dy = tx - self._xs, ty - self._ys
+        sx = self._xs * span + span // 2
+        sy = self._ys * span + span // 2
+        blocked = np.zeros(walls.shape, dtype=bool)
+        for _ in range(span - 1):
+            sx += dx
+            sy += dy
+            blocked |= walls[sy // span * self.cols + sx // span]
+            yield False
+        return ~blocked.reshape(self.rows, self.cols)
+
+    def _spread(self, cell: Cell, door_open: bool, dist: np.ndarray) -> Iterator[bool]:
+        sweeps = self._sweeps[door_open]
+        tight = self._tight[door_open]
+        tx, ty = cell
+        seed = np.zeros(dist.shape, dtype=bool)
+        seed[ty, tx] = True
+        buckets = {0: seed}
+        unseen = np.ones(dist.shape, dtype=bool)
+        d = -1
+        while buckets:
+            d += 1
+            frontier = buckets.pop(d, None)
+            if frontier is None:
+                continue
+            frontier &= unseen
+            if not frontier.any():
+                continue
+            unseen &= ~frontier
+            dist[frontier] = d
+            grown = np.zeros(dist.shape, dtype=bool)
+            for here, there, ok in sweeps:
+                grown[here] |= ok & frontier[there]
+            grown &= unseen
+            for cost, mask in ((1, grown & ~tight), (self.wall_cost, grown & tight)):
+                if d + cost in buckets:
+                    buckets[d + cost] |= mask
+                else:
+                    buckets[d + cost] = mask
+            yield False
+
+    def target(self, x: float, y: float) -> Tuple[float, float] | None:
+        tx, ty = self.cell_at(x, y)
+        if not (0 <= tx < self.cols and 0 <= ty < self.rows):
+            return None
+        move = self._next[ty][tx]
+        if move < 0:
+            return None
+        ox, oy = MOVES[move]
+        return (tx + ox + 0.5) * self.tile_w, (ty + oy + 0.5) * self.tile_h
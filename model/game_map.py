@@ -5,49 +5,102 @@ from typing import List, Tuple
 
 import pygame
 import settings
+import tracing
+from . import map_cache
+from .chunk_cache import ChunkCache
 from .interfaces import MapProtocol
 try:
-    from pytmx import load_pygame, TiledMap, TiledObject
+    from pytmx import load_pygame, TiledMap, TiledObject, TiledTileLayer
 except ImportError as exc:
     raise ImportError(
         "pytmx is required to load TMX maps. Install it with 'pip install pytmx'."
     ) from exc
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "numpy is required for map occupancy grids. Install it with 'pip install numpy'."
+    ) from exc
+
+Cell = Tuple[int, int]
+ChunkKey = Tuple[bool, int, int]
+
+DOOR_LAYERS = {True: ["Doors_open"], False: ["Doors", "Doors_nocollide"]}
 
 
 class GameMap(MapProtocol):
 
-    def __init__(self, map_file: Path, scale: float = settings.MAP_SCALE) -> None:
+    def __init__(
+        self, map_file: Path, scale: float = settings.MAP_SCALE, baked: bool = True
+    ) -> None:
         self.scale = scale
-        self.tmx: TiledMap = load_pygame(map_file)
-        self.tile_w = int(self.tmx.tilewidth * self.scale)
-        self.tile_h = int(self.tmx.tileheight * self.scale)
-        self.width = self.tmx.width * self.tile_w
-        self.height = self.tmx.height * self.tile_h
+        self.rect_stats: dict[str, Tuple[int, int]] = {}
+        self._tiles: dict[int, pygame.Surface] = {}
+        with tracing.span("GameMap.load", map=map_file.name):
+            path = map_cache.bake_dir(settings.MAP_CACHE_DIR, map_file, scale) if baked else None
+            cached = map_cache.load(path) if path is not None else None
+            if cached is not None:
+                self._load_bake(*cached)
+            else:
+                self._load_tmx(map_file)
+                if path is not None:
+                    map_cache.save(path, *self._bake())
+        self.width = self.cols * self.tile_w
+        self.height = self.rows * self.tile_h
+        self.chunk_w = settings.MAP_CHUNK_TILES * self.tile_w
+        self.chunk_h = settings.MAP_CHUNK_TILES * self.tile_h
+        self.chunks_x = -(-self.width // self.chunk_w)
+        self.chunks_y = -(-self.height // self.chunk_h)
+        self.chunks = ChunkCache(self._render_chunk, settings.MAP_CHUNK_CACHE)
+        self._row_masks = {
+            door_open: self._pack_rows(grid)
+            for door_open, grid in self.occupancy.items()
+        }
 
 
-        self.base_surface = self._render_map(
-            exclude={"Doors", "Doors_nocollide", "Doors_open"}
-        )
-        self.closed_doors = self._render_layers(["Doors", "Doors_nocollide"])
-        self.open_doors = self._render_layers(["Doors_open"])
-
+    def _load_tmx(self, map_file: Path) -> None:
+        tmx: TiledMap = load_pygame(map_file)
+        self.tile_w = int(tmx.tilewidth * self.scale)
+        self.tile_h = int(tmx.tileheight * self.scale)
+        self.cols, self.rows = tmx.width, tmx.height
+        self._load_tile_grids(tmx)
 
-        layers = set(self.tmx.layernames)
-        if {"Walls", "Walls_back", "Decs_collide"} & layers:
-            self.collides = []
-            for name in ("Walls", "Walls_back", "Decs_collide"):
-                if name in layers:
-                    self.collides.extend(self._load_tile_collides(name))
+        layers = set(tmx.layernames)
+        wall_layers = [
+            n for n in ("Walls", "Walls_back", "Decs_collide") if n in layers
+        ]
+        wall_cells: set[Cell] = set()
+        if wall_layers:
+            wall_cells = self._tile_cells(tmx, wall_layers)
+            self.collides = self._merge_cells(wall_cells, "collides")
         else:
-            self.collides = self._load_objects("Collides")
+            self.collides = self._load_objects(tmx, "Collides")
 
+        door_cells: set[Cell] = set()
         if "Doors" in layers:
-            self.door_collides = self._load_tile_collides("Doors")
+            door_cells = self._tile_cells(tmx, ["Doors"])
+            self.door_collides = self._merge_cells(door_cells, "door_collides")
         else:
-            self.door_collides = self._load_objects("Collides_doors")
+            self.door_collides = self._load_objects(tmx, "Collides_doors")
+
+        self.blocks_open = self.collides
+        if wall_cells and door_cells:
+            self.blocks_closed = self._merge_cells(
+                wall_cells | door_cells, "blocks_closed"
+            )
+        else:
+            self.blocks_closed = self.collides + self.door_collides
+
+        self.occupancy = {
+            True: self._occupancy_grid(wall_cells),
+            False: self._occupancy_grid(wall_cells | door_cells),
+        }
+        loose_walls = [] if wall_cells else self.collides
+        loose_doors = [] if door_cells else self.door_collides
+        self._loose = {True: loose_walls, False: loose_walls + loose_doors}
 
         self.points: dict[str, Tuple[int, int]] = {}
-        for layer in self.tmx.objectgroups:
+        for layer in tmx.objectgroups:
             if layer.name in {
                 "Player_spawn",
                 "Upgrade_projectile",
@@ -62,25 +115,273 @@ class GameMap(MapProtocol):
                     break
 
         if "Upgrade_trigger" in layers:
-            self.upgrade_triggers = self._load_tile_collides("Upgrade_trigger")
+            self.upgrade_triggers = self._load_tile_collides(tmx, "Upgrade_trigger")
         else:
             self.upgrade_triggers = []
 
 
-    def _load_tile_collides(self, name: str) -> List[pygame.Rect]:
+    def _load_tile_grids(self, tmx: TiledMap) -> None:
+        variants = {door_open: self._chunk_layers(tmx, door_open) for door_open in (True, False)}
+        gids = sorted({
+            gid
+            for layers in variants.values()
+            for layer in layers
+            for row in layer.data
+            for gid in row
+            if gid
+        })
+        lut = np.zeros(max(gids, default=0) + 1, dtype=np.int32)
+        atlas = [np.zeros((self.tile_h, self.tile_w, 4), dtype=np.uint8)]
+        for gid in gids:
+            image = tmx.get_tile_image_by_gid(gid)
+            if not image:
+                continue
+            tile = pygame.transform.scale(image, (self.tile_w, self.tile_h))
+            pixels = np.frombuffer(pygame.image.tobytes(tile, "RGBA"), dtype=np.uint8)
+            pixels = pixels.reshape(self.tile_h, self.tile_w, 4).copy()
+            if not tile.get_flags() & pygame.SRCALPHA:
+                pixels[..., 3] = 255
+            key = tile.get_colorkey()
+            if key is not None:
+                pixels[(pixels[..., :3] == key[:3]).all(axis=-1), 3] = 0
+            lut[gid] = len(atlas)
+            atlas.append(pixels)
+        self._atlas = np.stack(atlas)
+        self._tile_grids = {
+            door_open: np.stack(
+                [lut[np.asarray(layer.data, dtype=np.int64)] for layer in layers]
+            ) if layers else np.zeros((0, self.rows, self.cols), dtype=np.int32)
+            for door_open, layers in variants.items()
+        }
+
+
+    def _bake(self) -> Tuple[map_cache.Arrays, dict]:
+        arrays = {
+            "atlas": self._atlas,
+            "tiles_open": self._tile_grids[True],
+            "tiles_closed": self._tile_grids[False],
+            "occupancy_open": self.occupancy[True],
+            "occupancy_closed": self.occupancy[False],
+        }
+        rects = lambda items: [tuple(r) for r in items]
+        meta = {
+            "scale": self.scale,
+            "tile": [self.tile_w, self.tile_h],
+            "size": [self.cols, self.rows],
+            "rect_stats": self.rect_stats,
+            "collides": rects(self.collides),
+            "door_collides": rects(self.door_collides),
+            "blocks_closed": rects(self.blocks_closed),
+            "loose_open": rects(self._loose[True]),
+            "loose_closed": rects(self._loose[False]),
+            "points": self.points,
+            "upgrade_triggers": rects(self.upgrade_triggers),
+        }
+        return arrays, meta
+
+
+    def _load_bake(self, arrays: map_cache.Arrays, meta: dict) -> None:
+        rects = lambda items: [pygame.Rect(r) for r in items]
+        self.tile_w, self.tile_h = meta["tile"]
+        self.cols, self.rows = meta["size"]
+        self._atlas = arrays["atlas"]
+        self._tile_grids = {True: arrays["tiles_open"], False: arrays["tiles_closed"]}
+        self.occupancy = {
+            True: np.array(arrays["occupancy_open"]),
+            False: np.array(arrays["occupancy_closed"]),
+        }
+        self.rect_stats = {k: tuple(v) for k, v in meta["rect_stats"].items()}
+        self.collides = rects(meta["collides"])
+        self.door_collides = rects(meta["door_collides"])
+        self.blocks_open = self.collides
+        self.blocks_closed = rects(meta["blocks_closed"])
+        self._loose = {True: rects(meta["loose_open"]), False: rects(meta["loose_closed"])}
+        self.points = {k: tuple(v) for k, v in meta["points"].items()}
+        self.upgrade_triggers = rects(meta["upgrade_triggers"])
+
+
+    def _load_tile_collides(self, tmx: TiledMap, name: str) -> List[pygame.Rect]:
         rects: List[pygame.Rect] = []
-        layer = self.tmx.get_layer_by_name(name)
-        tw = int(self.tmx.tilewidth * self.scale)
-        th = int(self.tmx.tileheight * self.scale)
+        layer = tmx.get_layer_by_name(name)
+        tw = int(tmx.tilewidth * self.scale)
+        th = int(tmx.tileheight * self.scale)
         for x, y, gid in layer.tiles():
             if gid:
                 rects.append(pygame.Rect(int(x * tw), int(y * th), tw, th))
         return rects
 
 
-    def _load_objects(self, name: str) -> List[pygame.Rect]:
+    def _tile_cells(self, tmx: TiledMap, names: List[str]) -> set[Cell]:
+        cells: set[Cell] = set()
+        for name in names:
+            layer = tmx.get_layer_by_name(name)
+            for x, y, gid in layer.tiles():
+                if gid:
+                    cells.add((x, y))
+        return cells
+
+
+    def _merge_cells(self, cells: set[Cell], stat: str) -> List[pygame.Rect]:
+        rows = self._merge_runs(cells, self.tile_w, self.tile_h)
+        cols = self._merge_runs(
+            {(y, x) for x, y in cells}, self.tile_h, self.tile_w
+        )
+        if len(cols) < len(rows):
+            rows = [pygame.Rect(r.y, r.x, r.h, r.w) for r in cols]
+        self.rect_stats[stat] = (len(cells), len(rows))
+        return rows
+
+
+    @staticmethod
+    def _merge_runs(cells: set[Cell], tw: int, th: int) -> List[pygame.Rect]:
+        by_row: dict[int, List[int]] = {}
+        for x, y in cells:
+            by_row.setdefault(y, []).append(x)
         rects: List[pygame.Rect] = []
-        for layer in self.tmx.objectgroups:
+        open_runs: dict[Tuple[int, int], pygame.Rect] = {}
+        for y in sorted(by_row):
+            xs = sorted(by_row[y])
+            runs: List[Tuple[int, int]] = []
+            start = prev = xs[0]
+            for x in xs[1:]:
+                if x != prev + 1:
+                    runs.append((start, prev))
+                    start = x
+                prev = x
+            runs.append((start, prev))
+            next_open: dict[Tuple[int, int], pygame.Rect] = {}
+            for run in runs:
+                rect = open_runs.get(run)
+                if rect is not None and rect.bottom == y * th:
+                    rect.height += th
+                else:
+                    rect = pygame.Rect(
+                        run[0] * tw, y * th, (run[1] - run[0] + 1) * tw, th
+                    )
+                    rects.append(rect)
+                next_open[run] = rect
+            open_runs = next_open
+        return rects
+
+
+    def blocks(self, door_open: bool) -> List[pygame.Rect]:
+        return self.blocks_open if door_open else self.blocks_closed
+
+
+    def _occupancy_grid(self, cells: set[Cell]) -> np.ndarray:
+        grid = np.zeros((self.rows, self.cols), dtype=bool)
+        if cells:
+            xs, ys = zip(*cells)
+            grid[list(ys), list(xs)] = True
+        return grid
+
+
+    @staticmethod
+    def _pack_rows(grid: np.ndarray) -> List[int]:
+        packed = np.packbits(grid, axis=1, bitorder="little")
+        return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+    def _solid(self, tx: int, ty: int, masks: List[int]) -> bool:
+        return 0 <= ty < len(masks) and tx >= 0 and bool((masks[ty] >> tx) & 1)
+
+
+    def point_in_wall(self, x: float, y: float, door_open: bool) -> bool:
+        tx, ty = int(x) // self.tile_w, int(y) // self.tile_h
+        if self._solid(tx, ty, self._row_masks[door_open]):
+            return True
+        return any(r.collidepoint(x, y) for r in self._loose[door_open])
+
+
+    def rect_in_wall(self, rect: pygame.Rect, door_open: bool) -> bool:
+        if rect.width > 0 and rect.height > 0:
+            masks = self._row_masks[door_open]
+            x0 = max(rect.left // self.tile_w, 0)
+            x1 = (rect.right - 1) // self.tile_w
+            y0 = max(rect.top // self.tile_h, 0)
+            y1 = min((rect.bottom - 1) // self.tile_h, len(masks) - 1)
+            if x0 <= x1:
+                span = ((1 << (x1 - x0 + 1)) - 1) << x0
+                for ty in range(y0, y1 + 1):
+                    if masks[ty] & span:
+                        return True
+        loose = self._loose[door_open]
+        return bool(loose) and rect.collidelist(loose) != -1
+
+
+    def rects_in_wall(
+        self,
+        left: np.ndarray,
+        top: np.ndarray,
+        right: np.ndarray,
+        bottom: np.ndarray,
+        door_open: bool,
+    ) -> np.ndarray:
+        grid = self.occupancy[door_open]
+        rows, cols = grid.shape
+        x0 = np.maximum(left // self.tile_w, 0)
+        x1 = np.minimum((right - 1) // self.tile_w, cols - 1)
+        y0 = np.maximum(top // self.tile_h, 0)
+        y1 = np.minimum((bottom - 1) // self.tile_h, rows - 1)
+        valid = (right > left) & (bottom > top) & (x0 <= x1) & (y0 <= y1)
+        hit = np.zeros(left.shape, dtype=bool)
+        if valid.any():
+            span_x = int((x1 - x0)[valid].max()) + 1
+            span_y = int((y1 - y0)[valid].max()) + 1
+            for oy in range(span_y):
+                ty = np.clip(np.minimum(y0 + oy, y1), 0, rows - 1)
+                for ox in range(span_x):
+                    tx = np.clip(np.minimum(x0 + ox, x1), 0, cols - 1)
+                    hit |= grid[ty, tx]
+            hit &= valid
+        for r in self._loose[door_open]:
+            hit |= (
+                (left < r.right) & (right > r.left) & (top < r.bottom) & (bottom > r.top)
+                & (right > left) & (bottom > top)
+            )
+        return hit
+
+
+    def segment_in_wall(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        door_open: bool,
+    ) -> bool:
+        tw, th = self.tile_w, self.tile_h
+        x0, y0 = start
+        x1, y1 = end
+        tx, ty = int(x0 // tw), int(y0 // th)
+        ex, ey = int(x1 // tw), int(y1 // th)
+        dx, dy = x1 - x0, y1 - y0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        if dx:
+            t_dx = abs(tw / dx)
+            t_x = ((tx + (dx > 0)) * tw - x0) / dx
+        else:
+            t_dx = t_x = float("inf")
+        if dy:
+            t_dy = abs(th / dy)
+            t_y = ((ty + (dy > 0)) * th - y0) / dy
+        else:
+            t_dy = t_y = float("inf")
+        masks = self._row_masks[door_open]
+        for _ in range(abs(ex - tx) + abs(ey - ty) + 1):
+            if self._solid(tx, ty, masks):
+                return True
+            if t_x < t_y:
+                tx += step_x
+                t_x += t_dx
+            else:
+                ty += step_y
+                t_y += t_dy
+        return any(r.clipline(start, end) for r in self._loose[door_open])
+
+
+    def _load_objects(self, tmx: TiledMap, name: str) -> List[pygame.Rect]:
+        rects: List[pygame.Rect] = []
+        for layer in tmx.objectgroups:
             if layer.name != name:
                 continue
             for obj in layer:
@@ -109,41 +410,50 @@ class GameMap(MapProtocol):
         return rect
 
 
-    def _render_map(self, exclude: set[str] | None = None) -> pygame.Surface:
-        tw, th = self.tile_w, self.tile_h
-        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        exclude = exclude or set()
-        for layer in self.tmx.visible_layers:
-            if not hasattr(layer, "tiles"):
-                continue
-            if layer.name in exclude:
+    @staticmethod
+    def _chunk_layers(tmx: TiledMap, door_open: bool) -> List[TiledTileLayer]:
+        doors = {name for names in DOOR_LAYERS.values() for name in names}
+        layers = [
+            layer
+            for layer in tmx.visible_layers
+            if hasattr(layer, "tiles") and layer.name not in doors
+        ]
+        for name in DOOR_LAYERS[door_open]:
+            if name not in tmx.layernames:
                 continue
-            for x, y, gid in layer.tiles():
-                tile = (
-                    gid if isinstance(gid, pygame.Surface) else self.tmx.get_tile_image_by_gid(gid)
-                )
-                if tile:
-                    tile = pygame.transform.scale(tile, (tw, th))
-                    surf.blit(tile, (x * tw, y * th))
-        return surf
+            layer = tmx.get_layer_by_name(name)
+            if hasattr(layer, "tiles"):
+                layers.append(layer)
+        return layers
+
 
+    def _tile(self, index: int) -> pygame.Surface:
+        tile = self._tiles.get(index)
+        if tile is None:
+            tile = pygame.image.frombuffer(
+                self._atlas[index], (self.tile_w, self.tile_h), "RGBA"
+            )
+            tile = tile.convert_alpha() if pygame.display.get_surface() else tile.copy()
+            self._tiles[index] = tile
+        return tile
 
-    def _render_layers(self, names: list[str]) -> pygame.Surface:
+
+    def _render_chunk(self, key: ChunkKey) -> pygame.Surface | None:
+        door_open, cx, cy = key
         tw, th = self.tile_w, self.tile_h
-        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        for name in names:
-            if name not in self.tmx.layernames:
-                continue
-            layer = self.tmx.get_layer_by_name(name)
-            if not hasattr(layer, "tiles"):
-                continue
-            for x, y, gid in layer.tiles():
-                tile = (
-                    gid if isinstance(gid, pygame.Surface) else self.tmx.get_tile_image_by_gid(gid)
-                )
-                if tile:
-                    tile = pygame.transform.scale(tile, (tw, th))
-                    surf.blit(tile, (x * tw, y * th))
+        step = settings.MAP_CHUNK_TILES
+        x0, y0 = cx * step, cy * step
+        x1 = min(x0 + step, self.cols)
+        y1 = min(y0 + step, self.rows)
+        blits = []
+        for grid in self._tile_grids[door_open][:, y0:y1, x0:x1]:
+            ys, xs = np.nonzero(grid)
+            for ty, tx, index in zip(ys.tolist(), xs.tolist(), grid[ys, xs].tolist()):
+                blits.append((self._tile(index), (tx * tw, ty * th)))
+        if not blits:
+            return None
+        surf = pygame.Surface(((x1 - x0) * tw, (y1 - y0) * th), pygame.SRCALPHA)
+        surf.blits(blits, doreturn=False)
         return surf
 
 
@@ -152,7 +462,18 @@ class GameMap(MapProtocol):
 
 
     def draw(self, surf: pygame.Surface, cam: Tuple[int, int], door_open: bool) -> None:
-        surf.blit(self.base_surface, (-cam[0], -cam[1]))
-        doors = self.open_doors if door_open else self.closed_doors
-        surf.blit(doors, (-cam[0], -cam[1]))
+        cw, ch = self.chunk_w, self.chunk_h
+        cam_x, cam_y = int(cam[0]), int(cam[1])
+        x0 = max(0, cam_x // cw)
+        y0 = max(0, cam_y // ch)
+        x1 = min(self.chunks_x, (cam_x + surf.get_width() - 1) // cw + 1)
+        y1 = min(self.chunks_y, (cam_y + surf.get_height() - 1) // ch + 1)
+        self.chunks.reserve(2 * max(0, x1 - x0) * max(0, y1 - y0))
+        blits = []
+        for cy in range(y0, y1):
+            for cx in range(x0, x1):
+                chunk = self.chunks.get((door_open, cx, cy))
+                if chunk is not None:
+                    blits.append((chunk, (cx * cw - cam_x, cy * ch - cam_y)))
+        surf.blits(blits, doreturn=False)
 
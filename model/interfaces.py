@@ -1,15 +1,58 @@
 from __future__ import annotations
 
-from typing import List, Protocol, Tuple
+from typing import Any, Dict, List, Protocol, Tuple, TYPE_CHECKING
 
 import pygame
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class MapProtocol(Protocol):
 
     collides: List[pygame.Rect]
     door_collides: List[pygame.Rect]
+    width: int
+    height: int
+    tile_w: int
+    tile_h: int
+    occupancy: Dict[bool, "np.ndarray"]
+
+    def blocks(self, door_open: bool) -> List[pygame.Rect]:
+        ...
+
+    def point_in_wall(self, x: float, y: float, door_open: bool) -> bool:
+        ...
+
+    def rect_in_wall(self, rect: pygame.Rect, door_open: bool) -> bool:
+        ...
+
+    def rects_in_wall(
+        self,
+        left: "np.ndarray",
+        top: "np.ndarray",
+        right: "np.ndarray",
+        bottom: "np.ndarray",
+        door_open: bool,
+    ) -> "np.ndarray":
+        ...
+
+    def segment_in_wall(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        door_open: bool,
+    ) -> bool:
+        ...
 
     def draw(self, surf: pygame.Surface, cam: Tuple[int, int], door_open: bool) -> None:
         ...
 
+
+class SpatialIndex(Protocol):
+
+    def insert(self, obj: Any, rect: pygame.Rect) -> None:
+        ...
+
+    def query(self, rect: pygame.Rect, found: List[Any] | None = None) -> List[Any]:
+        ...
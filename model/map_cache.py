@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "numpy is required for baked map caches. Install it with 'pip install numpy'."
+    ) from exc
+
+BAKE_VERSION = 1
+META = "meta.json"
+_SOURCE = re.compile(rb'source="([^"]+)"')
+
+Arrays = Dict[str, np.ndarray]
+
+
+def _digest(path: Path, sha: Any, seen: set[Path]) -> None:
+    path = path.resolve()
+    if path in seen or not path.exists():
+        return
+    seen.add(path)
+    data = path.read_bytes()
+    sha.update(path.name.encode())
+    sha.update(data)
+    if path.suffix in {".tmx", ".tsx"}:
+        for ref in _SOURCE.findall(data):
+            _digest(path.parent / ref.decode(), sha, seen)
+
+
+def bake_key(map_file: Path, scale: float) -> str:
+    sha = hashlib.sha1(f"{BAKE_VERSION}:{scale!r}".encode())
+    _digest(Path(map_file), sha, set())
+    return sha.hexdigest()[:16]
+
+
+def bake_dir(cache_dir: Path, map_file: Path, scale: float) -> Path:
+    return cache_dir / f"{Path(map_file).stem}-{bake_key(map_file, scale)}"
+
+
+def load(path: Path) -> Tuple[Arrays, Dict[str, Any]] | None:
+    try:
+        meta = json.loads((path / META).read_text())
+        if meta.get("version") != BAKE_VERSION:
+            return None
+        arrays = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r")
+            for name in meta["arrays"]
+        }
+    except (OSError, ValueError, KeyError):
+        return None
+    return arrays, meta
+
+
+def _superseded(path: Path, scale: float) -> bool:
+    try:
+        meta = json.loads((path / META).read_text())
+    except (OSError, ValueError):
+        return False
+    return meta.get("version") == BAKE_VERSION and meta.get("scale") == scale
+
+
+def save(path: Path, arrays: Arrays, meta: Dict[str, Any]) -> bool:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        for name, array in arrays.items():
+            np.save(tmp / f"{name}.npy", np.ascontiguousarray(array))
+        meta = dict(meta, version=BAKE_VERSION, arrays=sorted(arrays))
+        (tmp / META).write_text(json.dumps(meta))
+        prefix = path.name[: path.name.rindex("-") + 1]
+        for stale in path.parent.iterdir():
+            if (
+                stale.name.startswith(prefix)
+                and len(stale.name) == len(path.name)
+                and stale.name != path.name
+                and _superseded(stale, meta["scale"])
+            ):
+                shutil.rmtree(stale, ignore_errors=True)
+        os.replace(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        return False
+    return True
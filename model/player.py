@@ -9,6 +9,7 @@ import pygame
 ROOT_DIR = Path(__file__).resolve().parents[1]
 
 from model.bullet import PlayerBullet
+from model.clock import GameClock
 import settings
 import audio
 from settings import (
@@ -48,8 +49,11 @@ class Player(pygame.sprite.Sprite):
         y: int,
         scale_sprite: float = 1.0,
         scale_hitbox: float = 0.75,
+        *,
+        clock: GameClock,
     ) -> None:
         super().__init__()
+        self.clock = clock
         self.scale_sprite = scale_sprite
         self.scale_hitbox = scale_hitbox
         self._load_images()
@@ -128,7 +132,7 @@ class Player(pygame.sprite.Sprite):
 
 
     def update(self, keys: pygame.key.ScancodeWrapper, world: bool = True) -> None:
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         if now >= self.attack_until:
             vx = keys[pygame.K_d] - keys[pygame.K_a]
             vy = keys[pygame.K_s] - keys[pygame.K_w]
@@ -161,7 +165,7 @@ class Player(pygame.sprite.Sprite):
                 self.moving = False
         else:
             self.moving = False
-        if pygame.time.get_ticks() >= self.inv_until:
+        if now >= self.inv_until:
             self.inv_until = 0
             self.flash_until = 0
         if self.orbital_count:
@@ -170,16 +174,26 @@ class Player(pygame.sprite.Sprite):
             )
 
 
+    def animating(self) -> bool:
+        now = self.clock.now()
+        return (
+            self.moving
+            or bool(self.orbital_count)
+            or now < self.attack_until
+            or now < self.flash_until
+        )
+
+
     def damage(self) -> None:
-        if pygame.time.get_ticks() >= self.inv_until:
+        now = self.clock.now()
+        if now >= self.inv_until:
             self.lives = max(0, self.lives - 1)
-            now = pygame.time.get_ticks()
             self.inv_until = now + settings.INVINCIBILITY
             self.flash_until = self.inv_until
 
 
     def shoot(self, dx: int, dy: int) -> list[PlayerBullet]:
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         if now - self.last_shot < PLAYER_FIRE_DELAY:
             return []
         self.last_shot = now
@@ -205,12 +219,12 @@ class Player(pygame.sprite.Sprite):
             off = self.staff_offset[self.direction]
             sx = self.rect.centerx + off[0]
             sy = self.rect.centery + off[1]
-            bullets.append(PlayerBullet(sx, sy, vx, vy))
+            bullets.append(PlayerBullet.acquire(sx, sy, vx, vy))
         return bullets
 
 
     def draw(self, surf: pygame.Surface, cam: tuple[int, int]) -> None:
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         visible = True
         if now < self.flash_until:
             visible = (now // FLASH_STEP) % 2 == 0
@@ -229,10 +243,19 @@ class Player(pygame.sprite.Sprite):
                 self.rect.move(-cam[0], -cam[1] + PLAYER_SPRITE_Y_OFFSET),
             )
 
+        for rect in self._orbital_rects(cam):
+            surf.blit(self.orbital_img, rect)
+
+    def _orbital_rects(self, cam: tuple[int, int]) -> List[pygame.Rect]:
+        rects: List[pygame.Rect] = []
         for ang in self.orbital_angles():
             cx = self.rect.centerx + ORBITAL_RADIUS * math.cos(ang)
             cy = self.rect.centery + ORBITAL_RADIUS * math.sin(ang)
-            rect = self.orbital_img.get_rect(
-                center=(int(cx - cam[0]), int(cy - cam[1]))
+            rects.append(
+                self.orbital_img.get_rect(center=(int(cx - cam[0]), int(cy - cam[1])))
             )
-            surf.blit(self.orbital_img, rect)
+        return rects
+
+    def draw_rects(self, cam: tuple[int, int]) -> List[pygame.Rect]:
+        sprite = self.rect.move(-cam[0], -cam[1] + PLAYER_SPRITE_Y_OFFSET)
+        return [sprite, *self._orbital_rects(cam)]
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from itertools import compress
+from typing import Iterable, List, Tuple, TYPE_CHECKING
+
+import numpy as np
+import pygame
+
+import settings
+from .bullet import Projectile
+from .spatial_hash import cell_keys
+
+if TYPE_CHECKING:
+    from .interfaces import MapProtocol
+    from .spatial_hash import SpatialHash
+
+
+class ProjectileSystem:
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.dx = np.zeros(capacity, dtype=np.float64)
+        self.dy = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.int64)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.images: List[pygame.Surface] = []
+        self._dead = np.zeros(capacity, dtype=bool)
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("x", "y", "dx", "dy", "radius", "owner", "_dead"):
+            old = getattr(self, name)
+            arr = np.zeros(capacity, dtype=old.dtype)
+            arr[: self.count] = old[: self.count]
+            setattr(self, name, arr)
+
+    def append(self, bullet: Projectile) -> None:
+        self._grow(self.count + 1)
+        i = self.count
+        self.x[i] = bullet.x
+        self.y[i] = bullet.y
+        self.dx[i] = bullet.dx
+        self.dy[i] = bullet.dy
+        self.radius[i] = bullet.radius
+        self.owner[i] = bullet.OWNER
+        self.images.append(bullet.image)
+        self.count += 1
+        Projectile.release(bullet)
+
+    def extend(self, bullets: Iterable[Projectile]) -> None:
+        for b in bullets:
+            self.append(b)
+
+    def clear(self) -> None:
+        self.count = 0
+        self.images.clear()
+        self._dead[:] = False
+        self._dirty = False
+
+    def kill(self, index: int | np.ndarray) -> None:
+        self._dead[index] = True
+        self._dirty = True
+
+    def compact(self) -> None:
+        if not self._dirty:
+            return
+        n = self.count
+        keep = ~self._dead[:n]
+        m = int(keep.sum())
+        for arr in (self.x, self.y, self.dx, self.dy, self.radius, self.owner):
+            arr[:m] = arr[:n][keep]
+        self.images = list(compress(self.images, keep.tolist()))
+        self._dead[:n] = False
+        self.count = m
+        self._dirty = False
+
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        n = self.count
+        r = self.radius[:n]
+        left = np.trunc(self.x[:n] - r).astype(np.int64)
+        top = np.trunc(self.y[:n] - r).astype(np.int64)
+        return left, top, left + r * 2, top + r * 2
+
+    def step(
+        self, game_map: "MapProtocol", door_open: bool, cam: Tuple[int, int]
+    ) -> None:
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.dx[:n]
+        y += self.dy[:n]
+        left, top, right, bottom = self.bounds()
+        hit_wall = game_map.rects_in_wall(left, top, right, bottom, door_open)
+        off_world = ~(
+            (x >= 0) & (x <= settings.WORLD_W) & (y >= 0) & (y <= settings.WORLD_H)
+        )
+        size = right - left
+        sx, sy = left - cam[0], top - cam[1]
+        off_screen = ~(
+            (size > 0)
+            & (sx < settings.SCREEN_W)
+            & (sx + size > 0)
+            & (sy < settings.SCREEN_H)
+            & (sy + size > 0)
+        )
+        dead = hit_wall | off_world | off_screen
+        if dead.any():
+            self.kill(np.flatnonzero(dead))
+            self.compact()
+
+    def owned(self, owner: int) -> np.ndarray:
+        return np.flatnonzero(self.owner[: self.count] == owner)
+
+    def near(self, index: "SpatialHash", owner: int) -> List[int]:
+        idx = self.owned(owner)
+        if not len(idx) or not index.cells:
+            return []
+        cells = np.array(index.cell_rects(), dtype=np.int64)
+        keys = cell_keys(cells[:, 0], cells[:, 1])
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        left, top, w, h = cells[order, 2:].T
+        right, bottom = left + w, top + h
+        s = index.cell_size
+        px = np.trunc(self.x[idx]).astype(np.int64)
+        py = np.trunc(self.y[idx]).astype(np.int64)
+        shot_keys = cell_keys(px // s, py // s)
+        first = np.searchsorted(keys, shot_keys, side="left")
+        last = np.searchsorted(keys, shot_keys, side="right")
+        hit = np.zeros(len(idx), dtype=bool)
+        for k in range(int((last - first).max())):
+            j = first + k
+            live = j < last
+            j = np.minimum(j, len(keys) - 1)
+            hit |= (
+                live
+                & (px >= left[j]) & (px < right[j])
+                & (py >= top[j]) & (py < bottom[j])
+            )
+        return idx[hit].tolist()
+
+    def inside(self, rect: pygame.Rect, owner: int) -> List[int]:
+        idx = self.owned(owner)
+        if not len(idx):
+            return []
+        px = np.trunc(self.x[idx])
+        py = np.trunc(self.y[idx])
+        mask = (
+            (px >= rect.left) & (px < rect.right) & (py >= rect.top) & (py < rect.bottom)
+        )
+        return idx[mask].tolist()
+
+    def position(self, i: int) -> Tuple[float, float]:
+        return float(self.x[i]), float(self.y[i])
+
+    def rects(self) -> List[pygame.Rect]:
+        left, top, right, bottom = self.bounds()
+        return [
+            pygame.Rect(lx, ty, rx - lx, by - ty)
+            for lx, ty, rx, by in zip(
+                left.tolist(), top.tolist(), right.tolist(), bottom.tolist()
+            )
+        ]
+
+    def visible(self, view: pygame.Rect, margin: int = 0) -> np.ndarray:
+        left, top, right, bottom = self.bounds()
+        return np.flatnonzero(
+            (left < view.right + margin)
+            & (right > view.left - margin)
+            & (top < view.bottom + margin)
+            & (bottom > view.top - margin)
+        )
+
+    def blit_pairs(
+        self, cam: Tuple[int, int], view: pygame.Rect | None = None
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        left, top, _, _ = self.bounds()
+        images = self.images
+        if view is not None:
+            idx = self.visible(view, settings.CULL_MARGIN)
+            if len(idx) < self.count:
+                left, top = left[idx], top[idx]
+                images = [images[i] for i in idx.tolist()]
+        pos = zip((left - cam[0]).tolist(), (top - cam[1]).tolist())
+        return list(zip(images, pos))
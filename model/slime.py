@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 import pygame
 
+from .clock import GameClock
 from .enemy import Enemy
-from .quadtree import QuadTree
+from .collisions import BatchSameTypeCollision
+from .interfaces import SpatialIndex
 from .player import Player
 from .death_animation import SlimeDeathAnimation
 from settings import img
@@ -17,6 +19,7 @@ class Slime(Enemy):
     SPEED = 2.4
     SCALE_SPRITE = 2.4
     SCALE_HITBOX = 1.0
+    COLLIDER = BatchSameTypeCollision
 
     def __init__(
         self,
@@ -25,8 +28,10 @@ class Slime(Enemy):
         player: Player,
         scale_sprite: float | None = None,
         scale_hitbox: float | None = None,
+        *,
+        clock: GameClock,
     ) -> None:
-        super().__init__(x, y, Slime.SPEED, scale_sprite, scale_hitbox)
+        super().__init__(x, y, Slime.SPEED, scale_sprite, scale_hitbox, clock=clock)
         self.player = player
         self._load_images()
         self.image = self.walk[self.direction][0]
@@ -34,15 +39,22 @@ class Slime(Enemy):
 
 
     def _load_images(self) -> None:
+        bank = self.sprite_bank(self.scale_sprite)
+        self.walk = bank["walk"]
+        self.death = bank["death"]
+
+
+    @classmethod
+    def _build_bank(cls, scale: float) -> Dict[str, Any]:
         root = Path(__file__).resolve().parents[1] / "assets" / "enemies" / "slime"
         walk_dir = root / "slime_walk"
         def load_scaled(path: Path) -> pygame.Surface:
             base = img(path)
-            w = int(base.get_width() * self.scale_sprite)
-            h = int(base.get_height() * self.scale_sprite)
+            w = int(base.get_width() * scale)
+            h = int(base.get_height() * scale)
             return pygame.transform.scale(base, (w, h))
 
-        self.walk = {
+        walk = {
             "left": [
                 load_scaled(walk_dir / "slime_walking_left_0001.png"),
                 load_scaled(walk_dir / "slime_walking_left_0002.png"),
@@ -53,13 +65,14 @@ class Slime(Enemy):
             ],
         }
         def load_death(side: str) -> List[pygame.Surface]:
-            anim = SlimeDeathAnimation(side, self.scale_sprite)
+            anim = SlimeDeathAnimation(side, scale)
             return anim.frames
 
-        self.death = {
+        death = {
             "left": load_death("left"),
             "right": load_death("right"),
         }
+        return {"walk": walk, "death": death}
 
 
     def death_frames(self) -> List[pygame.Surface]:
@@ -70,7 +83,7 @@ class Slime(Enemy):
         self,
         swarm: List[Enemy],
         cam: tuple[int, int],
-        tree: "QuadTree",
+        tree: "SpatialIndex",
     ) -> None:
         self.chase_and_collide(self.player, tree)
         self.image = self.animate_walk(self.walk)
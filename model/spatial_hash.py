@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+import pygame
+
+Cell = Tuple[int, int]
+Span = Tuple[int, int, int, int]
+
+CELL_KEY_SHIFT = 21
+CELL_KEY_OFFSET = 1 << 20
+
+
+def cell_keys(cx: Any, cy: Any) -> Any:
+    return ((cx + CELL_KEY_OFFSET) << CELL_KEY_SHIFT) | (cy + CELL_KEY_OFFSET)
+
+
+class SpatialHash:
+
+    def __init__(self, cell_size: int = 128) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, Dict[Any, None]] = {}
+        self._entries: Dict[Any, Tuple[pygame.Rect, Span]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, obj: Any) -> bool:
+        return obj in self._entries
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self._entries.clear()
+
+    def _span(self, rect: pygame.Rect) -> Span:
+        s = self.cell_size
+        return (
+            rect.left // s,
+            rect.top // s,
+            max(rect.left, rect.right - 1) // s,
+            max(rect.top, rect.bottom - 1) // s,
+        )
+
+    def _link(self, obj: Any, span: Span) -> None:
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    bucket = self.cells[(cx, cy)] = {}
+                bucket[obj] = None
+
+    def _unlink(self, obj: Any, span: Span) -> None:
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                bucket.pop(obj, None)
+                if not bucket:
+                    del self.cells[(cx, cy)]
+
+    def insert(self, obj: Any, rect: pygame.Rect) -> None:
+        if obj in self._entries:
+            self.update(obj, rect)
+            return
+        span = self._span(rect)
+        self._entries[obj] = (rect, span)
+        self._link(obj, span)
+
+    def update(self, obj: Any, rect: pygame.Rect) -> None:
+        entry = self._entries.get(obj)
+        if entry is None:
+            self.insert(obj, rect)
+            return
+        span = self._span(rect)
+        if span != entry[1]:
+            self._unlink(obj, entry[1])
+            self._link(obj, span)
+        self._entries[obj] = (rect, span)
+
+    def remove(self, obj: Any) -> None:
+        entry = self._entries.pop(obj, None)
+        if entry is not None:
+            self._unlink(obj, entry[1])
+
+    def cell_rects(self) -> List[Tuple[int, int, int, int, int, int]]:
+        entries = self._entries
+        return [
+            (cx, cy, *entries[o][0])
+            for (cx, cy), bucket in self.cells.items()
+            for o in bucket
+        ]
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        s = self.cell_size
+        bucket = self.cells.get((int(x) // s, int(y) // s), ())
+        return [o for o in bucket if self._entries[o][0].collidepoint(x, y)]
+
+    def query(self, rect: pygame.Rect, found: List[Any] | None = None) -> List[Any]:
+        if found is None:
+            found = []
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        entries = self._entries
+        if x0 == x1 and y0 == y1:
+            for o in cells.get((x0, y0), ()):
+                if entries[o][0].colliderect(rect):
+                    found.append(o)
+            return found
+        candidates: Dict[Any, None] = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    candidates.update(bucket)
+        for o in candidates:
+            if entries[o][0].colliderect(rect):
+                found.append(o)
+        return found
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pygame
+
+import settings
+from .interfaces import MapProtocol
+
+Size = Tuple[int, int]
+Buckets = Tuple[np.ndarray, np.ndarray]
+Span = Tuple[List[int], List[int]]
+
+
+class SpawnIndex:
+
+    def __init__(
+        self,
+        game_map: MapProtocol,
+        cell: int = settings.SPAWN_CELL,
+        bucket: int = settings.SPAWN_BUCKET,
+        door_open: bool = False,
+    ) -> None:
+        self.map = game_map
+        self.cell = cell
+        self.bucket = bucket
+        self.door_open = door_open
+        ys, xs = np.mgrid[cell // 2:game_map.height:cell, cell // 2:game_map.width:cell]
+        self.xs = xs.ravel()
+        self.ys = ys.ravel()
+        self.cols = -(-game_map.width // bucket)
+        self.rows = -(-game_map.height // bucket)
+        self._ids = (self.ys // bucket) * self.cols + self.xs // bucket
+        self._buckets: Dict[Size, Buckets] = {}
+        self._rings: Dict[Tuple[float, float], np.ndarray] = {}
+        self._spans: Dict[Size, Tuple[Tuple[int, int, float, float], Span]] = {}
+
+    def prepare(self, size: Size) -> Buckets:
+        found = self._buckets.get(size)
+        if found is None:
+            w, h = size
+            left = self.xs - w // 2
+            top = self.ys - h // 2
+            hit = self.map.rects_in_wall(left, top, left + w, top + h, self.door_open)
+            free = np.flatnonzero(~hit)
+            ids = self._ids[free]
+            order = free[np.argsort(ids, kind="stable")]
+            counts = np.bincount(ids, minlength=self.rows * self.cols)
+            starts = np.concatenate(([0], np.cumsum(counts)))
+            found = self._buckets[size] = order, starts
+        return found
+
+    def _ring(self, lo: float, hi: float) -> np.ndarray:
+        found = self._rings.get((lo, hi))
+        if found is None:
+            reach = int(hi // self.bucket) + 2
+            oy, ox = np.mgrid[-reach:reach + 1, -reach:reach + 1]
+            near = np.maximum(np.abs(ox) - 1, 0), np.maximum(np.abs(oy) - 1, 0)
+            far = np.abs(ox) + 1, np.abs(oy) + 1
+            keep = (np.hypot(*near) * self.bucket <= hi) & (np.hypot(*far) * self.bucket >= lo)
+            found = self._rings[(lo, hi)] = np.stack((ox[keep], oy[keep]), axis=1)
+        return found
+
+    def _gather(self, size: Size, bx: int, by: int, lo: float, hi: float) -> Span:
+        key = (bx, by, lo, hi)
+        cached = self._spans.get(size)
+        if cached is None or cached[0] != key:
+            _, starts = self.prepare(size)
+            ring = self._ring(lo, hi)
+            cols = ring[:, 0] + bx
+            rows = ring[:, 1] + by
+            inside = (cols >= 0) & (cols < self.cols) & (rows >= 0) & (rows < self.rows)
+            ids = rows[inside] * self.cols + cols[inside]
+            first = starts[ids]
+            counts = starts[ids + 1] - first
+            keep = counts > 0
+            ends = np.cumsum(counts[keep])
+            offsets = first[keep] - ends + counts[keep]
+            cached = self._spans[size] = key, (ends.tolist(), offsets.tolist())
+        return cached[1]
+
+    def sample(
+        self,
+        size: Size,
+        x: float,
+        y: float,
+        lo: float,
+        hi: float,
+        rng: random.Random,
+        avoid: pygame.Rect | None = None,
+    ) -> Tuple[int, int] | None:
+        order, _ = self.prepare(size)
+        ends, offsets = self._gather(size, int(x) // self.bucket, int(y) // self.bucket, lo, hi)
+        if not ends:
+            return None
+        total = ends[-1]
+        for _ in range(settings.SPAWN_TRIES):
+            pick = rng.randrange(total)
+            i = order[pick + offsets[bisect_right(ends, pick)]]
+            px, py = int(self.xs[i]), int(self.ys[i])
+            if not lo * lo <= (px - x) ** 2 + (py - y) ** 2 <= hi * hi:
+                continue
+            if avoid is not None and avoid.collidepoint(px, py):
+                continue
+            return px, py
+        return None
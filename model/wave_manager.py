@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import math
 import random
-from typing import List, TYPE_CHECKING
-import pygame
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
+from model.clock import GameClock
 from model.enemy import Enemy
+from model.flow_field import FlowField
 from model.zombie_archer import ZombieArcher
 from model.slime import Slime
 from model.wasp import Wasp
-from model.bullet import Projectile
+from model.projectile_system import ProjectileSystem
+from model.spawn_index import SpawnIndex
 from model.interfaces import MapProtocol
 import settings
+import tracing
 from settings import SPAWN_MIN_DIST, SPAWN_RANGE, TICKET, TOTAL_WAVES, clamp
 
 if TYPE_CHECKING:
@@ -20,15 +22,33 @@ if TYPE_CHECKING:
 
 class WaveManager:
 
+    KINDS = (Slime, Wasp, ZombieArcher)
+
+    @staticmethod
+    def preload_sprites() -> int:
+        for kind in WaveManager.KINDS:
+            kind.sprite_bank()
+        return Enemy.bank_bytes()
+
     def __init__(
         self,
         player: Player,
-        enemy_bullets: list[Projectile],
+        enemy_bullets: ProjectileSystem,
         game_map: MapProtocol,
+        clock: GameClock | None = None,
+        rng: random.Random | None = None,
+        flow: FlowField | None = None,
     ) -> None:
         self.player = player
+        self.clock = clock or player.clock
+        self.rng = rng or random.Random()
         self.enemy_bullets = enemy_bullets
         self.map = game_map
+        self.flow = flow
+        self.spawns = SpawnIndex(game_map)
+        self._sizes: Dict[str, Tuple[int, int]] = {}
+        for kind in TICKET:
+            self.spawns.prepare(self._size(kind))
         self.wave = 1
         self.enemies: List[Enemy] = []
         self._pending: List[str] = self._plan_wave()
@@ -46,50 +66,51 @@ class WaveManager:
 
 
     def update(self) -> None:
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         if self._pending and now >= self._next_spawn:
             for _ in range(settings.WAVE_SPAWN_BATCH):
                 if not self._pending:
                     break
                 kind = self._pending.pop(0)
-                self.enemies.append(self._spawn(kind))
+                with tracing.span("WaveManager._spawn", kind=kind):
+                    self.enemies.append(self._spawn(kind))
             self._next_spawn = now + settings.WAVE_SPAWN_DELAY
 
 
+    def _size(self, kind: str) -> Tuple[int, int]:
+        size = self._sizes.get(kind)
+        if size is None:
+            size = self._sizes[kind] = self._create_enemy(kind, 0, 0).collision_rect().size
+        return size
+
     def _spawn(self, kind: str) -> Enemy:
-        blocks = self.map.collides + self.map.door_collides
-        for _ in range(settings.SPAWN_TRIES):
-            ang = random.uniform(0, 2 * math.pi)
-            dist = random.uniform(SPAWN_MIN_DIST, SPAWN_MIN_DIST + SPAWN_RANGE)
-            x = clamp(
-                self.player.rect.centerx + math.cos(ang) * dist,
-                0,
-                settings.WORLD_W,
-            )
-            y = clamp(
-                self.player.rect.centery + math.sin(ang) * dist,
-                0,
-                settings.WORLD_H,
-            )
-            if self.player.collision_rect().collidepoint(x, y):
-                continue
-            enemy = self._create_enemy(kind, x, y)
-            rect = enemy.collision_rect()
-            if any(rect.colliderect(b) for b in blocks):
-                continue
-            return enemy
-        x = clamp(self.player.rect.centerx + SPAWN_MIN_DIST, 0, settings.WORLD_W)
-        y = clamp(self.player.rect.centery, 0, settings.WORLD_H)
+        cx, cy = self.player.rect.center
+        spot = self.spawns.sample(
+            self._size(kind),
+            cx,
+            cy,
+            SPAWN_MIN_DIST,
+            SPAWN_MIN_DIST + SPAWN_RANGE,
+            self.rng,
+            self.player.collision_rect(),
+        )
+        if spot is not None:
+            return self._create_enemy(kind, *spot)
+        x = clamp(cx + SPAWN_MIN_DIST, 0, settings.WORLD_W)
+        y = clamp(cy, 0, settings.WORLD_H)
         return self._create_enemy(kind, x, y)
 
     def _create_enemy(self, kind: str, x: float, y: float) -> Enemy:
         if kind == "slime":
-            return Slime(x, y, self.player)
-        if kind == "wasp":
-            return Wasp(x, y, self.player)
-        if kind == "zombie_archer":
-            return ZombieArcher(x, y, self.player, self.enemy_bullets)
-        raise ValueError(f"Unknown enemy kind: {kind}")
+            enemy: Enemy = Slime(x, y, self.player, clock=self.clock)
+        elif kind == "wasp":
+            enemy = Wasp(x, y, self.player, clock=self.clock)
+        elif kind == "zombie_archer":
+            enemy = ZombieArcher(x, y, self.player, self.enemy_bullets, clock=self.clock)
+        else:
+            raise ValueError(f"Unknown enemy kind: {kind}")
+        enemy.flow = self.flow
+        return enemy
 
     def _plan_wave(self) -> List[str]:
         budget = int(settings.WAVE_BUDGET_BASE * (settings.WAVE_BUDGET_GROWTH ** (self.wave - 1)))
@@ -111,11 +132,11 @@ class WaveManager:
             min_ticket = min(TICKET[k] for k in avail)
             if budget < min_ticket:
                 break
-            kind = random.choice(avail)
+            kind = self.rng.choice(avail)
             if TICKET[kind] <= budget:
                 budget -= TICKET[kind]
                 if kind == "zombie_archer":
                     archers += 1
                 swarm.append(kind)
-        random.shuffle(swarm)
+        self.rng.shuffle(swarm)
         return swarm
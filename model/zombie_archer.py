@@ -2,16 +2,18 @@ from __future__ import annotations
 
 import math
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 import pygame
 
+from .clock import GameClock
 from .enemy import Enemy
 from .player import Player
 from .bullet import EnemyBullet
+from .projectile_system import ProjectileSystem
 from .death_animation import ZombieArcherDeathAnimation
 from .collisions import SameTypeCollision
-from .quadtree import QuadTree
+from .interfaces import SpatialIndex
 import settings
 import audio
 from settings import ENEMY_BULLET_SPEED, img
@@ -34,11 +36,15 @@ class ZombieArcher(Enemy):
         x: float,
         y: float,
         player: Player,
-        enemy_bullets: List[EnemyBullet],
+        enemy_bullets: ProjectileSystem,
         scale_sprite: float | None = None,
         scale_hitbox: float | None = None,
+        *,
+        clock: GameClock,
     ) -> None:
-        super().__init__(x, y, ZombieArcher.SPEED, scale_sprite, scale_hitbox, SameTypeCollision())
+        super().__init__(
+            x, y, ZombieArcher.SPEED, scale_sprite, scale_hitbox, SameTypeCollision(), clock=clock
+        )
         self.player = player
         self.enemy_bullets = enemy_bullets
         self.last_shot = 0
@@ -50,18 +56,28 @@ class ZombieArcher(Enemy):
 
 
     def _load_images(self) -> None:
+        bank = self.sprite_bank(self.scale_sprite)
+        self.walk_body = bank["walk_body"]
+        self.walk_head = bank["walk_head"]
+        self.bow_base = bank["bow_base"]
+        self.bow_frames = bank["bow_frames"]
+        self.death = bank["death"]
+
+
+    @classmethod
+    def _build_bank(cls, scale: float) -> Dict[str, Any]:
         root = Path(__file__).resolve().parents[1] / "assets" / "enemies" / "zombie_archer"
         walk_root = root / "zombie_archer_walk"
 
         def load_scaled(path: Path) -> pygame.Surface:
             base = img(path)
-            w = int(base.get_width() * self.scale_sprite)
-            h = int(base.get_height() * self.scale_sprite)
+            w = int(base.get_width() * scale)
+            h = int(base.get_height() * scale)
             return pygame.transform.scale(base, (w, h))
 
         body_dir = walk_root / "body"
         head_dir = walk_root / "head"
-        self.walk_body = {
+        walk_body = {
             "left": [
                 load_scaled(body_dir / "zombie_archer_walking_body_left_0001.png"),
                 load_scaled(body_dir / "zombie_archer_walking_body_left_0002.png"),
@@ -71,7 +87,7 @@ class ZombieArcher(Enemy):
                 load_scaled(body_dir / "zombie_archer_walking_body_right_0002.png"),
             ],
         }
-        self.walk_head = {
+        walk_head = {
             "left": [
                 load_scaled(head_dir / "zombie_archer_walking_head_left_0001.png"),
                 load_scaled(head_dir / "zombie_archer_walking_head_left_0002.png"),
@@ -81,17 +97,23 @@ class ZombieArcher(Enemy):
                 load_scaled(head_dir / "zombie_archer_walking_head_right_0002.png"),
             ],
         }
-        self.bow_base = load_scaled(root / "bow.png")
-        self.bow_frames = {
-            ang: pygame.transform.rotate(self.bow_base, ang)
+        bow_base = load_scaled(root / "bow.png")
+        bow_frames = {
+            ang: pygame.transform.rotate(bow_base, ang)
             for ang in range(0, 360, settings.BOW_ANGLE_STEP)
         }
 
         def load_death(side: str) -> List[pygame.Surface]:
-            anim = ZombieArcherDeathAnimation(side, self.scale_sprite)
+            anim = ZombieArcherDeathAnimation(side, scale)
             return anim.frames
 
-        self.death = {"left": load_death("left"), "right": load_death("right")}
+        return {
+            "walk_body": walk_body,
+            "walk_head": walk_head,
+            "bow_base": bow_base,
+            "bow_frames": bow_frames,
+            "death": {"left": load_death("left"), "right": load_death("right")},
+        }
 
 
     def death_frames(self) -> List[pygame.Surface]:
@@ -120,10 +142,10 @@ class ZombieArcher(Enemy):
         self,
         swarm: List[Enemy],
         cam: tuple[int, int],
-        tree: "QuadTree",
+        tree: "SpatialIndex",
     ) -> None:
         dist, dx, dy = self.chase_and_collide(self.player, tree)
-        now = pygame.time.get_ticks()
+        now = self.clock.now()
         self.body_img = self.animate_walk(self.walk_body, ANIM_STEP)
         self.head_img = self.animate_walk(self.walk_head, ANIM_STEP)
         if (
@@ -135,7 +157,7 @@ class ZombieArcher(Enemy):
                 vx = ENEMY_BULLET_SPEED * dx / dist
                 vy = ENEMY_BULLET_SPEED * dy / dist
                 audio.BOW.play()
-                self.enemy_bullets.append(EnemyBullet(self.x, self.y, vx, vy))
+                self.enemy_bullets.append(EnemyBullet.acquire(self.x, self.y, vx, vy))
 
 
     def draw(self, surf: pygame.Surface, cam: tuple[int, int]) -> None:
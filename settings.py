@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import math
+import os
+from collections import OrderedDict
 from pathlib import Path
 import pygame
 
@@ -20,11 +22,21 @@ def set_fullscreen() -> pygame.Surface:
 
 
 MAP_SCALE = 4 * 0.8
+MAP_CHUNK_TILES = 8
+MAP_CHUNK_CACHE = 64
+MAP_CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "maps"
+TRACE_PATH = os.environ.get("ARENA_TRACE")
+RECORD_PATH = os.environ.get("ARENA_RECORD")
 
 
 WORLD_W, WORLD_H = 4_096, 3_276
 CAPTION = "The mythical arena"
 FPS = 60
+RENDER_FPS = 144
+SIM_HZ = 60
+MAX_SIM_STEPS = 5
+TIME_SCALE = 1.0
+IDLE_WAIT_MS = 250
 
 WHITE = (255, 255, 255)
 BG_COLOR = (39, 32, 30)
@@ -54,9 +66,25 @@ SPAWN_HAZE = 210
 TOTAL_WAVES = 4
 TICKET = {"slime": 1, "wasp": 2, "zombie_archer": 3}
 ENEMY_UPDATE_MARGIN = 200
+ENEMY_LOD = True
+LOD_MID_MARGIN = 1_200
+LOD_MID_INTERVAL = 4
+LOD_FAR_INTERVAL = 12
+ENEMY_FLOW_FIELD = True
+FLOW_RINGS_PER_STEP = 16
+FLOW_WALL_COST = 4
+CULL_MARGIN = 128
+RENDER_CULLING = True
+DIRTY_RECTS = True
+DIRTY_MAX_RECTS = 48
+SPATIAL_CELL = 128
 WAVE_SPAWN_DELAY = 400
 WAVE_SPAWN_BATCH = 3
+AUTOPILOT_RANGE = 320
+AUTOPILOT_DETOUR = 45
+PROFILE_WINDOW = 120
 BOW_ANGLE_STEP = 10
+ARROW_ANGLE_STEP = 5
 
 
 BTN_W, BTN_H = 265, 135
@@ -72,17 +100,84 @@ REWARD_TEXT_XOFF = 140
 REWARD_TEXT_Y = 100
 SPAWN_Y_OFF = 150
 SPAWN_TRIES = 100
+SPAWN_CELL = 32
+SPAWN_BUCKET = 64
 WAVE_BUDGET_BASE = 25
 WAVE_BUDGET_GROWTH = 1.5
 ARCHER_CAP = 10
 
+TEXT_CACHE_SIZE = 128
+GLYPHS = "0123456789x/:+-. "
+
 _font_cache: dict[int, pygame.font.Font] = {}
 _font_path = Path(__file__).resolve().parent / "assets" / "UI" / "font" / "pixel-font.ttf"
+_text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+_glyph_cache: dict[tuple, tuple[pygame.Surface, dict[str, pygame.Rect]]] = {}
+TEXT_STATS = {"hits": 0, "misses": 0, "glyphs": 0}
 
-def txt(text: str, size: int, color: tuple[int, int, int] = WHITE) -> pygame.Surface:
+
+def _font(size: int) -> pygame.font.Font:
     if size not in _font_cache:
         _font_cache[size] = pygame.font.Font(_font_path.as_posix(), size)
-    return _font_cache[size].render(text, True, color)
+    return _font_cache[size]
+
+
+def txt(text: str, size: int, color: tuple[int, int, int] = WHITE) -> pygame.Surface:
+    key = (text, size, color)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        TEXT_STATS["hits"] += 1
+        _text_cache.move_to_end(key)
+        return surf
+    TEXT_STATS["misses"] += 1
+    surf = _text_cache[key] = _font(size).render(text, True, color)
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surf
+
+
+def text_hit_rate() -> float:
+    total = TEXT_STATS["hits"] + TEXT_STATS["misses"]
+    return TEXT_STATS["hits"] / total if total else 0.0
+
+
+def _glyph_atlas(
+    size: int, color: tuple[int, int, int]
+) -> tuple[pygame.Surface, dict[str, pygame.Rect]]:
+    key = (size, color)
+    if key not in _glyph_cache:
+        font = _font(size)
+        glyphs = [font.render(ch, True, color) for ch in GLYPHS]
+        atlas = pygame.Surface(
+            (sum(g.get_width() for g in glyphs), max(g.get_height() for g in glyphs)),
+            pygame.SRCALPHA,
+        )
+        areas: dict[str, pygame.Rect] = {}
+        x = 0
+        for ch, glyph in zip(GLYPHS, glyphs):
+            areas[ch] = atlas.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        _glyph_cache[key] = (atlas, areas)
+    return _glyph_cache[key]
+
+
+def blit_glyphs(
+    surf: pygame.Surface,
+    text: str,
+    pos: tuple[int, int],
+    size: int,
+    color: tuple[int, int, int] = WHITE,
+) -> pygame.Rect:
+    atlas, areas = _glyph_atlas(size, color)
+    x, y = pos
+    blits = []
+    for ch in text:
+        area = areas[ch]
+        blits.append((atlas, (x, y), area))
+        x += area.width
+    surf.blits(blits, doreturn=False)
+    TEXT_STATS["glyphs"] += len(blits)
+    return pygame.Rect(pos, (x - pos[0], atlas.get_height()))
 
 _image_cache: dict[Path, pygame.Surface] = {}
 
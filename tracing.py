@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Dict, Tuple
+
+ENABLED = False
+_BATCH = 512
+
+Event = Tuple[str, int, int, int, Dict[str, Any] | None]
+
+_queue: "queue.SimpleQueue[Event | None]" = queue.SimpleQueue()
+_writer: threading.Thread | None = None
+
+
+class _Span:
+
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: Dict[str, Any] | None) -> None:
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> "_Span":
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        complete(self.name, self.start, perf_counter_ns(), self.args)
+
+
+class _NullSpan:
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL = _NullSpan()
+
+
+def span(name: str, **args: Any) -> _Span | _NullSpan:
+    if not ENABLED:
+        return _NULL
+    return _Span(name, args or None)
+
+
+def complete(name: str, start: int, end: int, args: Dict[str, Any] | None = None) -> None:
+    if ENABLED:
+        _queue.put((name, start, end, threading.get_ident(), args))
+
+
+def _write(path: Path, events: "queue.SimpleQueue[Event | None]") -> None:
+    pid = os.getpid()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as out:
+        meta = {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": threading.main_thread().ident,
+            "args": {"name": "main"},
+        }
+        out.write("[\n" + json.dumps(meta))
+        done = False
+        while not done:
+            batch = [events.get()]
+            while len(batch) < _BATCH:
+                try:
+                    batch.append(events.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for item in batch:
+                if item is None:
+                    done = True
+                    break
+                name, start, end, tid, args = item
+                extra = f', "args": {json.dumps(args, default=str)}' if args else ""
+                lines.append(
+                    f',\n{{"name": {json.dumps(name)}, "ph": "X", "ts": {start / 1_000:.3f},'
+                    f' "dur": {(end - start) / 1_000:.3f}, "pid": {pid}, "tid": {tid}{extra}}}'
+                )
+            out.write("".join(lines))
+        out.write("\n]\n")
+
+
+def start(path: Path | str) -> None:
+    global ENABLED, _writer
+    if _writer is not None:
+        stop()
+    _writer = threading.Thread(
+        target=_write, args=(Path(path), _queue), name="trace-writer", daemon=True
+    )
+    _writer.start()
+    ENABLED = True
+
+
+def stop() -> None:
+    global ENABLED, _writer
+    ENABLED = False
+    if _writer is None:
+        return
+    _queue.put(None)
+    _writer.join()
+    _writer = None
+
+
+atexit.register(stop)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import ClassVar, Hashable, List, Set, Tuple
+import pygame
+
+import settings
+
+Item = Tuple[Hashable, Tuple[int, int, int, int]]
+EXPOSE_EVENTS = frozenset((
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWFOCUSGAINED,
+))
+
+
+class DirtyRects:
+
+    _exposures: ClassVar[int] = 0
+
+    def __init__(self, enabled: bool | None = None) -> None:
+        self.enabled = settings.DIRTY_RECTS if enabled is None else enabled
+        self.full = True
+        self._seen = DirtyRects._exposures
+        self.rects: List[pygame.Rect] = []
+        self._cam: Tuple[int, int] | None = None
+        self._state: Hashable = None
+        self._items: Set[Item] = set()
+        self._next: Set[Item] = set()
+        self.stats = {"full": 0, "partial": 0, "skipped": 0}
+
+    @classmethod
+    def notice(cls, event: pygame.event.Event) -> None:
+        if event.type in EXPOSE_EVENTS:
+            cls._exposures += 1
+
+    def invalidate(self) -> None:
+        self.full = True
+
+    def camera(self, cam: Tuple[int, int]) -> None:
+        if cam != self._cam:
+            self._cam = cam
+            self.full = True
+
+    def state(self, key: Hashable) -> None:
+        if key != self._state:
+            self._state = key
+            self.full = True
+
+    def add(self, token: Hashable, rect: pygame.Rect) -> None:
+        self._next.add((token, tuple(rect)))
+
+    def touch(self, rect: pygame.Rect) -> None:
+        self._next.add((object(), tuple(rect)))
+
+    def begin(self, surf: pygame.Surface) -> bool:
+        changed = self._items ^ self._next
+        self._items, self._next = self._next, set()
+        if self._seen != DirtyRects._exposures:
+            self._seen = DirtyRects._exposures
+            self.full = True
+        if not self.enabled or len(changed) > settings.DIRTY_MAX_RECTS:
+            self.full = True
+        if self.full:
+            surf.set_clip(None)
+            return True
+        bounds = surf.get_rect()
+        self.rects = [bounds.clip(r) for _, r in changed]
+        self.rects = [r for r in self.rects if r.width and r.height]
+        if not self.rects:
+            self.stats["skipped"] += 1
+            return False
+        surf.set_clip(self.rects[0].unionall(self.rects[1:]))
+        return True
+
+    def present(self, surf: pygame.Surface) -> None:
+        surf.set_clip(None)
+        if self.full:
+            self.stats["full"] += 1
+            pygame.display.flip()
+            self.full = False
+        else:
+            self.stats["partial"] += 1
+            pygame.display.update(self.rects)
+        self.rects = []
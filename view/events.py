@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import List
+import pygame
+
+import settings
+from .dirty import DirtyRects
+
+
+def wait_events(clock: pygame.time.Clock, idle: bool = True) -> List[pygame.event.Event]:
+    if not idle or not settings.IDLE_WAIT_MS:
+        clock.tick(settings.FPS)
+        events = pygame.event.get()
+    else:
+        first = pygame.event.wait(settings.IDLE_WAIT_MS)
+        events = pygame.event.get()
+        if first.type != pygame.NOEVENT:
+            events.insert(0, first)
+        clock.tick()
+    for event in events:
+        DirtyRects.notice(event)
+    return events
@@ -8,10 +8,13 @@ import audio
 import music
 
 import settings
-from settings import FPS, txt, img, BTN_W, BTN_H, BTN_SPACING, MENU_TITLE_OFF
+from settings import txt, img, BTN_W, BTN_H, BTN_SPACING, MENU_TITLE_OFF
 TITLE_SIZE = 60
 BTN_LABEL_SIZE = 38
 from controller.game import GameController
+from model.wave_manager import WaveManager
+from .dirty import DirtyRects
+from .events import wait_events
 
 
 class Menu:
@@ -25,22 +28,49 @@ class Menu:
         size = (BTN_W, BTN_H)
         self.btn = pygame.transform.scale(base, size)
         self.btn_hover = pygame.transform.scale(hover, size)
+        WaveManager.preload_sprites()
+
+    def _draw(
+        self,
+        start_btn: pygame.Rect,
+        exit_btn: pygame.Rect,
+        start_img: pygame.Surface,
+        exit_img: pygame.Surface,
+    ) -> None:
+        self.surf.blit(self.bg, (0, 0))
+        title = txt("The mythical arena", TITLE_SIZE)
+        self.surf.blit(
+            title,
+            (
+                settings.SCREEN_W // 2 - title.get_width() // 2,
+                settings.SCREEN_H // 2 - MENU_TITLE_OFF,
+            ),
+        )
+        self.surf.blit(start_img, start_btn)
+        self.surf.blit(exit_img, exit_btn)
+        start_label = txt("START", BTN_LABEL_SIZE)
+        exit_label = txt("EXIT", BTN_LABEL_SIZE)
+        self.surf.blit(
+            start_label,
+            (
+                start_btn.centerx - start_label.get_width() // 2,
+                start_btn.centery - start_label.get_height() // 2,
+            ),
+        )
+        self.surf.blit(
+            exit_label,
+            (
+                exit_btn.centerx - exit_label.get_width() // 2,
+                exit_btn.centery - exit_label.get_height() // 2,
+            ),
+        )
 
     def loop(self) -> None:
         clock = pygame.time.Clock()
         music.play(music.MAIN_MENU, music.MAIN_MENU_VOLUME)
         hovered_start = hovered_exit = False
+        dirty = DirtyRects()
         while True:
-            clock.tick(FPS)
-            self.surf.blit(self.bg, (0, 0))
-            title = txt("The mythical arena", TITLE_SIZE)
-            self.surf.blit(
-                title,
-                (
-                    settings.SCREEN_W // 2 - title.get_width() // 2,
-                    settings.SCREEN_H // 2 - MENU_TITLE_OFF,
-                ),
-            )
             btn_w, btn_h = BTN_W, BTN_H
             start_btn = pygame.Rect(
                 settings.SCREEN_W // 2 - btn_w // 2,
@@ -71,31 +101,18 @@ class Menu:
                 exit_img = self.btn_hover
             else:
                 hovered_exit = False
-            self.surf.blit(start_img, start_btn)
-            self.surf.blit(exit_img, exit_btn)
-            start_label = txt("START", BTN_LABEL_SIZE)
-            exit_label = txt("EXIT", BTN_LABEL_SIZE)
-            self.surf.blit(
-                start_label,
-                (
-                    start_btn.centerx - start_label.get_width() // 2,
-                    start_btn.centery - start_label.get_height() // 2,
-                ),
-            )
-            self.surf.blit(
-                exit_label,
-                (
-                    exit_btn.centerx - exit_label.get_width() // 2,
-                    exit_btn.centery - exit_label.get_height() // 2,
-                ),
-            )
-            pygame.display.flip()
-            for e in pygame.event.get():
+            dirty.add(("start", hovered_start), start_btn)
+            dirty.add(("exit", hovered_exit), exit_btn)
+            if dirty.begin(self.surf):
+                self._draw(start_btn, exit_btn, start_img, exit_img)
+                dirty.present(self.surf)
+            for e in wait_events(clock):
                 if e.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 if e.type == pygame.MOUSEBUTTONDOWN:
                     if start_btn.collidepoint(e.pos):
                         GameController(self.surf).loop()
                         music.play(music.MAIN_MENU, music.MAIN_MENU_VOLUME)
+                        dirty.invalidate()
                     elif exit_btn.collidepoint(e.pos):
                         pygame.quit(); sys.exit()
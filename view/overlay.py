@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+import pygame
+
+import settings
+from settings import WHITE, YELLOW, txt, blit_glyphs
+
+if TYPE_CHECKING:
+    from controller.game import GameController
+
+PANEL_MARGIN = 20
+PANEL_PAD = 10
+PANEL_ALPHA = 170
+BAR_W = 3
+GRAPH_H = 180
+BUDGET_SHARE = 0.6
+FONT = 20
+LINE_H = 22
+LABEL_W = 160
+VALUE_W = 80
+
+PHASE_COLORS = (
+    (86, 180, 233),
+    (0, 158, 115),
+    (240, 228, 66),
+    (204, 121, 167),
+    (230, 159, 0),
+    (0, 114, 178),
+    (213, 94, 0),
+    (255, 99, 132),
+    (170, 170, 170),
+    (255, 255, 255),
+)
+
+_panels: Dict[Tuple[int, int], pygame.Surface] = {}
+
+
+def _panel(size: Tuple[int, int]) -> pygame.Surface:
+    panel = _panels.get(size)
+    if panel is None:
+        panel = _panels[size] = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, PANEL_ALPHA))
+    return panel
+
+
+def _counts(game: "GameController") -> List[Tuple[str, str]]:
+    counts = [
+        ("enemies", len(game.wave_mgr.enemies)),
+        ("bullets", game.projectiles.count),
+        ("effects", len(game.effects)),
+        ("tree cells", len(game.enemy_tree.cells) + len(game.effect_tree.cells)),
+    ]
+    if game.renderer is not None:
+        counts.extend(game.renderer.cull_counts.items())
+    rows = [(name, str(value)) for name, value in counts]
+    rows.append(("text hits", f"{settings.text_hit_rate():.2f}"))
+    return rows
+
+
+def draw_profiler(surf: pygame.Surface, game: "GameController") -> pygame.Rect:
+    profiler = game.profiler
+    names = profiler.names
+    history = profiler.history()
+    counts = _counts(game)
+    graph_w = profiler.window * BAR_W
+    legend_h = (len(names) + 1) * LINE_H
+    counts_h = len(counts) * LINE_H
+    width = graph_w + PANEL_PAD * 3 + LABEL_W + VALUE_W
+    height = PANEL_PAD * 2 + max(GRAPH_H, legend_h) + PANEL_PAD + counts_h
+    left = surf.get_width() - width - PANEL_MARGIN
+    top = PANEL_MARGIN
+    surf.blit(_panel((width, height)), (left, top))
+
+    budget = 1_000 / settings.FPS
+    scale = GRAPH_H * BUDGET_SHARE / budget
+    gx = left + PANEL_PAD
+    base = top + PANEL_PAD + GRAPH_H
+    fill = surf.fill
+    for i, row in enumerate(history.tolist()):
+        x = gx + i * BAR_W
+        y = base
+        for ms, color in zip(row, PHASE_COLORS):
+            h = int(ms * scale)
+            if h <= 0:
+                continue
+            y -= h
+            if y < base - GRAPH_H:
+                fill(color, (x, base - GRAPH_H, BAR_W, y + h - base + GRAPH_H))
+                break
+            fill(color, (x, y, BAR_W, h))
+    by = base - int(budget * scale)
+    pygame.draw.line(surf, YELLOW, (gx, by), (gx + graph_w - 1, by))
+
+    means = profiler.means()
+    lx = gx + graph_w + PANEL_PAD
+    vx = lx + LABEL_W
+    y = top + PANEL_PAD
+    for name, color in zip(names, PHASE_COLORS):
+        fill(color, (lx, y + 4, FONT // 2, FONT // 2))
+        surf.blit(txt(name, FONT), (lx + FONT, y))
+        blit_glyphs(surf, f"{means[name]:.2f}", (vx, y), FONT)
+        y += LINE_H
+    surf.blit(txt("frame ms", FONT, YELLOW), (lx + FONT, y))
+    blit_glyphs(surf, f"{sum(means.values()):.2f}", (vx, y), FONT, YELLOW)
+
+    y = top + PANEL_PAD * 2 + max(GRAPH_H, legend_h)
+    for name, value in counts:
+        surf.blit(txt(name, FONT), (gx, y))
+        blit_glyphs(surf, value, (gx + LABEL_W, y), FONT, WHITE)
+        y += LINE_H
+    return pygame.Rect(left, top, width, height)
@@ -2,7 +2,7 @@ from __future__ import annotations
 import sys
 import pygame
 import audio
-from settings import FPS
+from .events import wait_events
 from .renderer import Renderer
 
 
@@ -10,9 +10,8 @@ def pause_menu(renderer: Renderer, clock: pygame.time.Clock) -> bool:
     hovered_start = hovered_exit = False
     paused = True
     while paused:
-        clock.tick(FPS)
         start_btn, exit_btn = renderer.draw_pause(hovered_start, hovered_exit)
-        for event in pygame.event.get():
+        for event in wait_events(clock):
             if event.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Sequence
 import pygame
 
 import settings
 from settings import (
     BG_COLOR,
     txt,
+    blit_glyphs,
     TOTAL_WAVES,
     img,
     BTN_W,
@@ -29,21 +31,34 @@ HEART_PATH = (
 )
 BTN_PATH = Path("assets/UI/button")
 PAUSE_BG_PATH = Path("assets/UI/background/Pause_screen.png")
+SPAWN_ORDER = attrgetter("order")
 
 from controller import debug
+from .dirty import DirtyRects
+from .overlay import draw_profiler
 
 if TYPE_CHECKING:
     from controller.game import GameController
+    from model.interfaces import SpatialIndex
 
 
 def _draw_hud(
     surf: pygame.Surface, wave: int, lives: int, heart_img: pygame.Surface
 ) -> None:
-    surf.blit(txt(f"Wave: {wave}/{TOTAL_WAVES}", HUD_FONT), HUD_WAVE_POS)
+    label = txt("Wave: ", HUD_FONT)
+    surf.blit(label, HUD_WAVE_POS)
+    blit_glyphs(
+        surf,
+        f"{wave}/{TOTAL_WAVES}",
+        (HUD_WAVE_POS[0] + label.get_width(), HUD_WAVE_POS[1]),
+        HUD_FONT,
+    )
     surf.blit(heart_img, HUD_HEART_POS)
-    surf.blit(
-        txt(f"x{lives}", HUD_FONT),
+    blit_glyphs(
+        surf,
+        f"x{lives}",
         (HUD_HEART_POS[0] + heart_img.get_width() + HUD_LIVES_DX, HUD_LIVES_Y),
+        HUD_FONT,
     )
 
 
@@ -66,35 +81,67 @@ class Renderer:
         self.pause_bg = pygame.transform.scale(
             pause_bg, (settings.SCREEN_W, settings.SCREEN_H)
         )
+        self.dirty = DirtyRects()
+        self.culling = settings.RENDER_CULLING
+        self.cull_counts: Dict[str, int] = {}
+
+    def _visible(
+        self, items: Sequence, tree: "SpatialIndex", view: pygame.Rect
+    ) -> List:
+        if not self.culling:
+            return list(items)
+        margin = settings.CULL_MARGIN
+        found = tree.query(view.inflate(margin * 2, margin * 2))
+        found.sort(key=SPAWN_ORDER)
+        return found
 
-    def _draw_objects(self, objects: list, cam: tuple[int, int]) -> None:
-        pairs: list[tuple[pygame.Surface, pygame.Rect]] = []
+    def _draw_objects(
+        self,
+        objects: list,
+        cam: tuple[int, int],
+        extra: list[tuple[pygame.Surface, tuple[int, int]]] | None = None,
+    ) -> int:
+        screen = self.surf.get_rect()
+        pairs: list[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]] = []
+        drawn = 0
         for obj in objects:
             image = getattr(obj, "image", None)
             rect_attr = getattr(obj, "rect", None)
             if image is not None and rect_attr is not None:
                 rect = rect_attr() if callable(rect_attr) else rect_attr
                 if isinstance(rect, pygame.Rect):
-                    pairs.append((image, rect.move(-cam[0], -cam[1])))
+                    rect = rect.move(-cam[0], -cam[1])
+                    if self.culling and not screen.colliderect(rect):
+                        continue
+                    pairs.append((image, rect))
                     continue
             obj.draw(self.surf, cam)
+            drawn += 1
+        if extra:
+            pairs.extend(extra)
         if pairs:
-            self.surf.blits(pairs)
+            self.surf.blits(pairs, doreturn=False)
+        return drawn + len(pairs)
 
     def draw_battle(self, game: "GameController") -> None:
         cam = game.cam
+        self.dirty.state("battle")
+        self.dirty.invalidate()
+        self.dirty.begin(self.surf)
         self.surf.fill(BG_COLOR)
         game.map.draw(self.surf, cam, game.door_open)
-        objs = (
-            *game.wave_mgr.enemies,
-            *game.effects,
-            *game.pbul,
-            *game.ebul,
-            game.player,
-        )
+        view = pygame.Rect(cam, self.surf.get_size())
+        enemies = self._visible(game.wave_mgr.enemies, game.enemy_tree, view)
+        effects = self._visible(game.effects, game.effect_tree, view)
+        objs = [*enemies, *effects, game.player]
+        total = len(game.wave_mgr.enemies) + len(game.effects) + 1 + game.projectiles.count
         if debug.SHOW_HITBOXES:
             for obj in objs:
                 debug.draw_hitbox(self.surf, obj, cam)
+            for r in game.projectiles.rects():
+                debug.draw_hitbox(self.surf, r, cam)
+            drawn = len(objs) + game.projectiles.count
+            self.cull_counts = {"drawn": drawn, "culled": total - drawn}
             debug.draw_orbitals(self.surf, game.player, cam)
             for r in game.map.collides:
                 debug.draw_hitbox(self.surf, r, cam)
@@ -102,20 +149,15 @@ class Renderer:
                 for r in game.map.door_collides:
                     debug.draw_hitbox(self.surf, r, cam)
         else:
-            self._draw_objects(list(objs), cam)
+            shots = game.projectiles.blit_pairs(cam, view if self.culling else None)
+            drawn = self._draw_objects(objs, cam, shots)
+            self.cull_counts = {"drawn": drawn, "culled": total - drawn}
         _draw_hud(self.surf, game.wave_mgr.wave, game.player.lives, self.heart)
-        pygame.display.flip()
+        if debug.SHOW_PROFILER:
+            draw_profiler(self.surf, game)
+        self.dirty.present(self.surf)
 
     def draw_pause(self, hovered_start: bool, hovered_exit: bool) -> tuple[pygame.Rect, pygame.Rect]:
-        self.surf.blit(self.pause_bg, (0, 0))
-        text = txt("PAUSED", PAUSE_TITLE_SIZE)
-        self.surf.blit(
-            text,
-            (
-                settings.SCREEN_W // 2 - text.get_width() // 2,
-                settings.SCREEN_H // 2 - text.get_height() // 2 - settings.PAUSE_TEXT_OFF,
-            ),
-        )
         btn_w, btn_h = settings.BTN_W, settings.BTN_H
         start_btn = pygame.Rect(
             settings.SCREEN_W // 2 - btn_w // 2,
@@ -129,6 +171,20 @@ class Renderer:
             btn_w,
             btn_h,
         )
+        self.dirty.state("pause")
+        self.dirty.add(("resume", hovered_start), start_btn)
+        self.dirty.add(("menu", hovered_exit), exit_btn)
+        if not self.dirty.begin(self.surf):
+            return start_btn, exit_btn
+        self.surf.blit(self.pause_bg, (0, 0))
+        text = txt("PAUSED", PAUSE_TITLE_SIZE)
+        self.surf.blit(
+            text,
+            (
+                settings.SCREEN_W // 2 - text.get_width() // 2,
+                settings.SCREEN_H // 2 - text.get_height() // 2 - settings.PAUSE_TEXT_OFF,
+            ),
+        )
         start_img = self.btn_hover if hovered_start else self.btn
         exit_img = self.btn_hover if hovered_exit else self.btn
         self.surf.blit(start_img, start_btn)
@@ -149,6 +205,5 @@ class Renderer:
                 exit_btn.centery - exit_label.get_height() // 2,
             ),
         )
-        pygame.display.flip()
+        self.dirty.present(self.surf)
         return start_btn, exit_btn
-
@@ -9,7 +9,6 @@ from settings import (
     RED,
     ORANGE,
     YELLOW,
-    FPS,
     txt,
     clamp,
     img,
@@ -32,6 +31,8 @@ PROMPT_XOFF = 180
 PROMPT_BASE_DY = 20
 from model.player import Player
 from controller import debug
+from .dirty import DirtyRects
+from .events import wait_events
 
 
 class Rooms:
@@ -44,9 +45,9 @@ class Rooms:
         life_rect = pygame.Rect(cx - REWARD_LIFE_OFF, cy - REWARD_LIFE_OFF, REWARD_SIZE, REWARD_SIZE)
         orb_rect = pygame.Rect(cx + REWARD_ORB_OFF, cy - REWARD_LIFE_OFF, REWARD_SIZE, REWARD_SIZE)
         pl.rect.center = (settings.SCREEN_W // 2, settings.SCREEN_H - PLAYER_SPAWN_OFF)
+        dirty = DirtyRects()
         while True:
-            clock.tick(FPS)
-            for event in pygame.event.get():
+            for event in wait_events(clock, not (dirty.full or pl.animating())):
                 if event.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 if event.type == pygame.KEYDOWN:
@@ -54,6 +55,7 @@ class Rooms:
                         pygame.quit(); sys.exit()
                     if event.key == pygame.K_h:
                         debug.toggle_hitboxes()
+            pl.clock.tick(clock.get_time())
             keys = pygame.key.get_pressed()
             pl.update(keys, world=False)
             pl.rect.x = clamp(pl.rect.x, 0, settings.SCREEN_W - pl.rect.w)
@@ -67,6 +69,11 @@ class Rooms:
             if pl.collision_rect().colliderect(orb_rect):
                 pl.add_orbital()
                 return
+            dirty.state(debug.SHOW_HITBOXES)
+            for rect in pl.draw_rects((0, 0)):
+                dirty.touch(rect)
+            if not dirty.begin(surf):
+                continue
             surf.fill(BG_COLOR)
             if debug.SHOW_HITBOXES:
                 debug.draw_hitbox(surf, pl, (0, 0))
@@ -89,7 +96,7 @@ class Rooms:
                 pygame.draw.circle(surf, ORANGE, orb_rect.center, REWARD_SIZE // 2)
 
             surf.blit(txt("TOUCH A REWARD", REWARD_FONT), (cx - REWARD_TEXT_XOFF, REWARD_TEXT_Y))
-            pygame.display.flip()
+            dirty.present(surf)
 
     @staticmethod
     def victory_screen(surf: pygame.Surface) -> None:
@@ -111,24 +118,25 @@ class Rooms:
         clock = pygame.time.Clock()
         if bg is not None:
             bg = pygame.transform.scale(bg, (settings.SCREEN_W, settings.SCREEN_H))
+        dirty = DirtyRects()
         while True:
-            clock.tick(FPS)
-            surf.fill(BG_COLOR)
-            if bg is not None:
-                surf.blit(bg, (0, 0))
-            surf.blit(
-                txt(title, TITLE_SIZE),
-                (settings.SCREEN_W // 2 - TITLE_XOFF + dx, settings.SCREEN_H // 2 - 60),
-            )
-            surf.blit(
-                txt("Press ENTER to Menu", PROMPT_SIZE),
-                (
-                    settings.SCREEN_W // 2 - PROMPT_XOFF,
-                    settings.SCREEN_H // 2 + PROMPT_BASE_DY + text_dy,
-                ),
-            )
-            pygame.display.flip()
-            for e in pygame.event.get():
+            if dirty.begin(surf):
+                surf.fill(BG_COLOR)
+                if bg is not None:
+                    surf.blit(bg, (0, 0))
+                surf.blit(
+                    txt(title, TITLE_SIZE),
+                    (settings.SCREEN_W // 2 - TITLE_XOFF + dx, settings.SCREEN_H // 2 - 60),
+                )
+                surf.blit(
+                    txt("Press ENTER to Menu", PROMPT_SIZE),
+                    (
+                        settings.SCREEN_W // 2 - PROMPT_XOFF,
+                        settings.SCREEN_H // 2 + PROMPT_BASE_DY + text_dy,
+                    ),
+                )
+                dirty.present(surf)
+            for e in wait_events(clock):
                 if e.type == pygame.QUIT:
                     pygame.quit(); sys.exit()
                 if e.type == pygame.KEYDOWN and e.key == pygame.K_RETURN: